@@ -48,21 +48,22 @@ def main():
     print("  Output: data/raw/fixtures_list.json")
     print()
 
-    # Initialize collector
-    collector = FixtureCollector(
+    # Initialize collector (closes its API session when the block exits)
+    with FixtureCollector(
         team_id=8,  # Liverpool
         output_dir="data/raw",
         rate_limit_seconds=6.0,
         resume=True,  # Skip if fixtures_list.json already exists
-    )
-
-    # Collect fixtures for both seasons
-    print("Starting collection...")
-    print()
-
-    fixtures = collector.collect_fixtures_for_seasons(
-        season_ids=[21646, 23614], search_interval_days=7  # 2023/24, 2024/25  # Check every week
-    )
+        cache_dir=".cache/sportmonks",  # Reuse settled date responses across runs
+    ) as collector:
+        # Collect fixtures for both seasons
+        print("Starting collection...")
+        print()
+
+        fixtures = collector.collect_fixtures_for_seasons(
+            season_ids=[21646, 23614],  # 2023/24, 2024/25
+            search_interval_days=7,  # Check every week
+        )
 
     # Print summary
     print()
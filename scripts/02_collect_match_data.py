@@ -116,19 +116,22 @@ def print_summary(results: dict, collector: MatchDataCollector):
     # Calculate success rates
     total_fixtures = len(results)
     total_includes = total_fixtures * 7
-    successful_includes = sum(sum(includes.values()) for includes in results.values())
+    statuses = [success for includes in results.values() for success in includes.values()]
+    successful_includes = statuses.count(True)
+    skipped_includes = statuses.count(None)
 
     print(f"Fixtures processed: {total_fixtures}")
     print(f"Total includes: {total_includes}")
     print(f"Successful: {successful_includes} ({successful_includes/total_includes*100:.1f}%)")
-    print(f"Failed: {total_includes - successful_includes}")
+    print(f"Skipped (predicted empty): {skipped_includes}")
+    print(f"Failed: {statuses.count(False)}")
     print()
 
     # Show failed includes if any
     failed_includes = []
     for fixture_id, includes in results.items():
         for include_name, success in includes.items():
-            if not success:
+            if success is False:
                 failed_includes.append((fixture_id, include_name))
 
     if failed_includes:
@@ -203,13 +206,12 @@ def main():
     print("=" * 70)
     print()
 
-    # Initialize collector
-    collector = MatchDataCollector(
+    # Initialize collector (closes its API session when the block exits)
+    with MatchDataCollector(
         output_dir="data/raw", rate_limit_seconds=6.0, resume=True  # Skip existing files
-    )
-
-    # Collect all fixtures
-    results = collector.collect_all_fixtures(fixtures)
+    ) as collector:
+        # Collect all fixtures
+        results = collector.collect_all_fixtures(fixtures)
 
     # Create backup
     fixture_ids = [f["fixture_id"] for f in fixtures]
@@ -17,6 +17,7 @@ Usage:
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -60,12 +61,25 @@ def _scan_fixture_directories(data_dir: Path) -> list[int]:
     return sorted(fixture_ids)
 
 
-def process_single_fixture(fixture_id: int):
+def process_single_fixture(
+    fixture_id: int,
+    validator: Optional[DataQualityValidator] = None,
+    ball_processor: Optional[BallCoordinateProcessor] = None,
+    event_processor: Optional[EventProcessor] = None,
+    formation_parser: Optional[FormationParser] = None,
+):
     """
     Process a single fixture through the complete pipeline.
     
+    Processors are created on demand unless passed in; pass them when
+    processing many fixtures so they are built once per run.
+    
     Args:
         fixture_id: Fixture ID to process
+        validator: Data quality validator to reuse
+        ball_processor: Ball coordinate processor to reuse
+        event_processor: Event processor to reuse
+        formation_parser: Formation parser to reuse
     """
     logger.info("=" * 80)
     logger.info(f"PROCESSING FIXTURE {fixture_id}")
@@ -73,7 +87,7 @@ def process_single_fixture(fixture_id: int):
     
     # Step 1: Validate data quality
     logger.info("\n1. Validating data quality...")
-    validator = DataQualityValidator()
+    validator = validator or DataQualityValidator()
     quality_report = validator.validate_fixture(fixture_id)
     
     logger.info(f"   Status: {quality_report['status']}")
@@ -91,7 +105,7 @@ def process_single_fixture(fixture_id: int):
     
     # Step 2: Parse ball coordinates
     logger.info("\n2. Processing ball coordinates...")
-    ball_processor = BallCoordinateProcessor()
+    ball_processor = ball_processor or BallCoordinateProcessor()
     coords_df = ball_processor.parse_coordinates(fixture_id)
     
     logger.info(f"   ✅ Parsed {len(coords_df)} ball coordinates")
@@ -99,7 +113,7 @@ def process_single_fixture(fixture_id: int):
     
     # Step 3: Parse events
     logger.info("\n3. Processing events...")
-    event_processor = EventProcessor()
+    event_processor = event_processor or EventProcessor()
     events_df = event_processor.parse_events(fixture_id)
     
     logger.info(f"   ✅ Parsed {len(events_df)} events")
@@ -124,7 +138,7 @@ def process_single_fixture(fixture_id: int):
     
     # Step 6: Parse formations and lineups
     logger.info("\n6. Processing formations and lineups...")
-    formation_parser = FormationParser()
+    formation_parser = formation_parser or FormationParser()
     lineups_df = formation_parser.parse_lineups(fixture_id)
     formations_df = formation_parser.parse_formations(fixture_id)
     
@@ -163,6 +177,14 @@ def process_all_fixtures():
 
     logger.info(f"Found {len(fixture_ids)} fixtures to process")
     
+    # Build the processors once for the whole run
+    processors = {
+        "validator": DataQualityValidator(),
+        "ball_processor": BallCoordinateProcessor(),
+        "event_processor": EventProcessor(),
+        "formation_parser": FormationParser(),
+    }
+    
     success_count = 0
     fail_count = 0
     
@@ -170,7 +192,7 @@ def process_all_fixtures():
         logger.info(f"\n[{i}/{len(fixture_ids)}] Processing fixture {fixture_id}...")
         
         try:
-            if process_single_fixture(fixture_id):
+            if process_single_fixture(fixture_id, **processors):
                 success_count += 1
             else:
                 fail_count += 1
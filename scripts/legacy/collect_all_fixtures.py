@@ -30,8 +30,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
@@ -43,8 +43,7 @@ import time
 from pathlib import Path
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
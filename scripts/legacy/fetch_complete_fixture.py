@@ -1,11 +1,9 @@
 """Fetch complete fixture data with ball coordinates (requesting each include separately)."""
 
 import json
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
@@ -5,14 +5,16 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
 
 def main():
     """Find the Premier League season ID for 2025-2026."""
+    # Block-buffer stdout and flush once per strategy section instead of
+    # paying a write syscall for every progress line
+    sys.stdout.reconfigure(line_buffering=False)
     client = SportsMonkClient()
 
     print("=" * 80)
@@ -86,6 +88,8 @@ def main():
     except Exception as e:
         print(f"✗ Error querying seasons endpoint: {e}\n")
 
+    sys.stdout.flush()
+
     # Strategy 2: Get Liverpool's most recent fixtures
     print("=" * 80)
     print("STRATEGY 2: Check Liverpool's recent fixtures")
@@ -151,6 +155,8 @@ def main():
     except Exception as e:
         print(f"✗ Error querying fixtures: {e}\n")
 
+    sys.stdout.flush()
+
     # Strategy 3: Try common ID patterns
     print("=" * 80)
     print("STRATEGY 3: Try likely season ID patterns")
@@ -205,6 +211,8 @@ def main():
         except Exception as e:
             print(f"✗ Error")
 
+    sys.stdout.flush()
+
     # Final Results
     print("\n" + "=" * 80)
     print("RESULTS")
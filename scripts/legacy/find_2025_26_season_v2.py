@@ -6,14 +6,16 @@ from pathlib import Path
 from datetime import datetime
 import time
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
 
 def main():
     """Find the Premier League season ID for 2025-2026."""
+    # Block-buffer stdout and flush once per strategy section instead of
+    # paying a write syscall for every progress line
+    sys.stdout.reconfigure(line_buffering=False)
     client = SportsMonkClient()
 
     print("=" * 80)
@@ -82,6 +84,8 @@ def main():
     except Exception as e:
         print(f"✗ Error: {e}\n")
 
+    sys.stdout.flush()
+    
     # Strategy 2: Get a recent Liverpool fixture and check its season
     print("\n" + "=" * 80)
     print("STRATEGY 2: Check recent Liverpool fixture")
@@ -134,6 +138,8 @@ def main():
     except Exception as e:
         print(f"✗ Error: {e}\n")
 
+    sys.stdout.flush()
+    
     # Strategy 3: Check the most recent fixture we have in our data
     print("\n" + "=" * 80)
     print("STRATEGY 3: Check our collected fixtures")
@@ -175,6 +181,8 @@ def main():
     except Exception as e:
         print(f"✗ Error: {e}\n")
 
+    sys.stdout.flush()
+    
     # Strategy 4: Manually test season IDs near the known ones
     print("=" * 80)
     print("STRATEGY 4: Manually test season IDs")
@@ -218,6 +226,8 @@ def main():
             # Silently skip invalid IDs
             pass
 
+    sys.stdout.flush()
+    
     # Final Results
     print("\n" + "=" * 80)
     print("RESULTS")
@@ -1,12 +1,9 @@
 """Script to find Liverpool fixtures and determine season IDs."""
 
 import json
-import sys
-from pathlib import Path
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
@@ -1,11 +1,9 @@
 """Script to find Liverpool fixtures from 2024-2025 seasons (corrected for system date)."""
 
 import json
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
@@ -11,13 +11,17 @@ import json
 import sys
 from pathlib import Path
 from datetime import datetime
-import time
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import numpy as np
+
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
+# Season lists at least this long are matched with a vectorised NumPy mask;
+# below it a plain Python scan is faster than building the arrays
+VECTORISED_MATCH_MIN_SEASONS = 64
+
 
 def parse_season_string(season_str):
     """Parse season string like '2025-26' or '2025/26' to start/end years."""
@@ -39,6 +43,42 @@ def parse_season_string(season_str):
     raise ValueError(f"Invalid season format: {season_str}. Use format like '2025-26' or '2025/26'")
 
 
+def _start_year(season):
+    """Return the starting year of a season record, or 0 if unknown."""
+    starting_at = season.get("starting_at")
+    return int(starting_at[:4]) if starting_at else 0
+
+
+def find_matching_season(seasons, start_year, league_id):
+    """
+    Return the first season record for league_id starting in start_year.
+    
+    Large season lists (e.g. unfiltered multi-league pages) are matched with a
+    single vectorised NumPy comparison; short lists use a plain Python scan.
+    
+    Args:
+        seasons: List of season dicts from the API
+        start_year: Target starting year (e.g., 2025)
+        league_id: League ID to match
+    
+    Returns:
+        Matching season dict or None
+    """
+    if len(seasons) < VECTORISED_MATCH_MIN_SEASONS:
+        for season in seasons:
+            if season.get("league_id") == league_id and _start_year(season) == start_year:
+                return season
+        return None
+    
+    count = len(seasons)
+    years = np.fromiter((_start_year(s) for s in seasons), dtype=np.int32, count=count)
+    leagues = np.fromiter(
+        (s.get("league_id") or 0 for s in seasons), dtype=np.int32, count=count
+    )
+    hits = np.flatnonzero((years == start_year) & (leagues == league_id))
+    return seasons[hits[0]] if hits.size else None
+
+
 def find_season_id(client, season_name=None, start_year=None, end_year=None, 
                    liverpool_id=8, premier_league_id=8):
     """
@@ -68,6 +108,10 @@ def find_season_id(client, season_name=None, start_year=None, end_year=None,
     
     found_season = None
     
+    # Start years of Premier League seasons the API already knows about
+    # (populated by Strategy 1, used to short-circuit Strategy 3)
+    known_years = set()
+    
     # Strategy 1: Search through all Premier League seasons
     print("STRATEGY 1: Query all Premier League seasons")
     print("-" * 80)
@@ -84,32 +128,31 @@ def find_season_id(client, season_name=None, start_year=None, end_year=None,
             pl_seasons = [s for s in seasons if s.get("league_id") == premier_league_id]
             print(f"✓ Found {len(pl_seasons)} Premier League seasons")
             
+            known_years = {
+                int(s["starting_at"][:4]) for s in pl_seasons if s.get("starting_at")
+            }
+            
             # Look for our target season
-            for season in pl_seasons:
-                season_id = season.get("id")
+            season = find_matching_season(seasons, start_year, premier_league_id)
+            
+            if season is not None:
+                season_id = season["id"]
                 name = season.get("name", "")
-                starting_at = season.get("starting_at", "")[:10]
-                ending_at = season.get("ending_at", "")[:10]
+                starting_at = season["starting_at"][:10]
+                ending_at = (season.get("ending_at") or "")[:10]
                 
-                # Check if this matches our target years
-                if starting_at:
-                    start_date_year = int(starting_at[:4])
-                    
-                    # Match if starting year matches our target
-                    if start_date_year == start_year:
-                        print(f"\n  ✓ FOUND! Season ID: {season_id}")
-                        print(f"    Name: {name}")
-                        print(f"    Period: {starting_at} to {ending_at}")
-                        
-                        found_season = {
-                            "season_id": season_id,
-                            "name": name,
-                            "starting_at": starting_at,
-                            "ending_at": ending_at,
-                            "league_id": premier_league_id,
-                            "is_current": season.get("is_current", False)
-                        }
-                        break
+                print(f"\n  ✓ FOUND! Season ID: {season_id}")
+                print(f"    Name: {name}")
+                print(f"    Period: {starting_at} to {ending_at}")
+                
+                found_season = {
+                    "season_id": season_id,
+                    "name": name,
+                    "starting_at": starting_at,
+                    "ending_at": ending_at,
+                    "league_id": premier_league_id,
+                    "is_current": season.get("is_current", False)
+                }
             
             if not found_season:
                 print(f"\n  ✗ Season {start_year}-{end_year} not found")
@@ -123,6 +166,8 @@ def find_season_id(client, season_name=None, start_year=None, end_year=None,
     except Exception as e:
         print(f"  ✗ Error: {e}")
     
+    sys.stdout.flush()
+    
     # Strategy 2: Search Liverpool fixtures in the date range
     if not found_season:
         print("\n" + "=" * 80)
@@ -174,6 +219,19 @@ def find_season_id(client, season_name=None, start_year=None, end_year=None,
         except Exception as e:
             print(f"  ✗ Error: {e}")
     
+    sys.stdout.flush()
+    
+    # Strategy 3 can only succeed for the season right after the newest one
+    # listed by the API: older years were already covered by Strategy 1, and
+    # the ID-pattern estimate is stale for anything further in the future.
+    if not found_season and known_years:
+        max_known = max(known_years)
+        if start_year in known_years:
+            return None
+        if start_year > max_known + 1:
+            print("\n  Season too far in future for ID-pattern extrapolation")
+            return None
+    
     # Strategy 3: Try sequential IDs based on pattern
     if not found_season:
         print("\n" + "=" * 80)
@@ -195,14 +253,16 @@ def find_season_id(client, season_name=None, start_year=None, end_year=None,
             # Try a range around the estimate
             test_range = range(estimated_id - 50, estimated_id + 50)
             
+            # Bind the request method once; the loop issues ~100 calls
+            make_request = client._make_request
+            
             for test_id in test_range:
                 try:
-                    result = client._make_request(f"seasons/{test_id}", {})
+                    season = make_request(f"seasons/{test_id}", {}).get("data")
                     
-                    if result.get("data"):
-                        season = result["data"]
-                        league_id = season.get("league_id")
-                        starting_at = season.get("starting_at", "")[:10]
+                    if season:
+                        league_id = season["league_id"]
+                        starting_at = (season["starting_at"] or "")[:10]
                         
                         if league_id == premier_league_id and starting_at:
                             year = int(starting_at[:4])
@@ -220,17 +280,20 @@ def find_season_id(client, season_name=None, start_year=None, end_year=None,
                                     "league_id": premier_league_id
                                 }
                                 break
-                    
-                    time.sleep(0.1)  # Rate limiting
                 
                 except:
                     continue
     
+    sys.stdout.flush()
+    
     return found_season
 
 
 def main():
     """Main function with argument parsing."""
+    # Block-buffer stdout and flush once per strategy section instead of
+    # paying a write syscall for every progress line
+    sys.stdout.reconfigure(line_buffering=False)
     parser = argparse.ArgumentParser(
         description="Find Premier League season ID for any season",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -299,6 +362,8 @@ Examples:
         parser.error("Must provide either --season or both --start-year and --end-year")
     
     # Initialize client
+    # The client's session already retries 429/5xx responses, honouring
+    # Retry-After
     client = SportsMonkClient()
     
     # Find season
@@ -1,14 +1,18 @@
 """Script to test ball coordinate availability for a Liverpool match."""
 
 import json
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
+# Split the heavy include list so the tracking payload and the small metadata
+# includes are fetched concurrently instead of merged server-side in one call
+COORDS_INCLUDE = "ballCoordinates,events"
+META_INCLUDE = "lineups.detailedPosition,formations,statistics,participants"
+
 
 def main():
     """Test fetching ball coordinates for a Liverpool fixture."""
@@ -50,13 +54,20 @@ def main():
     # Now try with ball coordinates
     print(f"\n2. Fetching fixture {fixture_id} WITH ball coordinates...")
     try:
-        full_fixture = client.get_fixture_details(
-            fixture_id,
-            include="ballCoordinates,events,lineups.detailedPosition,formations,statistics,participants"
-        )
-        
-        if full_fixture.get("data"):
-            fixture = full_fixture["data"]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            coords_future = executor.submit(
+                client.get_fixture_details, fixture_id, include=COORDS_INCLUDE
+            )
+            meta_future = executor.submit(
+                client.get_fixture_details, fixture_id, include=META_INCLUDE
+            )
+            coords_fixture = coords_future.result()
+            meta_fixture = meta_future.result()
+
+        if coords_fixture.get("data") or meta_fixture.get("data"):
+            fixture = {}
+            fixture.update(coords_fixture.get("data") or {})
+            fixture.update(meta_fixture.get("data") or {})
             print(f"   ✓ Full fixture data retrieved")
             
             # Check what's included
@@ -96,12 +107,17 @@ def main():
                         print(f"     {i+1}. Type: {event.get('type', {}).get('name', 'N/A')}, "
                               f"Minute: {event.get('minute')}, Player: {event.get('player', {}).get('display_name', 'N/A')}")
             
-            # Save full data
-            output_file = output_dir / f"fixture_{fixture_id}_full.json"
-            with open(output_file, "w") as f:
-                json.dump(full_fixture, f, indent=2)
-            
-            print(f"\n   ✓ Full data saved to: {output_file}")
+            # Save each slice separately so consumers only parse what they need
+            coords_file = output_dir / f"fixture_{fixture_id}_coords.json"
+            with open(coords_file, "w") as f:
+                json.dump(coords_fixture, f, indent=2)
+
+            meta_file = output_dir / f"fixture_{fixture_id}_meta.json"
+            with open(meta_file, "w") as f:
+                json.dump(meta_fixture, f, indent=2)
+
+            print(f"\n   ✓ Coordinates/events saved to: {coords_file}")
+            print(f"   ✓ Metadata includes saved to: {meta_file}")
             
             # Update metadata with findings
             metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
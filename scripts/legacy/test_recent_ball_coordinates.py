@@ -1,17 +1,95 @@
-"""Test ball coordinate availability for recent Liverpool fixtures."""
+"""Test ball coordinate availability for recent Liverpool fixtures.
 
-import json
+The sample fixtures of each season are fetched in one fixtures/multi call.
+Fixture payloads are stored as zstd-compressed MessagePack
+(fixture_{id}_detailed.msgpack.zst, read back with load_fixture); pass
+--legacy-json to keep indented JSON instead. Without msgpack installed
+the payloads are saved as JSON.
+
+Requires:
+    pip install numpy
+    pip install zstandard msgpack  # for .msgpack.zst payloads (not --legacy-json)
+"""
+
+import argparse
 import sys
+from collections import Counter
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import numpy as np
+import orjson
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
 
-def test_fixture(client, fixture_id, fixture_name, output_dir):
+FIXTURE_INCLUDES = "ballCoordinates,events,lineups,formations,statistics,participants"
+
+# Shared default for events without a type; never mutated
+_EMPTY_DICT = {}
+
+
+def summarize_ball_coords(coords, sample_size=5):
+    """
+    Count points, distinct minutes and keep the first few samples.
+    
+    The coordinate dicts are unpacked once into per-field columns
+    (x, y, minute, second); coverage is a vectorised unique over the
+    minute column and samples are (x, y, minute, second) tuples.
+    """
+    if not coords:
+        return 0, 0, []
+    
+    xs, ys, minutes, seconds = zip(
+        *((c.get("x"), c.get("y"), c.get("minute"), c.get("second")) for c in coords)
+    )
+    
+    # Missing minutes become NaN and drop out of the > 0 mask
+    minutes_arr = np.array(minutes, dtype=np.float64)
+    minutes_covered = int(np.unique(minutes_arr[minutes_arr > 0]).size)
+    
+    samples = list(
+        zip(xs[:sample_size], ys[:sample_size], minutes[:sample_size], seconds[:sample_size])
+    )
+    return len(xs), minutes_covered, samples
+
+
+def count_event_types(events):
+    """Tally events by type name."""
+    return Counter((event.get("type") or _EMPTY_DICT).get("name", "Unknown") for event in events)
+
+
+def save_fixture(result, path):
+    """Write a fixture payload as zstd-compressed MessagePack."""
+    if zstd is None:
+        raise ImportError("zstandard is required to write .msgpack.zst payloads")
+    blob = msgpack.packb(result, use_bin_type=True)
+    path.write_bytes(zstd.ZstdCompressor(level=3).compress(blob))
+    return path
+
+
+def load_fixture(path):
+    """Load a fixture payload written by save_fixture (requires zstandard and msgpack)."""
+    if zstd is None or msgpack is None:
+        raise ImportError("zstandard and msgpack are required to read .msgpack.zst payloads")
+    blob = zstd.ZstdDecompressor().decompress(Path(path).read_bytes())
+    return msgpack.unpackb(blob, raw=False)
+
+
+def test_fixture(fixture, fixture_name, output_dir, legacy_json=False):
     """Test a single fixture for ball coordinate availability."""
+    fixture_id = fixture["id"]
     
     print(f"\n{'='*70}")
     print(f"Testing: {fixture_name}")
@@ -19,18 +97,6 @@ def test_fixture(client, fixture_id, fixture_name, output_dir):
     print(f"{'='*70}")
     
     try:
-        # Fetch with all includes
-        result = client.get_fixture_details(
-            fixture_id,
-            include="ballCoordinates,events,lineups,formations,statistics,participants"
-        )
-        
-        if not result.get("data"):
-            print("   ✗ No data returned")
-            return False
-        
-        fixture = result["data"]
-        
         # Check what data is available
         print("\n📊 Data availability:")
         
@@ -48,20 +114,20 @@ def test_fixture(client, fixture_id, fixture_name, output_dir):
         
         # Detailed analysis of ball coordinates
         if has_ball_coords:
-            ball_coords = fixture["ballcoordinates"]
-            coord_count = len(ball_coords)
+            coord_count, minutes_covered, samples = summarize_ball_coords(
+                fixture["ballcoordinates"]
+            )
             
             print(f"\n⚽ BALL COORDINATES DETAILS:")
             print(f"   Total points: {coord_count}")
             
             if coord_count > 0:
                 print(f"\n   Sample data (first 5 points):")
-                for i, coord in enumerate(ball_coords[:5]):
-                    print(f"   {i+1}. X={coord.get('x'):.3f}, Y={coord.get('y'):.3f}, "
-                          f"Min={coord.get('minute')}, Sec={coord.get('second')}")
+                for i, (x, y, minute, second) in enumerate(samples):
+                    print(f"   {i+1}. X={x:.3f}, Y={y:.3f}, "
+                          f"Min={minute}, Sec={second}")
                 
                 # Calculate coverage
-                minutes_covered = len(set(c.get('minute') for c in ball_coords if c.get('minute')))
                 print(f"\n   Coverage: {minutes_covered} minutes")
                 print(f"   Density: ~{coord_count/90:.1f} points per minute")
         
@@ -70,14 +136,10 @@ def test_fixture(client, fixture_id, fixture_name, output_dir):
             events = fixture["events"]
             print(f"\n⚽ EVENTS: {len(events)} total")
             
-            # Count event types
-            event_types = {}
-            for event in events:
-                event_type = event.get("type", {}).get("name", "Unknown")
-                event_types[event_type] = event_types.get(event_type, 0) + 1
+            event_types = count_event_types(events)
             
             print(f"   Event type breakdown:")
-            for event_type, count in sorted(event_types.items(), key=lambda x: x[1], reverse=True)[:10]:
+            for event_type, count in event_types.most_common(10):
                 print(f"     - {event_type}: {count}")
         
         # Lineups analysis
@@ -93,9 +155,15 @@ def test_fixture(client, fixture_id, fixture_name, output_dir):
                 print(f"   {team_name}: {formation} formation, {len(players)} players")
         
         # Save detailed data
-        output_file = output_dir / f"fixture_{fixture_id}_detailed.json"
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
+        result = {"data": fixture}
+        if legacy_json:
+            output_file = output_dir / f"fixture_{fixture_id}_detailed.json"
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            output_file = save_fixture(
+                result, output_dir / f"fixture_{fixture_id}_detailed.msgpack.zst"
+            )
         
         print(f"\n💾 Saved to: {output_file.name}")
         
@@ -106,10 +174,29 @@ def test_fixture(client, fixture_id, fixture_name, output_dir):
         import traceback
         traceback.print_exc()
         return False
+    
+    finally:
+        # One write per fixture report rather than one per line
+        sys.stdout.flush()
 
 
 def main():
     """Test ball coordinate availability for recent Liverpool fixtures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--legacy-json",
+        action="store_true",
+        help="Keep fixture payloads as raw JSON instead of .msgpack.zst",
+    )
+    args = parser.parse_args()
+    legacy_json = args.legacy_json or msgpack is None
+    if not args.legacy_json and msgpack is None:
+        print("msgpack not installed, saving fixture payloads as JSON")
+    if not legacy_json and zstd is None:
+        parser.error("zstandard is required for .msgpack.zst payloads (or pass --legacy-json)")
+    
+    # Block-buffer stdout; test_fixture flushes once per fixture
+    sys.stdout.reconfigure(line_buffering=False)
     client = SportsMonkClient()
     
     print("=" * 80)
@@ -118,8 +205,8 @@ def main():
     
     # Load fixtures from metadata
     metadata_file = Path(__file__).parent.parent / "data" / "metadata.json"
-    with open(metadata_file, "r") as f:
-        metadata = json.load(f)
+    with open(metadata_file, "rb") as f:
+        metadata = orjson.loads(f.read())
     
     # Setup output directory
     output_dir = Path(__file__).parent.parent / "data" / "raw" / "test_fixtures"
@@ -135,12 +222,29 @@ def main():
         
         season_results = []
         
-        # Test up to 2 fixtures per season
-        for fixture in fixtures[:2]:
+        # Test up to 2 fixtures per season, fetched in a single batch request
+        sample_fixtures = fixtures[:2]
+        fixture_ids = [fixture["fixture_id"] for fixture in sample_fixtures]
+        
+        try:
+            response = client.get_fixtures_multi(fixture_ids, include=FIXTURE_INCLUDES)
+            fetched = {f["id"]: f for f in response.get("data") or []}
+        except Exception as e:
+            print(f"   ✗ Error: {e}")
+            fetched = {}
+        
+        for fixture in sample_fixtures:
             fixture_id = fixture["fixture_id"]
             fixture_name = fixture["name"]
             
-            has_coords = test_fixture(client, fixture_id, fixture_name, output_dir)
+            if fixture_id in fetched:
+                has_coords = test_fixture(
+                    fetched[fixture_id], fixture_name, output_dir, legacy_json=legacy_json
+                )
+            else:
+                print(f"\n   ✗ No data returned for {fixture_name} (ID: {fixture_id})")
+                has_coords = False
+            
             season_results.append({
                 "fixture_id": fixture_id,
                 "name": fixture_name,
@@ -168,8 +272,8 @@ def main():
     
     # Update metadata
     metadata["ball_coordinate_test_results"] = results
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+    with open(metadata_file, "wb") as f:
+        f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     
     print(f"\n✓ Results saved to metadata")
     print("=" * 80)
@@ -2,9 +2,30 @@
 Verify correct Premier League season IDs and their date ranges.
 """
 
-from football_analytics.api_client import SportsMonkClient
+import asyncio
+
+from football_analytics.api_client import AsyncSportsMonkClient, SportsMonkClient
 from football_analytics.utils import setup_logging
-import json
+
+
+async def _fetch_all_seasons(api_key, league_id):
+    """Collect every page of a league's seasons, prefetching the next page."""
+    async with AsyncSportsMonkClient(api_key) as client:
+        return [season async for season in client.get_seasons_all(league_id=league_id)]
+
+
+def fetch_league_seasons(client, league_id):
+    """
+    Return all seasons of a league across every result page.
+    
+    Falls back to the first page from the synchronous client when aiohttp
+    is not installed.
+    """
+    try:
+        return asyncio.run(_fetch_all_seasons(client.api_key, league_id))
+    except ImportError:
+        return client.get_seasons(league_id=league_id).get("data", [])
+
 
 def main():
     """Check available seasons and their details."""
@@ -17,18 +38,9 @@ def main():
     
     client = SportsMonkClient()
     
-    print("Fetching all seasons...")
-    seasons_response = client.get_seasons()
-    
-    all_seasons = seasons_response.get("data", [])
-    print(f"Found {len(all_seasons)} total seasons")
-    print()
-    
-    # Filter for Premier League (league_id = 8)
-    premier_league_seasons = [
-        s for s in all_seasons 
-        if s.get("league_id") == 8
-    ]
+    print("Fetching Premier League seasons...")
+    # Filter server-side (league_id = 8) instead of scanning every season
+    premier_league_seasons = fetch_league_seasons(client, league_id=8)
     
     print(f"Premier League seasons found: {len(premier_league_seasons)}")
     print()
@@ -0,0 +1,14 @@
+"""Put the repository's src/ directory on sys.path for the scripts in this folder.
+
+Import it before any football_analytics import:
+
+    import _bootstrap  # noqa: F401
+"""
+
+import sys
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parents[2] / "src")
+
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
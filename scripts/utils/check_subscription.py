@@ -1,19 +1,79 @@
 """Simple test to check what data is actually available with our API subscription."""
 
-import json
+import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import orjson
 
-from football_analytics.api_client import SportsMonkClient
+import _bootstrap  # noqa: F401
+
+from football_analytics.api_client import AsyncSportsMonkClient, SportsMonkClient
+
+
+async def _probe_includes_async(api_key, fixture_id, includes, http2):
+    """Request every include concurrently on one async session."""
+    async with AsyncSportsMonkClient(
+        api_key, max_concurrency=len(includes), http2=http2
+    ) as async_client:
+        return await async_client.gather_requests(
+            [(f"fixtures/{fixture_id}", {"include": include}) for include in includes]
+        )
+
+
+def probe_includes(client, fixture_id, includes, max_workers=8):
+    """
+    Fetch a fixture once per include.
+    
+    Prefers the async client over HTTP/2 (all probes multiplexed on one
+    connection, needs httpx[http2]), then over aiohttp, and otherwise runs the
+    requests on a thread pool with the synchronous client (requests releases
+    the GIL while waiting on the socket). Keep max_workers within the API's
+    concurrent-request limit.
+    
+    Returns:
+        List of responses (or the exception raised) in the order of includes
+    """
+    for http2 in (True, False):
+        try:
+            return asyncio.run(_probe_includes_async(client.api_key, fixture_id, includes, http2))
+        except ImportError:
+            continue
+    
+    results = [None] * len(includes)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                client._make_request,
+                f"fixtures/{fixture_id}",
+                {"include": include},
+                use_cache=False,
+            ): idx
+            for idx, include in enumerate(includes)
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+    return results
 
 
 def main():
     """Check what data is available for a Liverpool fixture."""
+    # Block-buffer stdout and flush once per test section instead of per line
+    sys.stdout.reconfigure(line_buffering=False)
     client = SportsMonkClient()
     
+    @lru_cache(maxsize=128)
+    def fetch(fid: int, inc: tuple[str, ...] = ()):
+        """Fetch a fixture once per (id, includes) for the rest of this run."""
+        params = {"include": ",".join(inc)} if inc else None
+        # Always hit the API: this checks what the live subscription returns
+        return client._make_request(f"fixtures/{fid}", params, use_cache=False)
+    
     print("=" * 80)
     print("API SUBSCRIPTION & DATA AVAILABILITY TEST")
     print("=" * 80)
@@ -27,7 +87,7 @@ def main():
     # Test 1: Basic fixture data (no includes)
     print("\n1. Testing basic fixture data (no includes)...")
     try:
-        result = client._make_request(f"fixtures/{fixture_id}")
+        result = fetch(fixture_id, ())
         print("   ✓ Success!")
         
         if result.get("data"):
@@ -40,8 +100,8 @@ def main():
             output_dir = Path(__file__).parent.parent / "data" / "raw"
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(output_dir / f"fixture_{fixture_id}_basic.json", "w") as f:
-                json.dump(result, f, indent=2)
+            with open(output_dir / f"fixture_{fixture_id}_basic.json", "wb") as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
             
             print(f"\n   ✓ Saved to: fixture_{fixture_id}_basic.json")
     
@@ -49,6 +109,8 @@ def main():
         print(f"   ✗ Error: {e}")
         return
     
+    sys.stdout.flush()
+    
     # Test 2: Try each include separately
     print("\n2. Testing individual includes...")
     
@@ -65,37 +127,36 @@ def main():
     
     working_includes = []
     
-    for include in includes_to_test:
-        try:
-            result = client._make_request(
-                f"fixtures/{fixture_id}",
-                {"include": include}
-            )
-            
-            if result.get("data"):
-                fixture = result["data"]
-                
-                # Check if the include is actually in the response
-                include_lower = include.lower()
-                has_data = include_lower in fixture
-                
-                if has_data:
-                    data = fixture[include_lower]
-                    data_size = len(data) if isinstance(data, (list, dict)) else "N/A"
-                    print(f"   ✓ {include}: Available ({data_size} items)")
-                    working_includes.append(include)
-                else:
-                    print(f"   ⚠ {include}: Requested but not in response")
-        
-        except Exception as e:
-            error_msg = str(e)[:80]
+    results = probe_includes(client, fixture_id, includes_to_test)
+    
+    for include, result in zip(includes_to_test, results):
+        if isinstance(result, Exception):
+            error_msg = str(result)[:80]
             print(f"   ✗ {include}: {error_msg}")
+            continue
+        
+        if result.get("data"):
+            fixture = result["data"]
+            
+            # Check if the include is actually in the response
+            include_lower = include.lower()
+            has_data = include_lower in fixture
+            
+            if has_data:
+                data = fixture[include_lower]
+                data_size = len(data) if isinstance(data, (list, dict)) else "N/A"
+                print(f"   ✓ {include}: Available ({data_size} items)")
+                working_includes.append(include)
+            else:
+                print(f"   ⚠ {include}: Requested but not in response")
+    
+    sys.stdout.flush()
     
     # Test 3: Check subscription details
     print("\n3. Checking API subscription details...")
     try:
-        # The subscription info is usually in the response
-        result = client._make_request(f"fixtures/{fixture_id}")
+        # The subscription info is in the basic response already fetched in Test 1
+        result = fetch(fixture_id, ())
         
         if "subscription" in result:
             subscription = result["subscription"][0]
@@ -122,6 +183,8 @@ def main():
     except Exception as e:
         print(f"   ✗ Error: {e}")
     
+    sys.stdout.flush()
+    
     # Summary
     print(f"\n{'='*80}")
     print("SUMMARY")
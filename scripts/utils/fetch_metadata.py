@@ -1,11 +1,10 @@
 """Script to fetch Liverpool team ID and season IDs for 2023/24 and 2024/25."""
 
-import json
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import orjson
+
+import _bootstrap  # noqa: F401
 
 from football_analytics.api_client import SportsMonkClient
 
@@ -85,8 +84,8 @@ def main():
     output_file = Path(__file__).parent.parent / "data" / "metadata.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     
     print(f"   ✓ Metadata saved to: {output_file}")
 
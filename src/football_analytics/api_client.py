@@ -1,26 +1,101 @@
 """SportsMonk API client for fetching football data."""
 
+import asyncio
+import contextlib
+import functools
+import hashlib
 import os
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any, Optional
+from urllib.parse import urlencode
 
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
 
+def _memoize(method):
+    """
+    Cache a read-only client method's result in process.
+
+    Results are keyed on the call arguments and shared between callers, so
+    they must be treated as read-only. The client keeps at most MEMO_MAXSIZE
+    results, evicting the least recently used, and re-fetches a result once
+    it is older than MEMO_TTL seconds. This sits in front of the optional
+    on-disk response cache and skips even the file read on repeat calls.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        entry = self._memo.get(key)
+        if entry is not None and now - entry[0] < self.MEMO_TTL:
+            self._memo.move_to_end(key)
+            return entry[1]
+
+        result = method(self, *args, **kwargs)
+        self._memo[key] = (now, result)
+        self._memo.move_to_end(key)
+        if len(self._memo) > self.MEMO_MAXSIZE:
+            self._memo.popitem(last=False)
+        return result
+
+    return wrapper
+
+
 class SportsMonkClient:
-    """Client for interacting with the SportsMonk API."""
+    """
+    Client for interacting with the SportsMonk API.
+
+    Requests share one pooled keep-alive session. Responses are compressed
+    with gzip, or brotli when the brotli package is installed (urllib3 then
+    adds ``br`` to the default Accept-Encoding). Call ``close()`` or use
+    the client as a context manager to release pooled connections.
+
+    Responses are cached on disk only when ``cache_dir`` is given.
+
+    Example:
+        >>> with SportsMonkClient() as client:
+        ...     leagues = client.get_leagues()
+    """
 
     BASE_URL = "https://api.sportmonks.com/v3/football"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # (connect, read) timeout in seconds applied to every request
+    DEFAULT_TIMEOUT = (3.05, 30)
+
+    # Seconds a cached response stays fresh
+    DEFAULT_CACHE_TTL = 86400
+
+    # In-process memo of read-only lookups (see _memoize): entries kept and
+    # seconds before an entry is re-fetched
+    MEMO_MAXSIZE = 256
+    MEMO_TTL = 3600
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ):
         """
         Initialize the SportsMonk API client.
 
         Args:
             api_key: API key for authentication. If not provided, will look for
                     SPORTSMONK_API_KEY environment variable.
+            cache_dir: Directory for cached responses. If not provided, responses
+                    are not cached.
+            cache_ttl: Seconds before a cached response is re-fetched
         """
         self.api_key = api_key or os.getenv("SPORTSMONK_API_KEY")
         if not self.api_key:
@@ -28,17 +103,106 @@ class SportsMonkClient:
                 "API key must be provided or set as SPORTSMONK_API_KEY environment variable"
             )
         self.session = requests.Session()
-        self.session.headers.update({"Authorization": self.api_key})
+        self.session.headers.update({"Authorization": self.api_key, "Connection": "keep-alive"})
+
+        # Keep a pool of warm connections to the API host (avoids a TLS handshake
+        # per request and head-of-line blocking under concurrent use) and retry
+        # rate-limited/transient failures, honouring Retry-After
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Optional on-disk response cache so repeated runs skip rate-limited
+        # round-trips
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._cache_ttl = cache_ttl
+
+        # In-process results of read-only lookups (see _memoize)
+        self._memo: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    def __enter__(self) -> "SportsMonkClient":
+        """Return the client for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the session when leaving the with block."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+
+    def _cache_path(self, endpoint: str, params: Optional[dict[str, Any]]) -> Optional[Path]:
+        """Return the cache file for a request, or None if caching is disabled."""
+        if self._cache_dir is None:
+            return None
+        query = urlencode(sorted((params or {}).items()))
+        key = hashlib.sha1(f"{endpoint}?{query}".encode()).hexdigest()
+        return self._cache_dir / f"{key}.json"
+
+    def _read_cache_bytes(
+        self, path: Optional[Path], ttl: Optional[float] = None
+    ) -> Optional[bytes]:
+        """Return the cached body at path if it is younger than ttl (default: cache_ttl)."""
+        if path is None:
+            return None
+        ttl = self._cache_ttl if ttl is None else ttl
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return path.read_bytes()
+        except OSError:
+            pass
+        return None
+
+    def _read_cache(
+        self, path: Optional[Path], ttl: Optional[float] = None
+    ) -> Optional[dict[str, Any]]:
+        """Return the decoded cached response at path if it is younger than ttl."""
+        content = self._read_cache_bytes(path, ttl)
+        if content is None:
+            return None
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return None
+
+    def _write_cache(self, path: Optional[Path], content: bytes) -> None:
+        """Atomically write a response body to the cache (no-op if caching is disabled)."""
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
 
     def _make_request(
-        self, endpoint: str, params: Optional[dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[tuple[float, float]] = DEFAULT_TIMEOUT,
+        use_cache: bool = True,
+        cache_ttl: Optional[float] = None,
     ) -> dict[str, Any]:
         """
         Make a request to the SportsMonk API.
 
+        If the client has a cache_dir, successful responses are cached on
+        disk and a fresh cached copy is returned without contacting the API.
+
         Args:
             endpoint: API endpoint to call
             params: Query parameters for the request
+            timeout: (connect, read) timeout in seconds, or None to wait indefinitely
+            use_cache: If False, hit the API and leave the cache untouched
+            cache_ttl: Maximum age in seconds of a usable cached copy for this
+                    request (default: the client's cache_ttl)
 
         Returns:
             JSON response from the API
@@ -46,10 +210,72 @@ class SportsMonkClient:
         Raises:
             requests.HTTPError: If the request fails
         """
+        cache_path = self._cache_path(endpoint, params) if use_cache else None
+        cached = self._read_cache(cache_path, cache_ttl)
+        if cached is not None:
+            return cached
+
+        content, _ = self._fetch(endpoint, params, timeout, cache_path)
+        return orjson.loads(content)
+
+    def _fetch(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]],
+        timeout: Optional[tuple[float, float]],
+        cache_path: Optional[Path] = None,
+    ) -> tuple[bytes, str]:
+        """Request an endpoint, returning (body, content type); caches it at cache_path if given."""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = self.session.get(url, params=params)
+        response = self.session.get(url, params=params, timeout=timeout)
         response.raise_for_status()
-        return response.json()
+
+        try:
+            self._write_cache(cache_path, response.content)
+        except OSError:
+            pass
+
+        return response.content, response.headers.get("Content-Type", "application/json")
+
+    def get_cached_response(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Look up a cached response without contacting the API.
+
+        Always returns None when the client has no cache_dir.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters of the request
+            cache_ttl: Maximum age in seconds (default: the client's cache_ttl;
+                    ``float("inf")`` accepts any cached copy)
+
+        Returns:
+            The cached response, or None if there is no fresh copy
+        """
+        return self._read_cache(self._cache_path(endpoint, params), cache_ttl)
+
+    def cache_response(
+        self, endpoint: str, params: Optional[dict[str, Any]], data: dict[str, Any]
+    ) -> None:
+        """
+        Store a response fetched elsewhere (e.g. by AsyncSportsMonkClient) in the cache.
+
+        Does nothing when the client has no cache_dir.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters of the request
+            data: Decoded response to cache
+        """
+        try:
+            self._write_cache(self._cache_path(endpoint, params), orjson.dumps(data))
+        except OSError:
+            pass
 
     def get_leagues(self) -> dict[str, Any]:
         """Fetch all available football leagues."""
@@ -79,6 +305,7 @@ class SportsMonkClient:
         """
         return self._make_request(f"fixtures/season/{league_id}")
 
+    @_memoize
     def search_team(self, team_name: str) -> dict[str, Any]:
         """
         Search for a team by name.
@@ -91,6 +318,7 @@ class SportsMonkClient:
         """
         return self._make_request(f"teams/search/{team_name}")
 
+    @_memoize
     def get_team_by_id(self, team_id: int) -> dict[str, Any]:
         """
         Get detailed team information by ID.
@@ -103,14 +331,26 @@ class SportsMonkClient:
         """
         return self._make_request(f"teams/{team_id}")
 
-    def get_seasons(self) -> dict[str, Any]:
+    @_memoize
+    def get_seasons(self, league_id: Optional[int] = None, per_page: int = 50) -> dict[str, Any]:
         """
-        Fetch all available seasons.
+        Fetch available seasons, optionally only those of one league.
+
+        Filtering by league happens server-side, so the response carries only
+        the requested league's seasons instead of every season in the API.
+
+        Args:
+            league_id: ID of the league to filter by (all leagues if None)
+            per_page: Number of seasons per page
 
         Returns:
             Seasons data
         """
-        return self._make_request("seasons")
+        params: dict[str, Any] = {"per_page": per_page}
+        if league_id is not None:
+            params["filters"] = f"seasonLeagues:{league_id}"
+
+        return self._make_request("seasons", params)
 
     def get_team_fixtures(
         self, team_id: int, season_id: int, include: Optional[str] = None
@@ -150,6 +390,63 @@ class SportsMonkClient:
 
         return self._make_request(f"fixtures/{fixture_id}", params)
 
+    def get_fixture_details_raw(
+        self, fixture_id: int, include: Optional[str] = None, use_cache: bool = True
+    ) -> tuple[bytes, str]:
+        """
+        Get detailed fixture information as the undecoded response body.
+
+        For callers that only archive the payload: the body can be written
+        to disk as-is, skipping a JSON decode and re-encode. Shares the
+        cache with get_fixture_details.
+
+        Args:
+            fixture_id: ID of the fixture
+            include: Comma-separated list of includes
+            use_cache: If False, hit the API and leave the cache untouched
+                    (for archiving, where the payload is stored elsewhere)
+
+        Returns:
+            Tuple of (JSON body bytes, content type)
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        params = {}
+        if include:
+            params["include"] = include
+
+        endpoint = f"fixtures/{fixture_id}"
+        cache_path = self._cache_path(endpoint, params) if use_cache else None
+        cached = self._read_cache_bytes(cache_path)
+        if cached is not None:
+            return cached, "application/json"
+
+        return self._fetch(endpoint, params, self.DEFAULT_TIMEOUT, cache_path)
+
+    def get_fixtures_multi(
+        self, fixture_ids: list[int], include: Optional[str] = None
+    ) -> dict[str, Any]:
+        """
+        Get several fixtures in a single request.
+
+        The API returns up to 50 fixtures per call, so batching replaces one
+        (rate-limited) request per fixture.
+
+        Args:
+            fixture_ids: IDs of the fixtures (at most 50)
+            include: Comma-separated list of includes
+
+        Returns:
+            Fixtures data, with one entry per fixture under "data"
+        """
+        params = {}
+        if include:
+            params["include"] = include
+
+        ids = ",".join(str(fixture_id) for fixture_id in fixture_ids)
+        return self._make_request(f"fixtures/multi/{ids}", params)
+
     def get_player_stats(self, player_id: int, season_id: int) -> dict[str, Any]:
         """
         Get player statistics for a specific season.
@@ -165,6 +462,7 @@ class SportsMonkClient:
             f"players/{player_id}", {"include": f"statistics.season:{season_id}"}
         )
 
+    @_memoize
     def get_statistic_types(self) -> dict[str, Any]:
         """
         Get all available statistic type definitions.
@@ -173,3 +471,215 @@ class SportsMonkClient:
             Statistic types data
         """
         return self._make_request("types")
+
+
+class AsyncSportsMonkClient:
+    """
+    Asynchronous client for issuing many SportsMonk requests concurrently.
+
+    Network round-trips dominate the cost of include probes and multi-fixture
+    sweeps, so this client runs them in parallel on one aiohttp session with
+    the number of in-flight requests bounded by a semaphore. The synchronous
+    SportsMonkClient remains the client used by the collectors.
+
+    With ``http2=True`` the session is an httpx HTTP/2 client instead, which
+    multiplexes all concurrent requests over a single connection to the API
+    host rather than opening one connection per in-flight request.
+
+    Pass a ``TokenBucketRateLimiter`` as ``rate_limiter`` to keep concurrent
+    requests within the API's per-minute quota while still letting them
+    burst up to it.
+
+    Requires aiohttp (``pip install aiohttp``), or ``pip install httpx[http2]``
+    for HTTP/2.
+
+    Example:
+        >>> async with AsyncSportsMonkClient(max_concurrency=8) as client:
+        ...     results = await client.gather_requests(
+        ...         [("fixtures/19134454", {"include": inc}) for inc in ("events", "scores")]
+        ...     )
+    """
+
+    BASE_URL = SportsMonkClient.BASE_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 8,
+        http2: bool = False,
+        rate_limiter: Optional[Any] = None,
+    ):
+        """
+        Initialize the asynchronous SportsMonk API client.
+
+        Args:
+            api_key: API key for authentication. If not provided, will look for
+                    SPORTSMONK_API_KEY environment variable.
+            max_concurrency: Maximum number of requests in flight at once
+            http2: Use an httpx HTTP/2 session instead of aiohttp
+            rate_limiter: Optional limiter with an async ``wait_async()`` method
+                    (e.g. TokenBucketRateLimiter) awaited before each request
+        """
+        self.api_key = api_key or os.getenv("SPORTSMONK_API_KEY")
+        if not self.api_key:
+            raise ValueError(
+                "API key must be provided or set as SPORTSMONK_API_KEY environment variable"
+            )
+        self.max_concurrency = max_concurrency
+        self.http2 = http2
+        self.rate_limiter = rate_limiter
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncSportsMonkClient":
+        """Open the underlying HTTP session."""
+        if self.http2:
+            import httpx
+
+            self._session = httpx.AsyncClient(
+                http2=True,
+                headers={"Authorization": self.api_key},
+                timeout=httpx.Timeout(10.0, connect=3.0),
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            )
+            return self
+
+        import aiohttp
+
+        self._session = aiohttp.ClientSession(
+            headers={"Authorization": self.api_key},
+            connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the underlying HTTP session."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session if it is open."""
+        if self._session is not None:
+            if self.http2:
+                await self._session.aclose()
+            else:
+                await self._session.close()
+            self._session = None
+
+    async def _make_request(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None, raw: bool = False
+    ) -> Any:
+        """
+        Make a request to the SportsMonk API.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters for the request
+            raw: Return the undecoded response body (bytes), as
+                SportsMonkClient.get_fixture_details_raw does
+
+        Returns:
+            JSON response from the API, or its body bytes if raw
+
+        Raises:
+            aiohttp.ClientResponseError: If the request fails
+            httpx.HTTPStatusError: If the request fails on an HTTP/2 session
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncSportsMonkClient must be used as an async context manager")
+
+        url = f"{self.BASE_URL}/{endpoint}"
+        if self.rate_limiter is not None:
+            await self.rate_limiter.wait_async()
+
+        async with self._semaphore:
+            if self.http2:
+                response = await self._session.get(url, params=params)
+                response.raise_for_status()
+                return response.content if raw else orjson.loads(response.content)
+
+            async with self._session.get(url, params=params) as response:
+                response.raise_for_status()
+                if raw:
+                    return await response.read()
+                return await response.json(loads=orjson.loads)
+
+    async def gather_requests(
+        self, requests_to_make: list[tuple[str, Optional[dict[str, Any]]]], raw: bool = False
+    ) -> list[Any]:
+        """
+        Run several requests concurrently.
+
+        Args:
+            requests_to_make: List of (endpoint, params) tuples
+            raw: Return undecoded response bodies (see _make_request)
+
+        Returns:
+            Responses in the same order as the input. A failed request yields
+            its exception in place of the response instead of cancelling the
+            rest of the batch.
+        """
+        return await asyncio.gather(
+            *(self._make_request(endpoint, params, raw) for endpoint, params in requests_to_make),
+            return_exceptions=True,
+        )
+
+    async def _paginate(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over every row of a paginated endpoint.
+
+        The request for page N+1 is started before the rows of page N are
+        yielded, so network time overlaps with the caller's processing. If
+        the caller stops early, that request is cancelled.
+
+        Args:
+            endpoint: API endpoint to call
+            params: Query parameters for the request (``page`` is managed here)
+
+        Yields:
+            Individual rows from each page's "data" list
+        """
+        params = dict(params or {})
+        page = 1
+        next_page = asyncio.create_task(self._make_request(endpoint, {**params, "page": page}))
+
+        try:
+            while next_page is not None:
+                result = await next_page
+                page += 1
+
+                has_more = (result.get("pagination") or {}).get("has_more", False)
+                next_page = (
+                    asyncio.create_task(self._make_request(endpoint, {**params, "page": page}))
+                    if has_more
+                    else None
+                )
+
+                for row in result.get("data") or []:
+                    yield row
+        finally:
+            # Don't leave a prefetched page running (or its failure unretrieved)
+            if next_page is not None:
+                next_page.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_page
+
+    def get_seasons_all(
+        self, league_id: Optional[int] = None, per_page: int = 50
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all seasons across every page.
+
+        Args:
+            league_id: ID of the league to filter by (all leagues if None)
+            per_page: Number of seasons requested per page
+
+        Returns:
+            Async iterator of season records
+        """
+        params: dict[str, Any] = {"per_page": per_page}
+        if league_id is not None:
+            params["filters"] = f"seasonLeagues:{league_id}"
+
+        return self._paginate("seasons", params)
@@ -11,11 +11,41 @@ All concrete collectors should inherit from BaseCollector.
 """
 
 import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional
 
-from football_analytics.api_client import SportsMonkClient
-from football_analytics.utils import RateLimiter, file_exists
+from football_analytics.api_client import AsyncSportsMonkClient, SportsMonkClient
+from football_analytics.utils import RateLimiter, TokenBucketRateLimiter
+
+
+@dataclass(slots=True)
+class CollectorStats:
+    """
+    Running counters for a collection run.
+
+    Collectors update these through their increment_* methods, which hold
+    a lock so worker threads (e.g. retry_failed_includes) can count safely.
+
+    Attributes:
+        api_calls: Number of API requests made
+        files_created: Number of output files written
+        files_skipped: Number of files skipped because they already existed
+        errors: Number of failed requests
+
+    Example:
+        >>> stats = CollectorStats()
+        >>> stats.api_calls += 1
+        >>> stats.api_calls
+        1
+    """
+
+    api_calls: int = 0
+    files_created: int = 0
+    files_skipped: int = 0
+    errors: int = 0
 
 
 class BaseCollector:
@@ -31,9 +61,18 @@ class BaseCollector:
 
     Args:
         output_dir: Directory where collected data will be saved
-        rate_limit_seconds: Minimum seconds between API requests
+        rate_limit_seconds: Minimum seconds between API requests (average
+            seconds per request when rate_limit_burst > 1)
+        rate_limit_burst: Requests allowed back-to-back before spacing kicks in;
+            above 1 a token bucket of this size replaces the fixed delay
         resume: If True, skip files that already exist
+        concurrency: Requests in flight at once; above 1, collectors that
+            support it fetch concurrently with AsyncSportsMonkClient (requires
+            aiohttp) at the same average request rate
+        http2: Use an HTTP/2 session for concurrent fetches, multiplexing them
+            over one connection (requires httpx[http2])
         api_key: Optional API key override (uses env var if not provided)
+        cache_dir: Directory for cached API responses (no caching if None)
 
     Example:
         >>> class MyCollector(BaseCollector):
@@ -41,34 +80,63 @@ class BaseCollector:
         ...         self.rate_limiter.wait()
         ...         data = self.client.get_leagues()
         ...         return data
+        >>> with MyCollector() as collector:  # Closes the API session on exit
+        ...     collector.collect()
     """
 
     def __init__(
         self,
         output_dir: str = "data/raw",
         rate_limit_seconds: float = 6.0,
+        rate_limit_burst: int = 1,
         resume: bool = True,
+        concurrency: int = 1,
+        http2: bool = False,
         api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ):
         """Initialize base collector."""
         # API client
-        self.client = SportsMonkClient(api_key=api_key)
+        self.client = SportsMonkClient(api_key=api_key, cache_dir=cache_dir)
 
         # Output directory
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Rate limiting
-        self.rate_limiter = RateLimiter(delay=rate_limit_seconds)
+        if rate_limit_burst > 1:
+            self.rate_limiter = TokenBucketRateLimiter(
+                max_rate=rate_limit_burst, time_period=rate_limit_burst * rate_limit_seconds
+            )
+        else:
+            self.rate_limiter = RateLimiter(delay=rate_limit_seconds)
+        self.rate_limit_seconds = rate_limit_seconds
+        self.concurrency = concurrency
+        self.http2 = http2
 
-        # Resume capability
+        # Resume capability: directory -> names of files already on disk,
+        # listed once per directory instead of one stat() per candidate file
         self.resume = resume
+        self._existing: dict[Path, set[str]] = {}
 
         # Logging
         self.logger = logging.getLogger(self.__class__.__name__)
 
-        # Statistics
-        self.stats = {"api_calls": 0, "files_created": 0, "files_skipped": 0, "errors": 0}
+        # Statistics, updated under a lock by worker threads too
+        self.stats = CollectorStats()
+        self._stats_lock = threading.Lock()
+
+    def __enter__(self) -> "BaseCollector":
+        """Return the collector for use in a with block."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the API client when leaving the with block."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the API client's HTTP session."""
+        self.client.close()
 
     def should_skip(self, filepath: Path) -> bool:
         """
@@ -85,23 +153,108 @@ class BaseCollector:
             >>> if collector.should_skip(Path("data/existing.json")):
             ...     print("Skipping")
         """
-        if self.resume and file_exists(filepath):
-            self.logger.debug(f"Skipping (already exists): {filepath}")
-            self.stats["files_skipped"] += 1
+        if self.resume and filepath.name in self._existing_names(filepath.parent):
+            self.logger.debug("Skipping (already exists): %s", filepath)
+            with self._stats_lock:
+                self.stats.files_skipped += 1
             return True
         return False
 
+    def _existing_names(self, directory: Path) -> set[str]:
+        """
+        Get the names of files in a directory, scanning it on first use.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Set of file names (kept up to date by note_written)
+        """
+        names = self._existing.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries if entry.is_file()}
+            except FileNotFoundError:
+                names = set()
+            self._existing[directory] = names
+        return names
+
+    def make_output_dir(self, directory: Path) -> Path:
+        """
+        Create an output directory, priming the resume manifest if it is new.
+
+        A directory created here is known to be empty, so later should_skip
+        checks in it need no scandir at all; existing directories are
+        scanned once on first lookup as usual.
+
+        Args:
+            directory: Directory to create
+
+        Returns:
+            The directory path
+        """
+        try:
+            directory.mkdir(parents=True)
+            self._existing[directory] = set()
+        except FileExistsError:
+            pass
+        return directory
+
+    def note_written(self, filepath: Path) -> None:
+        """
+        Record a file written by this collector so resume checks see it.
+
+        Subclasses should call this after saving each output file.
+
+        Args:
+            filepath: Path of the file just written
+
+        Example:
+            >>> save_json(data, output_path)
+            >>> self.note_written(output_path)
+        """
+        self._existing_names(filepath.parent).add(filepath.name)
+
+    def _async_client(self) -> AsyncSportsMonkClient:
+        """
+        Create an async client sharing this collector's API key and rate.
+
+        Requests are throttled by a token bucket of ``concurrency`` tokens at
+        ``rate_limit_seconds`` per request (or by the collector's own bucket
+        when rate_limit_burst > 1), so concurrent fetches burst without
+        exceeding the serial collector's average rate.
+
+        Returns:
+            AsyncSportsMonkClient to be used as an async context manager
+        """
+        if isinstance(self.rate_limiter, TokenBucketRateLimiter):
+            limiter = self.rate_limiter
+        else:
+            limiter = TokenBucketRateLimiter(
+                max_rate=self.concurrency, time_period=self.concurrency * self.rate_limit_seconds
+            )
+        return AsyncSportsMonkClient(
+            api_key=self.client.api_key,
+            max_concurrency=self.concurrency,
+            http2=self.http2,
+            rate_limiter=limiter,
+        )
+
     def increment_api_calls(self) -> None:
         """Track API call statistics."""
-        self.stats["api_calls"] += 1
+        with self._stats_lock:
+            self.stats.api_calls += 1
 
     def increment_files_created(self) -> None:
         """Track file creation statistics."""
-        self.stats["files_created"] += 1
+        with self._stats_lock:
+            self.stats.files_created += 1
 
     def increment_errors(self) -> None:
         """Track error statistics."""
-        self.stats["errors"] += 1
+        with self._stats_lock:
+            self.stats.errors += 1
 
     def get_stats(self) -> dict:
         """
@@ -116,9 +269,11 @@ class BaseCollector:
             >>> stats = collector.get_stats()
             >>> print(f"Made {stats['api_calls']} API calls")
         """
-        return self.stats.copy()
+        with self._stats_lock:
+            return asdict(self.stats)
 
     def reset_stats(self) -> None:
         """Reset collection statistics."""
-        self.stats = {"api_calls": 0, "files_created": 0, "files_skipped": 0, "errors": 0}
+        with self._stats_lock:
+            self.stats = CollectorStats()
         self.logger.debug("Statistics reset")
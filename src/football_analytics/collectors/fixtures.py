@@ -4,10 +4,19 @@ Collects fixture metadata (IDs, dates, opponents) for a specific team
 across one or more seasons.
 
 Strategy:
-- Search by date (API provides fixtures/date/{date} endpoint)
-- Check every week throughout the season (Aug-May for Premier League)
+- Fetch the team's schedule with fixtures/between/{from}/{to}/{team_id}
+  (a few requests per season)
+- If that endpoint is unavailable, search by date (fixtures/date/{date}),
+  checking every week throughout the season (Aug-May for Premier League)
+- Optionally request the dates concurrently (concurrency > 1)
+- Reuse cached date responses (with a cache_dir); settled past dates
+  never expire
 - Filter results for specific team
-- Save consolidated fixture list
+- Checkpoint each completed season to fixtures_list.{season_id}.jsonl;
+  with resume, checkpointed seasons that have finished are not collected
+  again (the current season always is)
+- Save consolidated, date-sorted fixture list (fixtures_list.json, plus
+  fixtures_list.parquet when pyarrow is installed)
 
 TODO (Framework Evolution):
     - Add support for cup competitions (Champions League, FA Cup)
@@ -17,14 +26,29 @@ TODO (Framework Evolution):
     - Cache season date ranges per league
 """
 
-from datetime import datetime, timedelta
-from typing import Any
+import asyncio
+import heapq
+import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
 
+import orjson
+import pandas as pd
+
+from football_analytics.data_processor import DataProcessor
 from football_analytics.utils import save_json
 
 from .base import BaseCollector
 
 
+def _fixture_date(fixture: dict[str, Any]) -> str:
+    """Sort key for fixture metadata; fixtures without a date sort first."""
+    return fixture.get("date") or ""
+
+
 class FixtureCollector(BaseCollector):
     """
     Collect all fixtures for a specific team across seasons.
@@ -34,6 +58,7 @@ class FixtureCollector(BaseCollector):
         output_dir: Directory for saving fixture data
         rate_limit_seconds: API rate limit delay
         resume: Skip existing fixture lists
+        concurrency: Dates requested in parallel (default: 1, serial)
 
     Example:
         >>> collector = FixtureCollector(team_id=8)  # Liverpool
@@ -49,11 +74,38 @@ class FixtureCollector(BaseCollector):
         23614: ("2024-08-01", "2025-05-31"),  # 2024/25
     }
 
+    # SEASON_DATE_RANGES parsed once; add_season_date_range keeps both in sync
+    _PARSED_RANGES = {
+        season_id: (datetime.strptime(start, "%Y-%m-%d"), datetime.strptime(end, "%Y-%m-%d"))
+        for season_id, (start, end) in SEASON_DATE_RANGES.items()
+    }
+
+    # Per-date search only needs the fields read by _has_team and
+    # _extract_fixture_metadata; field selection trims the rest server-side
+    # (ids are always returned)
+    DATE_SEARCH_PARAMS = {
+        "include": "participants:name",
+        "select": "season_id,league_id,starting_at,state_id",
+    }
+
+    # Date responses are cached by the client when it has a cache_dir. Once a
+    # date is this many days in the past its matches are settled and the
+    # cached copy is reused forever; recent and future dates are re-fetched
+    # after an hour.
+    SETTLED_AFTER_DAYS = 2
+    RECENT_DATE_CACHE_TTL = 3600
+
+    # fixtures/between accepts date ranges of at most 100 days
+    SCHEDULE_WINDOW_DAYS = 100
+
+    # Fixture states that can no longer change: FT, AET, FT_PEN
+    FINISHED_STATE_IDS = frozenset({5, 7, 8})
+
     def __init__(self, team_id: int, **kwargs):
         """Initialize fixture collector for specific team."""
         super().__init__(**kwargs)
         self.team_id = team_id
-        self.logger.info(f"FixtureCollector initialized for team_id={team_id}")
+        self.logger.info("FixtureCollector initialized for team_id=%s", team_id)
 
     def collect_fixtures_for_seasons(
         self, season_ids: list[int], search_interval_days: int = 7
@@ -65,102 +117,376 @@ class FixtureCollector(BaseCollector):
             season_ids: List of season IDs to search
             search_interval_days: Days between searches (default: 7)
 
+        Each completed season is checkpointed to
+        fixtures_list.{season_id}.jsonl (one fixture per line, sorted by
+        date, written atomically). With resume=True a finished season (see
+        _season_finished) whose checkpoint exists is read back instead of
+        collected again, so an interrupted run only repeats the season it
+        was in; the current season is always re-collected, and
+        resume=False re-collects every season. The checkpoints are then merged line by line into
+        the sorted fixtures_list.json, so no season's list is held while
+        later seasons are collected. The merged list itself is still built
+        in memory, since it is saved as one JSON document and returned.
+
         Returns:
             List of fixture metadata dictionaries
 
+        Raises:
+            Exception: If a schedule request fails with anything but a 404;
+                seasons already checkpointed are kept for a resumed run
+
         Example:
             >>> collector = FixtureCollector(team_id=8)
             >>> fixtures = collector.collect_fixtures_for_seasons([21646])
             >>> fixtures[0]["fixture_id"]
             18841624
         """
-        all_fixtures = []
+        season_paths = []
 
         for season_id in season_ids:
-            self.logger.info(f"Collecting fixtures for season {season_id}")
+            season_path = self.output_dir / f"fixtures_list.{season_id}.jsonl"
+            season_paths.append(season_path)
+
+            if (
+                self.resume
+                and season_path.exists()
+                and self._season_finished(season_id, season_path)
+                and self.should_skip(season_path)
+            ):
+                self.logger.info("Using collected season %s from %s", season_id, season_path)
+                continue
+
+            self.logger.info("Collecting fixtures for season %s", season_id)
 
             fixtures = self._find_fixtures_for_season(
                 season_id=season_id, search_interval_days=search_interval_days
             )
+            self._save_season(fixtures, season_path)
 
-            self.logger.info(f"Found {len(fixtures)} fixtures for season {season_id}")
-            all_fixtures.extend(fixtures)
+            self.logger.info("Found %d fixtures for season %s", len(fixtures), season_id)
 
-        # Sort by date
-        all_fixtures.sort(key=lambda x: x.get("date", ""))
+        # k-way merge of the date-sorted season files, read lazily
+        all_fixtures = list(
+            heapq.merge(*(self._iter_season(path) for path in season_paths), key=_fixture_date)
+        )
 
         # Save consolidated fixture list
         output_path = self.output_dir / "fixtures_list.json"
         save_json(all_fixtures, output_path)
+        self.note_written(output_path)
         self.increment_files_created()
 
+        # Typed binary copy for fast reloads (DataProcessor.load_fixtures_parquet)
+        parquet_path = DataProcessor.save_fixtures_parquet(
+            all_fixtures, self.output_dir / "fixtures_list.parquet"
+        )
+        if parquet_path is not None:
+            self.note_written(parquet_path)
+            self.increment_files_created()
+
         self.logger.info(
-            f"Collected {len(all_fixtures)} total fixtures, " f"saved to {output_path}"
+            "Collected %d total fixtures, saved to %s", len(all_fixtures), output_path
         )
 
         return all_fixtures
 
+    def _season_finished(self, season_id: int, season_path: Path) -> bool:
+        """
+        Check whether a checkpointed season can no longer change.
+
+        A season is finished once its end date (from SEASON_DATE_RANGES) has
+        passed, or once every checkpointed fixture is in a finished state.
+
+        Args:
+            season_id: Season ID
+            season_path: The season's checkpoint written by _save_season
+
+        Returns:
+            True if the checkpoint can be reused
+        """
+        season_range = self._PARSED_RANGES.get(season_id)
+        if season_range is not None and season_range[1].date() < date.today():
+            return True
+        states = [fixture.get("state_id") for fixture in self._iter_season(season_path)]
+        return bool(states) and all(state in self.FINISHED_STATE_IDS for state in states)
+
+    def _save_season(self, fixtures: list[dict[str, Any]], season_path: Path) -> None:
+        """Atomically write a season's fixtures as JSON lines."""
+        tmp_path = season_path.with_name(season_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            for fixture in fixtures:
+                f.write(orjson.dumps(fixture) + b"\n")
+        os.replace(tmp_path, season_path)
+        self.note_written(season_path)
+        self.increment_files_created()
+
+    @staticmethod
+    def _iter_season(season_path: Path) -> Iterator[dict[str, Any]]:
+        """Yield a season's fixtures written by _save_season, one line at a time."""
+        with open(season_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+
     def _find_fixtures_for_season(
         self, season_id: int, search_interval_days: int = 7
     ) -> list[dict[str, Any]]:
         """
-        Find all fixtures for one season by date-range search.
+        Find all fixtures for one season.
+
+        Uses the team schedule endpoint, falling back to a per-date search
+        if it is unavailable.
 
         Args:
             season_id: Season ID to search
-            search_interval_days: Days between search queries
+            search_interval_days: Days between search queries (date search only)
 
         Returns:
-            List of fixture metadata for this season
+            List of fixture metadata for this season, sorted by date
         """
         # Get season date range
-        if season_id not in self.SEASON_DATE_RANGES:
-            self.logger.warning(f"Unknown season_id {season_id}, using default date range")
+        if season_id not in self._PARSED_RANGES:
+            self.logger.warning("Unknown season_id %s, using default date range", season_id)
             start_date = datetime(2023, 8, 1)
             end_date = datetime(2024, 5, 31)
         else:
-            start_str, end_str = self.SEASON_DATE_RANGES[season_id]
-            start_date = datetime.strptime(start_str, "%Y-%m-%d")
-            end_date = datetime.strptime(end_str, "%Y-%m-%d")
+            start_date, end_date = self._PARSED_RANGES[season_id]
 
         fixtures = []
-        current_date = start_date
 
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
+        schedule = self._fetch_season_schedule(start_date, end_date)
+        if schedule is not None:
+            for fixture in schedule:
+                self._add_fixture(fixture, fixtures, (fixture.get("starting_at") or "")[:10])
+            fixtures.sort(key=_fixture_date)
+            return fixtures
+
+        date_strs = (
+            pd.date_range(start_date, end_date, freq=f"{search_interval_days}D")
+            .strftime("%Y-%m-%d")
+            .tolist()
+        )
+        self.logger.info("Searching %d dates for season %s", len(date_strs), season_id)
 
+        for date_str, result in self._fetch_dates(date_strs):
             try:
-                # Rate limit
-                self.rate_limiter.wait()
-
-                # Fetch fixtures for this date
-                result = self.client._make_request(
-                    f"fixtures/date/{date_str}", params={"include": "participants"}
-                )
-                self.increment_api_calls()
+                if isinstance(result, Exception):
+                    raise result
 
                 # Filter for our team
                 for fixture in result.get("data", []):
-                    if self._has_team(fixture, self.team_id):
-                        fixture_meta = self._extract_fixture_metadata(fixture)
-                        fixtures.append(fixture_meta)
-
-                        self.logger.info(
-                            f"  ✓ Found: {fixture_meta['name']} "
-                            f"(ID: {fixture_meta['fixture_id']}, Date: {date_str})"
-                        )
+                    self._add_fixture(fixture, fixtures, date_str)
 
             except Exception as e:
                 error_str = str(e)
                 # 404 is expected when no matches on that date
                 if "404" not in error_str:
-                    self.logger.warning(f"Error fetching {date_str}: {error_str}")
+                    self.logger.warning("Error fetching %s: %s", date_str, error_str)
+                    self.increment_errors()
+
+        # Dates are searched in order, so this is usually already sorted
+        fixtures.sort(key=_fixture_date)
+        return fixtures
+
+    def _add_fixture(
+        self,
+        fixture: dict[str, Any],
+        fixtures: list[dict[str, Any]],
+        date_str: str,
+    ) -> None:
+        """Record a fixture's metadata if the team plays in it."""
+        fixture_meta = self._maybe_extract(fixture, self.team_id)
+        if fixture_meta is None:
+            return
+
+        fixtures.append(fixture_meta)
+
+        self.logger.info(
+            "  ✓ Found: %s (ID: %s, Date: %s)",
+            fixture_meta["name"],
+            fixture_meta["fixture_id"],
+            date_str,
+        )
+
+    def _fetch_season_schedule(
+        self, start_date: datetime, end_date: datetime
+    ) -> Optional[list[dict[str, Any]]]:
+        """
+        Fetch the team's fixtures between two dates from fixtures/between.
+
+        Makes one request per SCHEDULE_WINDOW_DAYS window (plus any further
+        pages) instead of one per search date. Windows without matches
+        return 404 and are treated as empty.
+
+        Args:
+            start_date: First day of the season
+            end_date: Last day of the season
+
+        Returns:
+            Raw fixture dictionaries, or None if the schedule is empty (every
+            window returned 404 or no fixtures) so the caller should fall
+            back to the per-date search
+
+        Raises:
+            Exception: Any other request failure (authentication, rate limit,
+                malformed response), after counting it with increment_errors
+        """
+        fixtures = []
+        window_start = start_date
+
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=self.SCHEDULE_WINDOW_DAYS - 1), end_date)
+            endpoint = (
+                f"fixtures/between/{window_start:%Y-%m-%d}/{window_end:%Y-%m-%d}/{self.team_id}"
+            )
+            cache_ttl = self._date_cache_ttl(f"{window_end:%Y-%m-%d}")
+            page = 1
+
+            while True:
+                params = {**self.DATE_SEARCH_PARAMS, "page": page}
+                try:
+                    result = self.client.get_cached_response(endpoint, params, cache_ttl)
+                    if result is None:
+                        self.rate_limiter.wait()
+                        result = self.client._make_request(endpoint, params, use_cache=False)
+                        self.increment_api_calls()
+                        self.client.cache_response(endpoint, params, result)
+                except Exception as e:
+                    if "404" in str(e):
+                        break
+                    self.logger.error("Schedule request failed: %.200s", e)
                     self.increment_errors()
+                    raise
 
-            current_date += timedelta(days=search_interval_days)
+                fixtures.extend(result.get("data") or [])
+                if not (result.get("pagination") or {}).get("has_more"):
+                    break
+                page += 1
 
+            window_start = window_end + timedelta(days=1)
+
+        if not fixtures:
+            self.logger.info("No schedule returned, falling back to date search")
+            return None
         return fixtures
 
+    def _fetch_dates(self, date_strs: list[str]) -> Iterator[tuple[str, Any]]:
+        """
+        Fetch the fixtures list for each date.
+
+        Dates with a usable cached response (see _date_cache_ttl) are
+        served from the client cache without waiting on the rate limiter.
+        With concurrency > 1 the remaining dates are requested concurrently
+        through the async client; otherwise (or if aiohttp is not installed)
+        they are requested one by one behind the rate limiter, with the next
+        date prefetched while the caller processes the current one.
+
+        Args:
+            date_strs: Dates to fetch in YYYY-MM-DD format
+
+        Returns:
+            Iterator of (date_str, response or the exception raised), in
+            the order of date_strs
+        """
+        results = {}
+        for date_str in date_strs:
+            cached = self.client.get_cached_response(
+                f"fixtures/date/{date_str}", self.DATE_SEARCH_PARAMS, self._date_cache_ttl(date_str)
+            )
+            if cached is not None:
+                results[date_str] = cached
+        misses = [date_str for date_str in date_strs if date_str not in results]
+        self.logger.debug("%d of %d dates served from cache", len(results), len(date_strs))
+
+        if self.concurrency > 1 and misses:
+            try:
+                fetched = asyncio.run(self._fetch_dates_async(misses))
+            except ImportError:
+                self.logger.warning("aiohttp not installed, fetching dates serially")
+            else:
+                for date_str, result in zip(misses, fetched):
+                    results[date_str] = result
+                    if not isinstance(result, Exception):
+                        self.increment_api_calls()
+                        self.client.cache_response(
+                            f"fixtures/date/{date_str}", self.DATE_SEARCH_PARAMS, result
+                        )
+
+        return self._prefetch_dates(date_strs, results)
+
+    def _prefetch_dates(
+        self, date_strs: list[str], results: dict[str, Any]
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Yield each date's response, fetching the next missing one ahead.
+
+        A single worker thread requests the next date not in results while
+        the caller handles the current one, so parsing overlaps the network
+        round-trip. The worker still waits on the shared rate limiter.
+
+        Args:
+            date_strs: Dates to yield, in order
+            results: Responses already available, keyed by date
+
+        Returns:
+            Iterator of (date_str, response or the exception raised)
+        """
+        misses = iter([date_str for date_str in date_strs if date_str not in results])
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+
+            def submit_next() -> Optional[Future]:
+                date_str = next(misses, None)
+                return executor.submit(self._fetch_date, date_str) if date_str else None
+
+            pending = submit_next()
+            for date_str in date_strs:
+                if date_str in results:
+                    yield date_str, results[date_str]
+                    continue
+                result = pending.result()
+                pending = submit_next()
+                if not isinstance(result, Exception):
+                    self.increment_api_calls()
+                yield date_str, result
+
+    def _date_cache_ttl(self, date_str: str) -> float:
+        """
+        Get how old a cached response for a date may be.
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+
+        Returns:
+            Maximum cache age in seconds (infinite for settled past dates)
+        """
+        age_days = (date.today() - date.fromisoformat(date_str)).days
+        if age_days >= self.SETTLED_AFTER_DAYS:
+            return float("inf")
+        return self.RECENT_DATE_CACHE_TTL
+
+    def _fetch_date(self, date_str: str) -> Any:
+        """Fetch fixtures for one date, returning the exception on failure."""
+        try:
+            self.rate_limiter.wait()
+            # The cache was already checked in _fetch_dates; write the fresh
+            # response back to it
+            endpoint = f"fixtures/date/{date_str}"
+            result = self.client._make_request(
+                endpoint, params=self.DATE_SEARCH_PARAMS, use_cache=False
+            )
+            self.client.cache_response(endpoint, self.DATE_SEARCH_PARAMS, result)
+            return result
+        except Exception as e:
+            return e
+
+    async def _fetch_dates_async(self, date_strs: list[str]) -> list[Any]:
+        """Fetch fixtures for all dates concurrently."""
+        async with self._async_client() as client:
+            return await client.gather_requests(
+                [(f"fixtures/date/{date_str}", self.DATE_SEARCH_PARAMS) for date_str in date_strs]
+            )
+
     def _has_team(self, fixture: dict[str, Any], team_id: int) -> bool:
         """
         Check if team participates in fixture.
@@ -175,6 +501,27 @@ class FixtureCollector(BaseCollector):
         participants = fixture.get("participants", [])
         return any(p.get("id") == team_id for p in participants)
 
+    def _maybe_extract(self, fixture: dict[str, Any], team_id: int) -> Optional[dict[str, Any]]:
+        """
+        Extract fixture metadata if the team participates.
+
+        Combines _has_team and _extract_fixture_metadata for the search loop,
+        reading the participant ids once for both the membership test and
+        the home/away ids.
+
+        Args:
+            fixture: Raw fixture data from API
+            team_id: Team ID to check for
+
+        Returns:
+            Fixture metadata, or None if the team is not in the fixture
+        """
+        participants = fixture.get("participants") or []
+        participant_ids = [p.get("id") for p in participants]
+        if team_id not in participant_ids:
+            return None
+        return self._build_fixture_metadata(fixture, participants, participant_ids)
+
     def _extract_fixture_metadata(self, fixture: dict[str, Any]) -> dict[str, Any]:
         """
         Extract relevant metadata from fixture response.
@@ -185,8 +532,18 @@ class FixtureCollector(BaseCollector):
         Returns:
             Dictionary with essential fixture information
         """
-        participants = fixture.get("participants", [])
+        participants = fixture.get("participants") or []
+        return self._build_fixture_metadata(
+            fixture, participants, [p.get("id") for p in participants]
+        )
 
+    def _build_fixture_metadata(
+        self,
+        fixture: dict[str, Any],
+        participants: list[dict[str, Any]],
+        participant_ids: list[Optional[int]],
+    ) -> dict[str, Any]:
+        """Build the metadata dict from a fixture and its participant ids."""
         # Extract team names
         home_team = "Unknown"
         away_team = "Unknown"
@@ -203,8 +560,8 @@ class FixtureCollector(BaseCollector):
             "name": f"{home_team} vs {away_team}",
             "home_team": home_team,
             "away_team": away_team,
-            "home_team_id": participants[0].get("id") if participants else None,
-            "away_team_id": participants[1].get("id") if len(participants) > 1 else None,
+            "home_team_id": participant_ids[0] if participant_ids else None,
+            "away_team_id": participant_ids[1] if len(participant_ids) > 1 else None,
             "state_id": fixture.get("state_id"),
         }
 
@@ -230,4 +587,10 @@ class FixtureCollector(BaseCollector):
             - Support mid-season competitions (World Cup breaks, etc.)
         """
         self.SEASON_DATE_RANGES[season_id] = (start_date, end_date)
-        self.logger.info(f"Added season date range: {season_id} -> {start_date} to {end_date}")
+        self._PARSED_RANGES[season_id] = (
+            datetime.strptime(start_date, "%Y-%m-%d"),
+            datetime.strptime(end_date, "%Y-%m-%d"),
+        )
+        self.logger.info(
+            "Added season date range: %s -> %s to %s", season_id, start_date, end_date
+        )
@@ -11,9 +11,12 @@ Downloads all available includes for each fixture:
 
 Strategy:
 - One API call per include (cannot combine multiple includes)
-- Save each include to separate JSON file
+- Save each include to separate JSON file (raw API body, not re-encoded),
+  optionally zstd-compressed as {include}.json.zst (compress=True)
 - Resume capability (skip existing files)
+- Skip includes that past fixtures of the same league and state never had
 - Progress tracking
+- Optionally fetch includes (and fixtures) concurrently (concurrency > 1)
 
 TODO (Framework Evolution):
     - Parallel downloads with asyncio (respect rate limits)
@@ -23,9 +26,16 @@ TODO (Framework Evolution):
     - Smart scheduling (download during off-peak hours)
 """
 
-from typing import Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
 
-from football_analytics.utils import save_json
+import numpy as np
+import orjson
+
+from football_analytics.utils import load_json, save_json, save_json_zst
+from football_analytics.utils.file_io import ZSTD_SUFFIX
 
 from .base import BaseCollector
 
@@ -46,7 +56,11 @@ class MatchDataCollector(BaseCollector):
     Args:
         output_dir: Base directory for match data
         rate_limit_seconds: API rate limit delay
-        resume: Skip existing files
+        resume: Skip existing files (in either format)
+        concurrency: Requests in flight at once (default: 1, serial)
+        http2: Multiplex concurrent requests over one HTTP/2 connection
+        compress: Store includes as zstd-compressed .json.zst (requires
+            zstandard); processors read either format
 
     Example:
         >>> collector = MatchDataCollector()
@@ -67,9 +81,41 @@ class MatchDataCollector(BaseCollector):
         "scores",
     ]
 
+    # Include hit-rate history, kept in output_dir across runs
+    HIT_RATE_FILE = ".include_hitrate.json"
+    # Skip an include once it has been empty this often for a league/state
+    SKIP_BELOW_HIT_RATE = 0.05
+    SKIP_MIN_SAMPLES = 50
+    # Fetch a skipped include anyway every this many skips, in case it filled in
+    REPROBE_EVERY = 20
+
+    _hit_rates: Optional[dict[str, list[int]]] = None
+
+    def __init__(self, compress: bool = False, **kwargs):
+        """Initialize match data collector."""
+        super().__init__(**kwargs)
+        if compress:
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                self.logger.warning("zstandard not installed, saving includes uncompressed")
+                compress = False
+        self.compress = compress
+
+    def _include_path(self, fixture_dir: Path, include_name: str) -> Path:
+        """Get the file an include is saved to in the configured format."""
+        suffix = ".json" + ZSTD_SUFFIX if self.compress else ".json"
+        return fixture_dir / f"{include_name}{suffix}"
+
+    def _include_exists(self, fixture_dir: Path, include_name: str) -> bool:
+        """Resume check accepting an include saved in either format."""
+        return self.should_skip(fixture_dir / f"{include_name}.json") or self.should_skip(
+            fixture_dir / f"{include_name}.json{ZSTD_SUFFIX}"
+        )
+
     def collect_all_fixtures(
         self, fixtures_list: list[dict[str, Any]]
-    ) -> dict[int, dict[str, bool]]:
+    ) -> dict[int, dict[str, Optional[bool]]]:
         """
         Download all includes for all fixtures.
 
@@ -78,6 +124,7 @@ class MatchDataCollector(BaseCollector):
 
         Returns:
             Dictionary mapping fixture_id -> include_name -> success status
+            (None for includes skipped as predicted empty)
 
         Example:
             >>> collector = MatchDataCollector()
@@ -88,83 +135,291 @@ class MatchDataCollector(BaseCollector):
         """
         total_fixtures = len(fixtures_list)
         total_calls = total_fixtures * len(self.INCLUDES)
-        completed_calls = 0
 
-        self.logger.info(f"Starting collection for {total_fixtures} fixtures")
-        self.logger.info(f"Total API calls needed: {total_calls}")
-        self.logger.info(f"Estimated time: ~{(total_calls * 6) / 60:.1f} minutes")
+        self.logger.info("Starting collection for %d fixtures", total_fixtures)
+        self.logger.info("Total API calls needed: %d", total_calls)
+        self.logger.info("Estimated time: ~%.1f minutes", (total_calls * 6) / 60)
 
         results = {}
 
+        if self.concurrency > 1:
+            try:
+                asyncio.run(self._collect_all_fixtures_async(fixtures_list, results, total_calls))
+            except ImportError:
+                self.logger.warning("aiohttp not installed, collecting fixtures serially")
+
         for idx, fixture in enumerate(fixtures_list, 1):
             fixture_id = fixture["fixture_id"]
+            if fixture_id in results:
+                continue
             fixture_name = fixture.get("name", f"Fixture {fixture_id}")
 
             self.logger.info(
-                f"\n[{idx}/{total_fixtures}] Collecting: {fixture_name} " f"(ID: {fixture_id})"
+                "\n[%d/%d] Collecting: %s (ID: %s)", idx, total_fixtures, fixture_name, fixture_id
             )
 
-            fixture_results = self._collect_fixture(fixture_id)
+            fixture_results = self._collect_fixture(fixture_id, fixture)
             results[fixture_id] = fixture_results
+            self._log_progress(fixture_results, len(results), total_calls)
 
-            # Update progress
-            completed_calls += len(self.INCLUDES)
-            progress = (completed_calls / total_calls) * 100
-
-            successful = sum(fixture_results.values())
-            failed = len(self.INCLUDES) - successful
-
-            self.logger.info(
-                f"  Progress: {progress:.1f}% ({completed_calls}/{total_calls}) | "
-                f"Fixture: {successful} succeeded, {failed} failed"
-            )
+        self._save_hit_rates()
 
         # Final statistics
         self._log_collection_summary(results)
 
         return results
 
-    def _collect_fixture(self, fixture_id: int) -> dict[str, bool]:
+    def _log_progress(
+        self, fixture_results: dict[str, Optional[bool]], fixtures_done: int, total_calls: int
+    ) -> None:
+        """Log overall progress after a fixture has been collected."""
+        completed_calls = fixtures_done * len(self.INCLUDES)
+        progress = (completed_calls / total_calls) * 100
+
+        statuses = list(fixture_results.values())
+        successful = statuses.count(True)
+        failed = statuses.count(False)
+        skipped = statuses.count(None)
+
+        self.logger.info(
+            "  Progress: %.1f%% (%d/%d) | Fixture: %d succeeded, %d failed, %d skipped",
+            progress,
+            completed_calls,
+            total_calls,
+            successful,
+            failed,
+            skipped,
+        )
+
+    async def _collect_all_fixtures_async(
+        self,
+        fixtures_list: list[dict[str, Any]],
+        results: dict[int, dict[str, Optional[bool]]],
+        total_calls: int,
+    ) -> None:
+        """
+        Collect all fixtures concurrently on one async session.
+
+        Every missing include of every fixture is queued at once; the
+        client's semaphore and token bucket bound how many run together.
+        Fills ``results`` as fixtures complete.
+        """
+        total_fixtures = len(fixtures_list)
+
+        async with self._async_client() as client:
+            tasks = [
+                self._collect_fixture_async(client, fixture["fixture_id"], fixture)
+                for fixture in fixtures_list
+            ]
+            for task in asyncio.as_completed(tasks):
+                fixture_id, fixture_results = await task
+                results[fixture_id] = fixture_results
+
+                self.logger.info(
+                    "\n[%d/%d] Collected fixture %s", len(results), total_fixtures, fixture_id
+                )
+                self._log_progress(fixture_results, len(results), total_calls)
+
+    async def _collect_fixture_async(
+        self, client: Any, fixture_id: int, fixture: Optional[dict[str, Any]] = None
+    ) -> tuple[int, dict[str, Optional[bool]]]:
+        """
+        Collect all includes for a single fixture concurrently.
+
+        Args:
+            client: Open AsyncSportsMonkClient
+            fixture_id: Fixture ID to collect
+            fixture: Fixture metadata, used to skip includes predicted empty
+
+        Returns:
+            Tuple of (fixture_id, include_name -> success status)
+        """
+        fixture_dir = self.output_dir / str(fixture_id)
+        self.make_output_dir(fixture_dir)
+
+        results = {}
+        pending = []
+
+        for include_name in self.INCLUDES:
+            # Resume: skip if file exists
+            if self._include_exists(fixture_dir, include_name):
+                results[include_name] = True
+            elif self._predict_empty(fixture, include_name):
+                self.logger.debug("  - %s: known empty, skipped", include_name)
+                results[include_name] = None
+            else:
+                pending.append(include_name)
+
+        # Raw bodies, so includes are archived exactly as the serial path writes them
+        responses = await client.gather_requests(
+            [(f"fixtures/{fixture_id}", {"include": include_name}) for include_name in pending],
+            raw=True,
+        )
+
+        for include_name, data in zip(pending, responses):
+            if isinstance(data, Exception):
+                self.logger.error("  ✗ %s: %.100s", include_name, data)
+                self.increment_errors()
+                results[include_name] = False
+                continue
+
+            self.increment_api_calls()
+            self._record_hit(fixture, include_name, data)
+            self._save_include(data, self._include_path(fixture_dir, include_name))
+            results[include_name] = True
+            self.logger.debug("  ✓ %s", include_name)
+
+        return fixture_id, {include_name: results[include_name] for include_name in self.INCLUDES}
+
+    def _save_include(self, data: Any, output_path: Path) -> None:
+        """
+        Save one include payload and record it for resume checks.
+
+        Raw response bytes are written as-is; decoded payloads are
+        serialized with save_json. Paths ending in .zst are compressed.
+        """
+        if output_path.suffix == ZSTD_SUFFIX:
+            save_json_zst(data, output_path)
+        elif isinstance(data, bytes):
+            output_path.write_bytes(data)
+        else:
+            save_json(data, output_path)
+        self.note_written(output_path)
+        self.increment_files_created()
+
+    def _hit_rate_key(self, fixture: Optional[dict[str, Any]], include_name: str) -> Optional[str]:
+        """Get the hit-rate key for a fixture's include, or None without metadata."""
+        if not fixture or fixture.get("league_id") is None:
+            return None
+        return f"{fixture['league_id']}:{fixture.get('state_id')}:{include_name}"
+
+    def _load_hit_rates(self) -> dict[str, list[int]]:
+        """Load the include hit-rate history on first use."""
+        if self._hit_rates is None:
+            path = self.output_dir / self.HIT_RATE_FILE
+            self._hit_rates = load_json(path) if path.exists() else {}
+        return self._hit_rates
+
+    def _save_hit_rates(self) -> None:
+        """Persist the include hit-rate history if it was used."""
+        if self._hit_rates is not None:
+            save_json(self._hit_rates, self.output_dir / self.HIT_RATE_FILE, indent=None)
+
+    def _predict_empty(self, fixture: Optional[dict[str, Any]], include_name: str) -> bool:
+        """
+        Check whether an include is almost never populated for this kind of fixture.
+
+        Fixtures are grouped by (league_id, state_id). An include is
+        predicted empty once more than SKIP_MIN_SAMPLES fetches in the
+        group returned data less than SKIP_BELOW_HIT_RATE of the time.
+
+        Args:
+            fixture: Fixture metadata (needs league_id; state_id optional)
+            include_name: Include about to be fetched
+
+        Returns:
+            True if the fetch should be skipped
+        """
+        key = self._hit_rate_key(fixture, include_name)
+        if key is None:
+            return False
+        counts = self._hit_counts(key)
+        if not self._rarely_populated(counts):
+            return False
+        # Re-probe now and then so a group that starts returning data is noticed
+        counts[2] += 1
+        if counts[2] >= self.REPROBE_EVERY:
+            counts[2] = 0
+            return False
+        return True
+
+    def _hit_counts(self, key: str) -> list[int]:
+        """Get the [hits, fetches, skips since last fetch] entry for a hit-rate key."""
+        counts = self._load_hit_rates().setdefault(key, [0, 0, 0])
+        if len(counts) < 3:
+            # History written before skips were counted
+            counts.append(0)
+        return counts
+
+    def _rarely_populated(self, counts: list[int]) -> bool:
+        """Check whether hit-rate counts put an include below the skip threshold."""
+        hits, total = counts[0], counts[1]
+        return total > self.SKIP_MIN_SAMPLES and hits / total < self.SKIP_BELOW_HIT_RATE
+
+    def _record_hit(self, fixture: Optional[dict[str, Any]], include_name: str, data: Any) -> None:
+        """Record whether a fetched include (decoded or raw bytes) contained data."""
+        key = self._hit_rate_key(fixture, include_name)
+        if key is None:
+            return
+        if isinstance(data, bytes):
+            try:
+                data = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                data = None
+        payload = data.get("data") if isinstance(data, dict) else None
+        has_data = isinstance(payload, dict) and bool(payload.get(include_name.lower()))
+        counts = self._hit_counts(key)
+        if has_data and self._rarely_populated(counts):
+            # A skipped group returned data: restart its history so it is fetched again
+            counts[:] = [0, 0, 0]
+        counts[0] += has_data
+        counts[1] += 1
+
+    def _collect_fixture(
+        self, fixture_id: int, fixture: Optional[dict[str, Any]] = None
+    ) -> dict[str, Optional[bool]]:
         """
         Collect all includes for a single fixture.
 
+        Includes predicted empty for the fixture's league and state (see
+        _predict_empty) are skipped and reported as None.
+
         Args:
             fixture_id: Fixture ID to collect
+            fixture: Fixture metadata from FixtureCollector (optional)
 
         Returns:
             Dictionary mapping include_name -> success status
         """
         # Create fixture directory
         fixture_dir = self.output_dir / str(fixture_id)
-        fixture_dir.mkdir(parents=True, exist_ok=True)
+        self.make_output_dir(fixture_dir)
 
         results = {}
 
         for include_name in self.INCLUDES:
-            output_path = fixture_dir / f"{include_name}.json"
+            output_path = self._include_path(fixture_dir, include_name)
 
             # Resume: skip if file exists
-            if self.should_skip(output_path):
+            if self._include_exists(fixture_dir, include_name):
                 results[include_name] = True
                 continue
 
+            if self._predict_empty(fixture, include_name):
+                self.logger.debug("  - %s: known empty, skipped", include_name)
+                results[include_name] = None
+                continue
+
             try:
                 # Rate limit
                 self.rate_limiter.wait()
 
                 # Fetch data
-                data = self.client.get_fixture_details(fixture_id=fixture_id, include=include_name)
+                # The payload is archived below, so bypass the response cache
+                data, _ = self.client.get_fixture_details_raw(
+                    fixture_id=fixture_id, include=include_name, use_cache=False
+                )
                 self.increment_api_calls()
+                self._record_hit(fixture, include_name, data)
 
                 # Save to file
-                save_json(data, output_path)
-                self.increment_files_created()
+                self._save_include(data, output_path)
 
                 results[include_name] = True
-                self.logger.debug(f"  ✓ {include_name}")
+                self.logger.debug("  ✓ %s", include_name)
 
             except Exception as e:
-                self.logger.error(f"  ✗ {include_name}: {str(e)[:100]}")
+                self.logger.error("  ✗ %s: %.100s", include_name, e)
                 self.increment_errors()
                 results[include_name] = False
 
@@ -201,43 +456,59 @@ class MatchDataCollector(BaseCollector):
         """
         if include_name not in self.INCLUDES:
             self.logger.error(
-                f"Invalid include name: {include_name}. " f"Valid options: {self.INCLUDES}"
+                "Invalid include name: %s. Valid options: %s", include_name, self.INCLUDES
             )
             return False
 
         fixture_dir = self.output_dir / str(fixture_id)
-        fixture_dir.mkdir(parents=True, exist_ok=True)
-        output_path = fixture_dir / f"{include_name}.json"
+        self.make_output_dir(fixture_dir)
+        output_path = self._include_path(fixture_dir, include_name)
 
         # Check if should skip
-        if not force and self.should_skip(output_path):
+        if not force and self._include_exists(fixture_dir, include_name):
             return True
 
         try:
             self.rate_limiter.wait()
 
-            data = self.client.get_fixture_details(fixture_id=fixture_id, include=include_name)
+            data, _ = self.client.get_fixture_details_raw(
+                fixture_id=fixture_id, include=include_name, use_cache=False
+            )
             self.increment_api_calls()
 
-            save_json(data, output_path)
-            self.increment_files_created()
-
-            self.logger.info(f"✓ Collected {include_name} for fixture {fixture_id}")
+            self._save_include(data, output_path)
+            if force:
+                # Drop a copy in the other format so readers don't pick up stale data
+                stale = (
+                    fixture_dir / f"{include_name}.json"
+                    if self.compress
+                    else output_path.with_name(output_path.name + ZSTD_SUFFIX)
+                )
+                stale.unlink(missing_ok=True)
+
+            self.logger.info("✓ Collected %s for fixture %s", include_name, fixture_id)
             return True
 
         except Exception as e:
-            self.logger.error(f"✗ Failed to collect {include_name} for fixture {fixture_id}: {e}")
+            self.logger.error(
+                "✗ Failed to collect %s for fixture %s: %s", include_name, fixture_id, e
+            )
             self.increment_errors()
             return False
 
     def retry_failed_includes(
-        self, results: dict[int, dict[str, bool]]
-    ) -> dict[int, dict[str, bool]]:
+        self, results: dict[int, dict[str, Optional[bool]]], max_workers: Optional[int] = None
+    ) -> dict[int, dict[str, Optional[bool]]]:
         """
         Retry all failed includes from a previous collection.
 
+        Retries run on a thread pool; the shared rate limiter still spaces
+        the requests, but each one's network round-trip overlaps the next
+        one's wait.
+
         Args:
             results: Results dictionary from collect_all_fixtures()
+            max_workers: Retries in flight at once (default: concurrency)
 
         Returns:
             Updated results dictionary
@@ -250,49 +521,77 @@ class MatchDataCollector(BaseCollector):
         """
         self.logger.info("Retrying failed includes...")
 
-        retry_count = 0
+        jobs = [
+            (fixture_id, include_name)
+            for fixture_id, includes in results.items()
+            for include_name, success in includes.items()
+            if success is False
+        ]
+        retry_count = len(jobs)
         success_count = 0
 
-        for fixture_id, includes in results.items():
-            for include_name, success in includes.items():
-                if not success:
-                    retry_count += 1
-                    self.logger.info(f"Retrying: fixture {fixture_id} / {include_name}")
+        with ThreadPoolExecutor(max_workers=max_workers or self.concurrency) as executor:
+            futures = {}
+            for fixture_id, include_name in jobs:
+                self.logger.info("Retrying: fixture %s / %s", fixture_id, include_name)
+                future = executor.submit(
+                    self.collect_single_include,
+                    fixture_id=fixture_id,
+                    include_name=include_name,
+                    force=True,
+                )
+                futures[future] = (fixture_id, include_name)
 
-                    new_success = self.collect_single_include(
-                        fixture_id=fixture_id, include_name=include_name, force=True
-                    )
+            for future in as_completed(futures):
+                fixture_id, include_name = futures[future]
+                new_success = future.result()
 
-                    results[fixture_id][include_name] = new_success
-                    if new_success:
-                        success_count += 1
+                results[fixture_id][include_name] = new_success
+                if new_success:
+                    success_count += 1
 
-        self.logger.info(f"Retry complete: {success_count}/{retry_count} now successful")
+        self.logger.info("Retry complete: %d/%d now successful", success_count, retry_count)
 
         return results
 
-    def _log_collection_summary(self, results: dict[int, dict[str, bool]]) -> None:
+    def _log_collection_summary(self, results: dict[int, dict[str, Optional[bool]]]) -> None:
         """Log summary statistics for collection."""
-        total_fixtures = len(results)
-        total_includes = total_fixtures * len(self.INCLUDES)
-
-        successful_includes = sum(sum(includes.values()) for includes in results.values())
-
-        failed_includes = total_includes - successful_includes
-        success_rate = (successful_includes / total_includes * 100) if total_includes > 0 else 0
+        # fixtures x includes status matrix, columns in INCLUDES order
+        status = np.array(
+            [
+                [includes.get(name, False) for name in self.INCLUDES]
+                for includes in results.values()
+            ],
+            dtype=object,
+        ).reshape(-1, len(self.INCLUDES))
+        success = status == True  # noqa: E712 - elementwise, None marks skipped
+        skipped = np.equal(status, None)
+
+        total_fixtures = success.shape[0]
+        total_includes = success.size
+        successful_includes = int(success.sum())
+        skipped_includes = int(skipped.sum())
+
+        failed_includes = total_includes - successful_includes - skipped_includes
+        attempted_includes = total_includes - skipped_includes
+        success_rate = successful_includes / attempted_includes * 100 if attempted_includes else 0
 
         stats = self.get_stats()
 
         self.logger.info("\n" + "=" * 60)
         self.logger.info("COLLECTION SUMMARY")
         self.logger.info("=" * 60)
-        self.logger.info(f"Fixtures processed: {total_fixtures}")
-        self.logger.info(f"Total includes: {total_includes}")
-        self.logger.info(f"Successful: {successful_includes}")
-        self.logger.info(f"Failed: {failed_includes}")
-        self.logger.info(f"Success rate: {success_rate:.1f}%")
-        self.logger.info(f"API calls made: {stats['api_calls']}")
-        self.logger.info(f"Files created: {stats['files_created']}")
-        self.logger.info(f"Files skipped: {stats['files_skipped']}")
-        self.logger.info(f"Errors: {stats['errors']}")
+        self.logger.info("Fixtures processed: %d", total_fixtures)
+        self.logger.info("Total includes: %d", total_includes)
+        self.logger.info("Successful: %d", successful_includes)
+        self.logger.info("Failed: %d", failed_includes)
+        self.logger.info("Skipped (predicted empty): %d", skipped_includes)
+        self.logger.info("Success rate: %.1f%%", success_rate)
+        if total_fixtures:
+            for name, count in zip(self.INCLUDES, success.sum(axis=0)):
+                self.logger.info("  %-16s %d/%d", name, count, total_fixtures)
+        self.logger.info("API calls made: %d", stats["api_calls"])
+        self.logger.info("Files created: %d", stats["files_created"])
+        self.logger.info("Files skipped: %d", stats["files_skipped"])
+        self.logger.info("Errors: %d", stats["errors"])
         self.logger.info("=" * 60)
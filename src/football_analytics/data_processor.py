@@ -1,6 +1,7 @@
 """Data processing utilities for football analytics."""
 
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional, Union
 
 import pandas as pd
 
@@ -8,11 +9,183 @@ import pandas as pd
 class DataProcessor:
     """Process and transform football data from SportsMonk API."""
 
+    # Arrow types for the known scalar fields of each entity. Other keys
+    # (e.g. includes such as participants) become object columns.
+    FIXTURE_COLUMNS = {
+        "id": "int64",
+        "sport_id": "int64",
+        "league_id": "int64",
+        "season_id": "int64",
+        "stage_id": "int64",
+        "group_id": "int64",
+        "aggregate_id": "int64",
+        "round_id": "int64",
+        "state_id": "int64",
+        "venue_id": "int64",
+        "name": "string",
+        "starting_at": "timestamp[s]",
+        "result_info": "string",
+        "leg": "string",
+        "length": "int64",
+        "placeholder": "bool",
+        "has_odds": "bool",
+        "has_premium_odds": "bool",
+        "starting_at_timestamp": "int64",
+    }
+    TEAM_COLUMNS = {
+        "id": "int64",
+        "sport_id": "int64",
+        "country_id": "int64",
+        "venue_id": "int64",
+        "gender": "string",
+        "name": "string",
+        "short_code": "string",
+        "image_path": "string",
+        "founded": "int64",
+        "type": "string",
+        "placeholder": "bool",
+        "last_played_at": "timestamp[s]",
+    }
+    # Fixture metadata records written by FixtureCollector
+    FIXTURE_METADATA_COLUMNS = {
+        "fixture_id": "int64",
+        "season_id": "int64",
+        "league_id": "int64",
+        "date": "timestamp[s]",
+        "name": "string",
+        "home_team": "string",
+        "away_team": "string",
+        "home_team_id": "int64",
+        "away_team_id": "int64",
+        "state_id": "int64",
+    }
+
+    @staticmethod
+    def _records_to_table(records: list[dict[str, Any]], column_types: dict[str, str]) -> Any:
+        """
+        Build a typed pyarrow Table from the known fields of the records.
+
+        Args:
+            records: List of flat-ish API records
+            column_types: Arrow type alias per known field
+
+        Returns:
+            pyarrow.Table of the known fields in first-seen key order, or None
+            if pyarrow is not installed or a value does not match its type
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return None
+
+        columns = dict.fromkeys(key for record in records for key in record)
+        typed = [column for column in columns if column in column_types]
+
+        # Timestamps arrive as "YYYY-MM-DD HH:MM:SS" strings; load then cast
+        schema = pa.schema(
+            [
+                (
+                    column,
+                    pa.string()
+                    if column_types[column].startswith("timestamp")
+                    else pa.type_for_alias(column_types[column]),
+                )
+                for column in typed
+            ]
+        )
+        try:
+            table = pa.Table.from_pylist(records, schema=schema)
+            for idx, column in enumerate(typed):
+                if column_types[column].startswith("timestamp"):
+                    table = table.set_column(
+                        idx, column, table[column].cast(pa.type_for_alias(column_types[column]))
+                    )
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+        return table
+
+    @staticmethod
+    def _records_to_dataframe(
+        records: list[dict[str, Any]], column_types: dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column through pyarrow.
+
+        Known fields get proper int/bool/timestamp Arrow dtypes instead of
+        being inferred row by row into object columns. Falls back to
+        ``pd.DataFrame(records)`` if pyarrow is not installed or a value does
+        not match its declared type.
+
+        Args:
+            records: List of flat-ish API records
+            column_types: Arrow type alias per known field
+
+        Returns:
+            DataFrame with columns in first-seen key order
+        """
+        table = DataProcessor._records_to_table(records, column_types)
+        if table is None:
+            return pd.DataFrame(records)
+
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        for column in columns:
+            if column not in column_types:
+                df[column] = pd.Series([record.get(column) for record in records], dtype=object)
+        return df[columns]
+
+    @staticmethod
+    def save_fixtures_parquet(
+        fixtures: list[dict[str, Any]], filepath: Union[str, Path]
+    ) -> Optional[Path]:
+        """
+        Save fixture metadata (from FixtureCollector) as zstd-compressed Parquet.
+
+        Types are preserved (integer ids, timestamp dates), so reloading does
+        not re-infer them the way reading fixtures_list.json does.
+
+        Args:
+            fixtures: Fixture metadata dictionaries
+            filepath: Path of the Parquet file to write
+
+        Returns:
+            Path of the written file, or None if pyarrow is not installed
+
+        Example:
+            >>> DataProcessor.save_fixtures_parquet(fixtures, "data/raw/fixtures_list.parquet")
+            PosixPath('data/raw/fixtures_list.parquet')
+        """
+        table = DataProcessor._records_to_table(fixtures, DataProcessor.FIXTURE_METADATA_COLUMNS)
+        if table is None:
+            return None
+
+        import pyarrow.parquet as pq
+
+        filepath = Path(filepath)
+        pq.write_table(table, filepath, compression="zstd")
+        return filepath
+
+    @staticmethod
+    def load_fixtures_parquet(filepath: Union[str, Path]) -> pd.DataFrame:
+        """
+        Load fixture metadata written by save_fixtures_parquet.
+
+        Args:
+            filepath: Path to the Parquet file
+
+        Returns:
+            DataFrame with Arrow-backed dtypes
+        """
+        return pd.read_parquet(filepath, dtype_backend="pyarrow")
+
     @staticmethod
     def fixtures_to_dataframe(fixtures_data: dict[str, Any]) -> pd.DataFrame:
         """
         Convert fixtures JSON data to a pandas DataFrame.
 
+        Uses Arrow-backed dtypes for known fixture fields when pyarrow is
+        installed (see FIXTURE_COLUMNS).
+
         Args:
             fixtures_data: Raw fixtures data from API
 
@@ -23,13 +196,16 @@ class DataProcessor:
             return pd.DataFrame()
 
         fixtures = fixtures_data["data"]
-        return pd.DataFrame(fixtures)
+        return DataProcessor._records_to_dataframe(fixtures, DataProcessor.FIXTURE_COLUMNS)
 
     @staticmethod
     def teams_to_dataframe(teams_data: dict[str, Any]) -> pd.DataFrame:
         """
         Convert teams JSON data to a pandas DataFrame.
 
+        Uses Arrow-backed dtypes for known team fields when pyarrow is
+        installed (see TEAM_COLUMNS).
+
         Args:
             teams_data: Raw teams data from API
 
@@ -40,7 +216,7 @@ class DataProcessor:
             return pd.DataFrame()
 
         teams = teams_data["data"]
-        return pd.DataFrame(teams)
+        return DataProcessor._records_to_dataframe(teams, DataProcessor.TEAM_COLUMNS)
 
     @staticmethod
     def calculate_team_stats(fixtures_df: pd.DataFrame, team_id: int) -> dict[str, Any]:
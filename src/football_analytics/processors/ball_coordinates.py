@@ -14,16 +14,138 @@ Key challenges solved:
 """
 
 import json
+import weakref
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+from ..utils.file_io import find_json
 from ..utils.file_io import load_json as load_json_file
+from ..utils.fixture_pool import map_fixtures
 from ..utils.logging_utils import get_logger
 
 
+@lru_cache(maxsize=32)
+def _load_coords_cached(path: str, mtime_ns: int) -> Optional[tuple]:
+    """
+    Load the coordinate records of a ballCoordinates file, reusing them on repeat calls.
+    
+    Keyed on the modification time as well as the path, so a re-collected
+    file is read again. Records are returned as a tuple of read-only
+    mappings so the cached copy cannot be modified; None if the file holds
+    no coordinate list.
+    """
+    coords_data = load_json_file(path)
+    
+    # Extract coordinates from API response - handle nested structure
+    if "data" in coords_data and isinstance(coords_data["data"], dict):
+        # API response structure: data.data.ballcoordinates
+        coords_list = coords_data["data"].get("ballcoordinates", [])
+    elif "data" in coords_data:
+        coords_list = coords_data["data"]
+    else:
+        coords_list = coords_data
+    
+    if not isinstance(coords_list, list):
+        return None
+    return tuple(MappingProxyType(record) for record in coords_list)
+
+
+def _parse_fixture_coordinates(fixture_id: int, data_dir: str) -> pd.DataFrame:
+    """Parse one fixture in a worker process (module-level so it pickles)."""
+    return BallCoordinateProcessor(data_dir).parse_coordinates(fixture_id)
+
+
+# id(coords_df) -> (weak reference to coords_df, CoordIndex over it); see
+# CoordIndex.for_frame
+_COORD_INDEXES: dict[int, tuple[weakref.ref, "CoordIndex"]] = {}
+
+# Ordered categories for the possession_confidence column
+POSSESSION_CONFIDENCE_DTYPE = pd.CategoricalDtype(["low", "medium", "high"], ordered=True)
+
+# Maps _classify_possession confidence codes (0=high, 1=medium, 2=low) to
+# category codes of POSSESSION_CONFIDENCE_DTYPE; -1 (no prior event) -> NA
+_CONFIDENCE_CATEGORY_CODES = np.array([2, 1, 0, -1], dtype=np.int8)
+
+
+def _classify_possession_numpy(
+    time_since: np.ndarray,
+    last_team: np.ndarray,
+    high: float,
+    medium: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Assign possession team and confidence code per coordinate.
+    
+    A coordinate takes the team of the last possession event; confidence
+    comes from the time since that event.
+    
+    Args:
+        time_since: Minutes since the previous event (NaN if none)
+        last_team: Team of the previous event
+        high: High-confidence threshold in minutes
+        medium: Medium-confidence threshold in minutes
+    
+    Returns:
+        Tuple of (team ids as float64, confidence codes 0/1/2 or -1 as int8)
+    """
+    code = np.select(
+        [time_since < high, time_since < medium, ~np.isnan(time_since)], [0, 1, 2], default=-1
+    ).astype(np.int8)
+    return last_team, code
+
+
+def _classify_possession_loop(time_since, last_team, high, medium):
+    """Single-pass equivalent of _classify_possession_numpy, compiled with numba."""
+    n = time_since.shape[0]
+    code = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        elapsed = time_since[i]
+        if np.isnan(elapsed):
+            code[i] = -1
+        elif elapsed < high:
+            code[i] = 0
+        elif elapsed < medium:
+            code[i] = 1
+        else:
+            code[i] = 2
+    return last_team, code
+
+
+def _distance_to_goal_fused(x, y):
+    """Distance to goal (1.0, 0.5); compiled with parallel=True, one fused threaded loop."""
+    dx = x - 1.0
+    dy = y - 0.5
+    return np.sqrt(dx * dx + dy * dy)
+
+
+@lru_cache(maxsize=None)
+def _jit(func, **options):
+    """
+    Compile func with numba on first use, or return None without numba.
+    
+    numba is imported here rather than at module load, where it would slow
+    down every import of the processors (and every fixture_pool worker),
+    including ones that never use a compiled kernel. Compiled kernels are
+    cached on disk by numba.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(**options)(func)
+
+
+def _classify_possession(time_since, last_team, high, medium):
+    """Classify with the fused numba loop when installed, otherwise with NumPy."""
+    compiled = _jit(_classify_possession_loop, cache=True, nogil=True)
+    return (compiled or _classify_possession_numpy)(time_since, last_team, high, medium)
+
+
 class BallCoordinateProcessor:
     """
     Process and enrich ball coordinate data.
@@ -46,17 +168,39 @@ class BallCoordinateProcessor:
     ATTACKING_THIRD_X = 0.67
     LEFT_WING_Y = 0.25
     RIGHT_WING_Y = 0.75
+    # Threshold arrays built once for np.searchsorted, with the zone names
+    # each resulting index maps to. NumPy orders NaN after every number, so
+    # the trailing NaN threshold sends NaN coordinates (and only those) to
+    # the final "unknown" label without a separate isnan mask
+    PITCH_ZONE_THRESHOLDS = np.array([DEFENSIVE_THIRD_X, ATTACKING_THIRD_X, np.nan])
+    WIDTH_ZONE_THRESHOLDS = np.array([LEFT_WING_Y, RIGHT_WING_Y, np.nan])
+    PITCH_ZONE_LABELS = np.array(
+        ["defensive_third", "middle_third", "attacking_third", "unknown"], dtype=object
+    )
+    WIDTH_ZONE_LABELS = np.array(
+        ["left_wing", "center", "right_wing", "unknown"], dtype=object
+    )
     
     # Possession inference thresholds (in minutes)
     POSSESSION_HIGH_CONFIDENCE_THRESHOLD = 0.17  # 10 seconds
     POSSESSION_MEDIUM_CONFIDENCE_THRESHOLD = 0.33  # 20 seconds
     POSSESSION_TURNOVER_WINDOW = 0.33  # 20 seconds
     
+    # Event types containing any of these (case-insensitive) mark possession
+    POSSESSION_EVENT_KEYWORDS = (
+        "pass", "shot", "cross", "dribble", "touch",
+        "goal_kick", "throw_in", "corner", "free_kick"
+    )
+    
     # Validation constants
     MIN_FIXTURE_ID = 1
+    REQUIRED_COORDINATE_FIELDS = ("x", "y")
     ASSUMED_MATCH_DURATION = 95  # minutes (90 + ~5 stoppage)
     TIMER_DATA_THRESHOLD = 0.8  # 80% of coordinates must have timer data
     
+    # Coordinate count above which distances use the compiled kernel (if numba)
+    NJIT_DISTANCE_MIN_ROWS = 10_000
+    
     def __init__(self, data_dir: str = "data/raw"):
         """Initialize ball coordinate processor."""
         self.data_dir = Path(data_dir)
@@ -85,87 +229,118 @@ class BallCoordinateProcessor:
         
         # Load raw JSON
         fixture_dir = self.data_dir / str(fixture_id)
-        coords_file = fixture_dir / "ballCoordinates.json"
+        coords_file = find_json(fixture_dir / "ballCoordinates.json")
         
         if not coords_file.exists():
             self.logger.error(f"Ball coordinates not found for fixture {fixture_id}")
             return pd.DataFrame()
         
         try:
-            coords_data = load_json_file(coords_file)
+            coords_list = _load_coords_cached(str(coords_file), coords_file.stat().st_mtime_ns)
         except Exception as e:
             self.logger.error(f"Failed to load ball coordinates for fixture {fixture_id}: {e}")
             return pd.DataFrame()
         
-        # Extract coordinates from API response - handle nested structure
-        if "data" in coords_data and isinstance(coords_data["data"], dict):
-            # API response structure: data.data.ballcoordinates
-            coords_list = coords_data["data"].get("ballcoordinates", [])
-        elif "data" in coords_data:
-            coords_list = coords_data["data"]
-        else:
-            coords_list = coords_data
-
-        if not coords_list or not isinstance(coords_list, list):
+        if not coords_list:
             self.logger.warning(f"No ball coordinates in file for fixture {fixture_id}")
             return pd.DataFrame()
         
-        # Convert to DataFrame
+        # Convert to DataFrame (columns are the union of every record's
+        # fields), adding x/y as missing if no record has them since
+        # everything below relies on them
         try:
-            df = pd.DataFrame(coords_list)
+            df = pd.DataFrame(list(coords_list))
+            missing = [col for col in self.REQUIRED_COORDINATE_FIELDS if col not in df.columns]
+            if missing:
+                df = df.reindex(columns=[*df.columns, *missing])
         except Exception as e:
             self.logger.error(f"Failed to create DataFrame from coordinates: {e}")
             return pd.DataFrame()
         
+        # Collect every converted/derived column and attach them in a single
+        # assign rather than growing the frame one column at a time
+        derived = {}
+        
         # Convert data types
-        df["x"] = pd.to_numeric(df["x"], errors="coerce")
-        df["y"] = pd.to_numeric(df["y"], errors="coerce")
-        df["fixture_id"] = fixture_id
+        # Numeric JSON (the usual case) casts directly; only mixed/object
+        # columns need the slower element-wise coercion
+        for col in ("x", "y"):
+            values = df[col]
+            if pd.api.types.is_numeric_dtype(values):
+                derived[col] = values.to_numpy(dtype=np.float64)
+            else:
+                derived[col] = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
+        derived["fixture_id"] = np.full(len(df), fixture_id, dtype=np.int64)
         
         # Add sequence number if not present
         if "sequence" not in df.columns:
-            df["sequence"] = range(len(df))
+            derived["sequence"] = np.arange(len(df))
         
         # Parse timer if available (e.g., "45:32" -> minute=45, second=32)
         if "timer" in df.columns:
-            df = self._parse_timer(df)
+            derived.update(self._parse_timer(df["timer"]))
         
         # Derive pitch zones
-        df["pitch_zone"] = df["x"].apply(self.categorize_pitch_zone)
-        df["width_zone"] = df["y"].apply(self.categorize_width_zone)
-        df["distance_to_goal"] = df.apply(self.calculate_distance_to_goal, axis=1)
+        x, y = derived["x"], derived["y"]
+        derived["pitch_zone"] = self._categorize_pitch_zone_vec(x)
+        derived["width_zone"] = self._categorize_width_zone_vec(y)
+        derived["distance_to_goal"] = self._distance_to_goal_vec(x, y)
+        
+        df = df.assign(**derived)
         
         self.logger.info(f"Parsed {len(df)} ball coordinates for fixture {fixture_id}")
         
         return df
     
-    def _parse_timer(self, df: pd.DataFrame) -> pd.DataFrame:
+    @classmethod
+    def parse_coordinates_batch(
+        cls,
+        fixture_ids: list[int],
+        data_dir: str = "data/raw",
+        max_workers: Optional[int] = None,
+    ) -> list[pd.DataFrame]:
         """
-        Parse timer field into minute and second columns.
+        Parse ball coordinates for many fixtures across worker processes.
+        
+        Fixtures share no state, so each is parsed independently in a
+        process pool (see utils.fixture_pool.map_fixtures). Workers are
+        spawned, so scripts calling this must guard their entry point with
+        ``if __name__ == "__main__":``.
         
         Args:
-            df: DataFrame with timer column
+            fixture_ids: Fixture IDs to process
+            data_dir: Base directory containing raw data
+            max_workers: Worker processes (default: CPU count)
         
         Returns:
-            DataFrame with minute and second columns added
-        """
-        def parse_time(timer_str):
-            """Parse '45:32' -> (45, 32)"""
-            if pd.isna(timer_str) or not isinstance(timer_str, str):
-                return pd.Series([None, None])
-            
-            try:
-                parts = timer_str.split(":")
-                if len(parts) == 2:
-                    return pd.Series([int(parts[0]), int(parts[1])])
-            except (ValueError, AttributeError):
-                pass
-            
-            return pd.Series([None, None])
-        
-        df[["minute", "second"]] = df["timer"].apply(parse_time)
+            One DataFrame per fixture, in the order of fixture_ids (empty
+            where parse_coordinates found nothing to parse)
         
-        return df
+        Example:
+            >>> frames = BallCoordinateProcessor.parse_coordinates_batch([18841624, 18841625])
+            >>> print(sum(len(df) for df in frames))
+        """
+        return map_fixtures(_parse_fixture_coordinates, fixture_ids, data_dir, max_workers)
+    
+    def _parse_timer(self, timer: pd.Series) -> dict:
+        """
+        Parse timer values into minute and second columns.
+        
+        Args:
+            timer: Timer values (e.g., "45:32")
+        
+        Returns:
+            Dict with float64 "minute" and "second" arrays (NaN where the
+            timer is missing or not of the form "45:32")
+        """
+        # Missing, numeric or malformed timers fail the match and become NaN
+        parts = timer.astype("string").str.extract(r"^(\d+):(\d+)$")
+        return {
+            name: pd.to_numeric(parts[i], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            for i, name in enumerate(("minute", "second"))
+        }
     
     def categorize_pitch_zone(self, x: float) -> str:
         """
@@ -192,6 +367,21 @@ class BallCoordinateProcessor:
         else:
             return "attacking_third"
     
+    def _categorize_pitch_zone_vec(self, x: np.ndarray) -> np.ndarray:
+        """
+        Categorize an array of X coordinates into pitch thirds in one pass.
+        
+        Same thresholds as categorize_pitch_zone; NaN maps to "unknown".
+        
+        Args:
+            x: Normalized X coordinates
+        
+        Returns:
+            Object array of zone names
+        """
+        idx = np.searchsorted(self.PITCH_ZONE_THRESHOLDS, x, side="right")
+        return self.PITCH_ZONE_LABELS[idx]
+    
     def categorize_width_zone(self, y: float) -> str:
         """
         Categorize Y coordinate into width zones.
@@ -217,6 +407,21 @@ class BallCoordinateProcessor:
         else:
             return "right_wing"
     
+    def _categorize_width_zone_vec(self, y: np.ndarray) -> np.ndarray:
+        """
+        Categorize an array of Y coordinates into width zones in one pass.
+        
+        Same thresholds as categorize_width_zone; NaN maps to "unknown".
+        
+        Args:
+            y: Normalized Y coordinates
+        
+        Returns:
+            Object array of zone names
+        """
+        idx = np.searchsorted(self.WIDTH_ZONE_THRESHOLDS, y, side="right")
+        return self.WIDTH_ZONE_LABELS[idx]
+    
     def calculate_distance_to_goal(self, row: pd.Series) -> float:
         """
         Calculate distance from ball to attacking goal.
@@ -238,12 +443,36 @@ class BallCoordinateProcessor:
         if pd.isna(x) or pd.isna(y):
             return np.nan
         
-        # Goal is at x=1.0, y=0.5 (center)
-        goal_x, goal_y = 1.0, 0.5
+        return float(self._distance_to_goal_vec(x, y))
+    
+    def _distance_to_goal_vec(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Distance to the attacking goal for arrays of coordinates.
+        
+        NaN coordinates propagate to NaN distances.
+        
+        Large arrays go through a numba kernel (when installed) that fuses
+        the subtract/square/add/sqrt passes into one parallel loop.
         
-        distance = np.sqrt((x - goal_x)**2 + (y - goal_y)**2)
+        Args:
+            x: Normalized X coordinates
+            y: Normalized Y coordinates
+        
+        Returns:
+            Distances to goal (normalized 0-1)
+        """
+        if np.size(x) > self.NJIT_DISTANCE_MIN_ROWS:
+            kernel = _jit(_distance_to_goal_fused, parallel=True, cache=True)
+            if kernel is not None:
+                return kernel(
+                    np.ascontiguousarray(x, dtype=np.float64),
+                    np.ascontiguousarray(y, dtype=np.float64),
+                )
         
-        return distance
+        # Goal is at x=1.0, y=0.5 (center)
+        dx = x - 1.0
+        dy = y - 0.5
+        return np.sqrt(dx * dx + dy * dy)
     
     def solve_timestamp_problem(
         self,
@@ -298,41 +527,32 @@ class BallCoordinateProcessor:
         Returns:
             Coordinates with estimated_minute
         """
-        coords_df["estimated_minute"] = np.nan
-        
-        for period_id in coords_df["period_id"].unique():
-            if pd.isna(period_id):
-                continue
-            
-            period_coords = coords_df["period_id"] == period_id
-            period_events = events_df[events_df["period_id"] == period_id]
-            
-            if len(period_events) == 0:
-                continue
-            
-            # Get time range from events
-            min_minute = period_events["minute"].min()
-            max_minute = period_events["minute"].max()
-            duration = max_minute - min_minute
-            
-            if duration <= 0:
-                self.logger.warning(f"Period {period_id}: Invalid duration ({duration}), using default 45 minutes")
-                duration = 45  # Default period duration
-            
-            # Map sequence within period to time
-            period_mask = coords_df["period_id"] == period_id
-            period_sequences = coords_df.loc[period_mask, "sequence"]
-            
-            if len(period_sequences) > 0:
-                # Normalize sequences within period
-                period_seq_min = period_sequences.min()
-                period_seq_max = period_sequences.max()
-                period_seq_range = period_seq_max - period_seq_min
-                
-                if period_seq_range > 0:
-                    normalized_seq = (period_sequences - period_seq_min) / period_seq_range
-                    estimated_time = min_minute + (normalized_seq * duration)
-                    coords_df.loc[period_mask, "estimated_minute"] = estimated_time
+        # Per-period event time range, broadcast onto the coordinates
+        period_minutes = events_df.groupby("period_id")["minute"].agg(["min", "max"])
+        duration = period_minutes["max"] - period_minutes["min"]
+        
+        invalid = (duration <= 0) & duration.index.isin(coords_df["period_id"].unique())
+        for period_id, bad_duration in duration[invalid].items():
+            self.logger.warning(
+                f"Period {period_id}: Invalid duration ({bad_duration}), using default 45 minutes"
+            )
+        duration = duration.mask(duration <= 0, 45)  # Default period duration
+        
+        periods = coords_df["period_id"]
+        min_minute = periods.map(period_minutes["min"])
+        period_duration = periods.map(duration)
+        
+        # Normalize sequences within each period; a single-sequence period
+        # has no range and is left unestimated
+        sequences = coords_df.groupby("period_id")["sequence"]
+        seq_min = sequences.transform("min")
+        seq_range = sequences.transform("max") - seq_min
+        seq_range = seq_range.where(seq_range > 0)
+        
+        normalized_seq = (coords_df["sequence"] - seq_min) / seq_range
+        coords_df["estimated_minute"] = (min_minute + normalized_seq * period_duration).astype(
+            "float64"
+        )
         
         return coords_df
     
@@ -362,15 +582,22 @@ class BallCoordinateProcessor:
         self,
         event: pd.Series,
         coords_df: pd.DataFrame,
-        tolerance_seconds: float = 5.0
+        tolerance_seconds: float = 5.0,
+        index: Optional["CoordIndex"] = None
     ) -> Optional[pd.Series]:
         """
         Find closest ball coordinate to an event.
         
+        When linking many events against the same coordinates, build a
+        CoordIndex once and pass it in; each lookup is then a binary search
+        instead of a scan of coords_df.
+        
         Args:
             event: Event series with minute field
             coords_df: Coordinates with estimated_minute
             tolerance_seconds: Maximum time difference to accept (seconds)
+            index: Prebuilt CoordIndex over coords_df (memoized on coords_df
+                if omitted)
         
         Returns:
             Coordinate row or None if not found
@@ -390,20 +617,10 @@ class BallCoordinateProcessor:
         if not isinstance(tolerance_seconds, (int, float)) or tolerance_seconds <= 0:
             raise ValueError(f"Invalid tolerance_seconds: {tolerance_seconds}. Must be a positive number.")
         
-        tolerance_minutes = tolerance_seconds / 60
-        
-        # Find coordinates within tolerance
-        time_diff = abs(coords_df["estimated_minute"] - event_minute)
-        within_tolerance = coords_df[time_diff <= tolerance_minutes]
+        if index is None:
+            index = CoordIndex.for_frame(coords_df)
         
-        if len(within_tolerance) == 0:
-            return None
-        
-        # Return closest one
-        closest_idx = time_diff[within_tolerance.index].idxmin()
-        closest = coords_df.loc[closest_idx]
-        
-        return closest
+        return index.query(event_minute, tolerance_seconds / 60)
     
     def infer_possession(
         self,
@@ -434,19 +651,11 @@ class BallCoordinateProcessor:
         # Validate inputs
         if len(coords_df) == 0 or len(events_df) == 0:
             self.logger.warning("Cannot infer possession: empty DataFrames")
-            coords_df["possession_team"] = pd.NA
-            coords_df["possession_confidence"] = pd.NA
+            self._set_possession_columns(coords_df)
             return coords_df
         
         # Initialize possession columns
-        coords_df["possession_team"] = pd.NA
-        coords_df["possession_confidence"] = pd.NA
-        
-        # Possession-indicating events
-        possession_events = [
-            "pass", "shot", "cross", "dribble", "touch",
-            "goal_kick", "throw_in", "corner", "free_kick"
-        ]
+        self._set_possession_columns(coords_df)
         
         # Filter for possession events
         if "type_name" in events_df.columns:
@@ -457,52 +666,58 @@ class BallCoordinateProcessor:
             self.logger.warning("No event type column found - cannot infer possession")
             return coords_df
         
-        poss_events = events_df[
-            events_df[type_col].str.lower().str.contains("|".join(possession_events), na=False)
-        ].copy()
+        # Match keywords against each distinct type name once, then select
+        # rows with a vectorized isin instead of a regex over every row
+        event_types = events_df[type_col]
+        possession_types = [
+            name for name in event_types.dropna().unique()
+            if isinstance(name, str)
+            and any(keyword in name.lower() for keyword in self.POSSESSION_EVENT_KEYWORDS)
+        ]
+        poss_events = events_df[event_types.isin(possession_types)].copy()
         
         if len(poss_events) == 0:
             self.logger.warning("No possession events found for inference")
             return coords_df
         
-        poss_events = poss_events.sort_values("minute").reset_index(drop=True)
+        # Stable sort, tie-broken by sort_order, so same-minute events keep
+        # one order whatever the minute dtype (merge_asof takes the last one)
+        sort_by = ["minute", "sort_order"] if "sort_order" in poss_events.columns else ["minute"]
+        poss_events = poss_events.sort_values(sort_by, kind="stable").reset_index(drop=True)
         
         # Use merge_asof for efficient nearest-neighbor matching (vectorized approach)
-        coords_with_time = coords_df[coords_df["estimated_minute"].notna()].copy()
+        # on the sorted coordinate times, shared with event linking
+        coord_index = CoordIndex.for_frame(coords_df)
         
-        if len(coords_with_time) == 0:
+        if len(coord_index.positions) == 0:
             self.logger.warning("No coordinates with estimated_minute for possession inference")
             return coords_df
         
-        # Sort for merge_asof
-        coords_with_time = coords_with_time.sort_values("estimated_minute").reset_index()
+        left = pd.DataFrame({"estimated_minute": coord_index.sorted_times})
+        events = poss_events[["minute", "team_id"]].astype({"minute": "float64"})
         
         # Find closest previous event for each coordinate
-        merged = pd.merge_asof(
-            coords_with_time[["index", "estimated_minute"]],
-            poss_events[["minute", "team_id"]],
-            left_on="estimated_minute",
-            right_on="minute",
-            direction="backward",
-            suffixes=("", "_event")
+        last = pd.merge_asof(
+            left, events, left_on="estimated_minute", right_on="minute", direction="backward"
         )
         
-        # Calculate time since last event
-        merged["time_since_event"] = merged["estimated_minute"] - merged["minute"]
+        time_since = (last["estimated_minute"] - last["minute"]).to_numpy()
+        last_team = last["team_id"].to_numpy(dtype="float64", na_value=np.nan)
         
-        # Assign confidence based on time proximity using vectorized operations
-        conditions = [
-            merged["time_since_event"] < self.POSSESSION_HIGH_CONFIDENCE_THRESHOLD,
-            (merged["time_since_event"] >= self.POSSESSION_HIGH_CONFIDENCE_THRESHOLD) & 
-            (merged["time_since_event"] < self.POSSESSION_MEDIUM_CONFIDENCE_THRESHOLD),
-            merged["time_since_event"] >= self.POSSESSION_MEDIUM_CONFIDENCE_THRESHOLD
-        ]
-        choices = ["high", "medium", "low"]
-        merged["possession_confidence"] = np.select(conditions, choices, default=pd.NA)
+        possession_team, confidence_code = _classify_possession(
+            time_since,
+            last_team,
+            self.POSSESSION_HIGH_CONFIDENCE_THRESHOLD,
+            self.POSSESSION_MEDIUM_CONFIDENCE_THRESHOLD,
+        )
         
-        # Update coords_df with inferred possession
-        coords_df.loc[merged["index"], "possession_team"] = merged["team_id"].values
-        coords_df.loc[merged["index"], "possession_confidence"] = merged["possession_confidence"].values
+        # Scatter results back to coordinate row order and assign each column once
+        positions = coord_index.positions
+        team = np.full(len(coords_df), np.nan)
+        team[positions] = possession_team
+        code = np.full(len(coords_df), -1, dtype=np.int8)
+        code[positions] = confidence_code
+        self._set_possession_columns(coords_df, team, code)
         
         # Count possession inference success
         inferred_count = coords_df["possession_team"].notna().sum()
@@ -512,6 +727,31 @@ class BallCoordinateProcessor:
         
         return coords_df
     
+    @staticmethod
+    def _set_possession_columns(
+        coords_df: pd.DataFrame,
+        team: Optional[np.ndarray] = None,
+        confidence_code: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Store possession results as nullable Int64 team and ordered categorical confidence.
+        
+        Args:
+            coords_df: Coordinates to update in place
+            team: Float team IDs per row (NaN = unknown); all NA if omitted
+            confidence_code: _classify_possession codes per row; all NA if omitted
+        """
+        if team is None:
+            team = np.full(len(coords_df), np.nan)
+        if confidence_code is None:
+            confidence_code = np.full(len(coords_df), -1, dtype=np.int8)
+        
+        coords_df["possession_team"] = pd.array(team, dtype="Int64")
+        coords_df["possession_confidence"] = pd.Categorical.from_codes(
+            _CONFIDENCE_CATEGORY_CODES[confidence_code],
+            dtype=POSSESSION_CONFIDENCE_DTYPE,
+        )
+    
     def validate_possession_inference(
         self,
         coords_df: pd.DataFrame,
@@ -543,8 +783,10 @@ class BallCoordinateProcessor:
                 raise ValueError(f"Invalid official_possession: {official_possession}. Must be between 0 and 100.")
         
         # Calculate possession from coordinates
-        total_coords = len(coords_df)
-        liverpool_coords = (coords_df["possession_team"] == liverpool_team_id).sum()
+        # Count straight off the values; NA never equals a team ID
+        team = coords_df["possession_team"].to_numpy(dtype=np.float64, na_value=np.nan)
+        total_coords = team.size
+        liverpool_coords = np.count_nonzero(team == liverpool_team_id)
         
         if total_coords == 0:
             return {"validation": "ERROR - No coordinates"}
@@ -573,3 +815,140 @@ class BallCoordinateProcessor:
             "difference": difference,
             "validation": validation
         }
+
+
+class CoordIndex:
+    """
+    Sorted index over coordinate times for nearest-coordinate lookups.
+    
+    Sorts estimated_minute once so each query is an O(log N) binary
+    search rather than an O(N) scan of the coordinates. Use for_frame to
+    share one index between event linking and possession inference.
+    
+    Args:
+        coords_df: Coordinates with estimated_minute
+    
+    Example:
+        >>> index = CoordIndex.for_frame(coords_df)
+        >>> coord = index.query(23.5, tolerance_minutes=5 / 60)
+    """
+    
+    def __init__(self, coords_df: pd.DataFrame):
+        """Build the sorted time index, skipping coordinates without a time."""
+        column = coords_df["estimated_minute"]
+        # View of the column's storage, used by for_frame to spot reassignment
+        self.source = column.to_numpy()
+        times = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        positions = np.flatnonzero(~np.isnan(times))
+        # Stable sort keeps equal times in row order, so ties resolve to
+        # the earliest row
+        order = np.argsort(times[positions], kind="stable")
+        # Held weakly so the for_frame memo doesn't keep the frame alive
+        self._frame_ref = weakref.ref(coords_df)
+        self.positions = positions[order]
+        self.sorted_times = times[self.positions]
+    
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The indexed coordinates."""
+        frame = self._frame_ref()
+        if frame is None:
+            raise ReferenceError("Indexed coordinates DataFrame no longer exists")
+        return frame
+    
+    @classmethod
+    def for_frame(cls, coords_df: pd.DataFrame) -> "CoordIndex":
+        """
+        Get the index for coords_df, building and memoizing it on first use.
+        
+        The index is memoized per DataFrame (outside the frame, so it never
+        reaches attrs or serialization), rebuilt if estimated_minute has
+        been reassigned since, and dropped when the DataFrame is garbage
+        collected. In-place edits to estimated_minute are not detected; call
+        invalidate after making them.
+        
+        Args:
+            coords_df: Coordinates with estimated_minute
+        
+        Returns:
+            CoordIndex over coords_df
+        """
+        key = id(coords_df)
+        source = coords_df["estimated_minute"].to_numpy()
+        
+        cached = _COORD_INDEXES.get(key)
+        if cached is not None:
+            frame_ref, index = cached
+            if (
+                frame_ref() is coords_df
+                and len(index.source) == len(source)
+                and np.may_share_memory(index.source, source)
+            ):
+                return index
+        
+        index = cls(coords_df)
+        _COORD_INDEXES[key] = (
+            weakref.ref(coords_df, lambda _, key=key: _COORD_INDEXES.pop(key, None)),
+            index,
+        )
+        return index
+    
+    @classmethod
+    def invalidate(cls, coords_df: pd.DataFrame) -> None:
+        """Drop any index memoized for coords_df by for_frame."""
+        _COORD_INDEXES.pop(id(coords_df), None)
+    
+    def query(self, minute: float, tolerance_minutes: float) -> Optional[pd.Series]:
+        """
+        Find the coordinate closest in time to a minute.
+        
+        Args:
+            minute: Event time in minutes
+            tolerance_minutes: Maximum time difference to accept
+        
+        Returns:
+            Coordinate row or None if none is within tolerance
+        """
+        position = self.query_positions(np.array([minute], dtype=np.float64), tolerance_minutes)[0]
+        if position < 0:
+            return None
+        return self.frame.iloc[position]
+    
+    def query_positions(self, minutes: np.ndarray, tolerance_minutes: float) -> np.ndarray:
+        """
+        Find the closest coordinate for every minute in one vectorized pass.
+        
+        Ties go to the earliest coordinate row, as in query.
+        
+        Args:
+            minutes: Event times in minutes (NaN never matches)
+            tolerance_minutes: Maximum time difference to accept
+        
+        Returns:
+            Row positions into the coordinates, -1 where nothing is within
+            tolerance
+        """
+        minutes = np.asarray(minutes, dtype=np.float64)
+        result = np.full(minutes.shape, -1, dtype=np.int64)
+        sorted_times = self.sorted_times
+        n = len(sorted_times)
+        if n == 0:
+            return result
+        
+        # The nearest time is either side of the insertion point; for each,
+        # take the first entry with that time (earliest row among equals)
+        i = np.searchsorted(sorted_times, minutes)
+        before = np.maximum(i - 1, 0)
+        after = np.minimum(i, n - 1)
+        diff_before = np.where(i > 0, np.abs(sorted_times[before] - minutes), np.inf)
+        diff_after = np.where(i < n, np.abs(sorted_times[after] - minutes), np.inf)
+        position_before = self.positions[np.searchsorted(sorted_times, sorted_times[before])]
+        position_after = self.positions[np.searchsorted(sorted_times, sorted_times[after])]
+        
+        take_after = (diff_after < diff_before) | (
+            (diff_after == diff_before) & (position_after < position_before)
+        )
+        best_diff = np.where(take_after, diff_after, diff_before)
+        matched = ~np.isnan(minutes) & (best_diff <= tolerance_minutes)
+        result[matched] = np.where(take_after, position_after, position_before)[matched]
+        return result
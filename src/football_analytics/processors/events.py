@@ -13,14 +13,88 @@ Key features:
 - Team action analysis
 """
 
+import io
+import re
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+import orjson
 import pandas as pd
 
-from ..utils.file_io import load_json as load_json_file
+from ..utils.file_io import find_json, read_json_bytes
+from ..utils.fixture_pool import map_fixtures
+from ..utils.frame_dtypes import arrow_string_columns, downcast_columns
+from ..utils.frame_cache import cached_frame
+from ..utils.frame_index import select_rows, value_counts_dict
 from ..utils.logging_utils import get_logger
 
+# Ordered categories for the link_confidence column
+LINK_CONFIDENCE_DTYPE = pd.CategoricalDtype(["low", "medium", "high"], ordered=True)
+
+
+def _parse_fixture_events(fixture_id: int, data_dir: str) -> pd.DataFrame:
+    """Parse one fixture in a worker process (module-level so it pickles)."""
+    return EventProcessor(data_dir).parse_events(fixture_id)
+
+
+def _read_events_arrow(payload: bytes) -> Optional[pd.DataFrame]:
+    """
+    Decode an events payload into flattened columns with pyarrow.
+    
+    Arrow parses the JSON in C++ and builds the columns directly, skipping
+    the intermediate Python dicts. Nested objects are flattened one level to
+    dotted columns, as pd.json_normalize(max_level=1) does.
+    
+    Args:
+        payload: Raw events JSON ({"data": {"events": [...]}} or {"data": [...]})
+    
+    Returns:
+        DataFrame with one row per event, or None if pyarrow is not installed
+        or the payload doesn't fit Arrow's schema inference (e.g. a field that
+        is an object in some events and a string in others)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.json as paj
+    except ImportError:
+        return None
+    
+    try:
+        # The payload is one (possibly multi-line) JSON object, so it must
+        # fit a single block
+        table = paj.read_json(
+            io.BytesIO(payload),
+            read_options=paj.ReadOptions(block_size=len(payload) + 1),
+            parse_options=paj.ParseOptions(newlines_in_values=True),
+        )
+        if table.num_rows != 1 or "data" not in table.column_names:
+            return None
+        
+        data = table.column("data").combine_chunks()
+        if pa.types.is_struct(data.type):
+            if data.type.get_field_index("events") < 0:
+                return None
+            data = data.field("events")
+        if not pa.types.is_list(data.type) or not pa.types.is_struct(data.type.value_type):
+            return None
+        
+        events = data.flatten()
+        events = events.filter(events.is_valid())
+        flat = pa.Table.from_struct_array(events).flatten()
+        del table, data, events
+        
+        # Fields that are always null come back untyped; read them as NaN
+        # floats, as json_normalize does
+        for i, field in enumerate(flat.schema):
+            if pa.types.is_null(field.type):
+                flat = flat.set_column(i, field.name, flat.column(i).cast(pa.float64()))
+        
+        # Free each Arrow column as soon as it has been converted
+        return flat.to_pandas(split_blocks=True, self_destruct=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
 
 class EventProcessor:
     """
@@ -31,6 +105,9 @@ class EventProcessor:
     
     Args:
         data_dir: Base directory containing raw data
+        cache_parsed: Cache parsed DataFrames in pickle sidecars next to the
+            raw files (see utils.frame_cache); off by default since sidecars
+            are unpickled from the data directory
     
     Example:
         >>> processor = EventProcessor()
@@ -54,11 +131,42 @@ class EventProcessor:
     SET_PIECES = ["corner", "free_kick", "throw_in", "goal_kick"]
     GOAL_RELATED = ["goal", "assist", "shot", "shot_on_target", "penalty"]
     
-    def __init__(self, data_dir: str = "data/raw"):
+    # Low-cardinality string columns stored as pandas categoricals
+    CATEGORICAL_COLUMNS = ["event_type", "event_category", "team_name", "player_name"]
+    
+    # Narrow dtypes for numeric columns
+    NUMERIC_DTYPES = {
+        "minute": "Int16",
+        "extra_minute": "Int8",
+        "period_id": "Int8",
+        "event_type_id": "Int32",
+        "sort_order": "Int32",
+        "player_id": "UInt32",
+        "team_id": "UInt32",
+    }
+    
+    # Free-text columns stored as Arrow-backed strings
+    STRING_COLUMNS = ["result", "info"]
+    
+    def __init__(self, data_dir: str = "data/raw", cache_parsed: bool = False):
         """Initialize event processor."""
         self.data_dir = Path(data_dir)
+        self.cache_parsed = cache_parsed
         self.logger = get_logger(self.__class__.__name__)
+        
+        # One alternation per category, in priority order (first match wins)
+        self._category_patterns = {
+            category: re.compile("|".join(map(re.escape, keywords)))
+            for category, keywords in (
+                ("defensive_action", self.DEFENSIVE_ACTIONS),
+                ("passing", self.PASSING_EVENTS),
+                ("progressive", self.PROGRESSIVE_ACTIONS),
+                ("set_piece", self.SET_PIECES),
+                ("goal_related", self.GOAL_RELATED),
+            )
+        }
     
+    @cached_frame("events")
     def parse_events(self, fixture_id: int, season: Optional[str] = None) -> pd.DataFrame:
         """
         Extract and categorize events from match data.
@@ -81,114 +189,173 @@ class EventProcessor:
         
         # Load raw JSON
         fixture_dir = self.data_dir / str(fixture_id)
-        events_file = fixture_dir / "events.json"
+        events_file = find_json(fixture_dir / "events.json")
         
         if not events_file.exists():
             self.logger.error(f"Events file not found for fixture {fixture_id}")
             return pd.DataFrame()
         
         try:
-            events_data = load_json_file(events_file)
+            payload = read_json_bytes(events_file)
         except Exception as e:
             self.logger.error(f"Failed to load events file for fixture {fixture_id}: {e}")
             return pd.DataFrame()
         
-        # Extract events from API response - handle nested structure
-        if "data" in events_data and isinstance(events_data["data"], dict):
-            # API response structure: data.data.events
-            events_list = events_data["data"].get("events", [])
-        elif "data" in events_data:
-            events_list = events_data["data"]
-        else:
-            events_list = events_data
-
-        if not events_list or not isinstance(events_list, list):
+        # Decode straight into flattened columns with pyarrow when the payload
+        # allows it; otherwise parse with orjson and flatten the event dicts
+        raw = _read_events_arrow(payload)
+        
+        if raw is None:
+            try:
+                events_data = orjson.loads(payload)
+            except Exception as e:
+                self.logger.error(f"Failed to load events file for fixture {fixture_id}: {e}")
+                return pd.DataFrame()
+            
+            # Extract events from API response - handle nested structure
+            if "data" in events_data and isinstance(events_data["data"], dict):
+                # API response structure: data.data.events
+                events_list = events_data["data"].get("events", [])
+            elif "data" in events_data:
+                events_list = events_data["data"]
+            else:
+                events_list = events_data
+            
+            if not events_list or not isinstance(events_list, list):
+                self.logger.warning(f"No events in file for fixture {fixture_id}")
+                return pd.DataFrame()
+            
+            raw = self._flatten_events(events_list)
+        
+        if len(raw) == 0:
             self.logger.warning(f"No events in file for fixture {fixture_id}")
             return pd.DataFrame()
         
-        # Parse each event
-        parsed_events = []
-        for event in events_list:
-            parsed_event = self._parse_single_event(event, fixture_id)
-            if parsed_event:
-                parsed_events.append(parsed_event)
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(parsed_events)
+        # Map the flattened fields onto the event schema
+        try:
+            df = self._normalize_events(raw, fixture_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to parse events for fixture {fixture_id}: {e}")
+            return pd.DataFrame()
         
         if len(df) > 0:
-            # Add event categories
-            df["event_category"] = df["event_type"].apply(self.categorize_event)
-            
             # Sort by minute
             df = df.sort_values("minute").reset_index(drop=True)
             
+            # Minutes, periods and IDs fit in a fraction of float64's 8 bytes, and free
+            # text packs into an Arrow buffer
+            df = downcast_columns(df, self.NUMERIC_DTYPES)
+            df = arrow_string_columns(df, self.STRING_COLUMNS)
+            
+            # Repeated names take far less memory (and compare/group faster)
+            # as categoricals
+            for col in self.CATEGORICAL_COLUMNS:
+                if col in df.columns:
+                    df[col] = df[col].astype("category")
+            
+            # Add event categories, from the event type codes
+            df["event_category"] = self._categorize_events(df["event_type"])
+            
             self.logger.info(f"Parsed {len(df)} events for fixture {fixture_id}")
         
         return df
     
-    def _parse_single_event(self, event: dict, fixture_id: int) -> Optional[dict]:
+    @classmethod
+    def parse_events_batch(
+        cls,
+        fixture_ids: list[int],
+        data_dir: str = "data/raw",
+        max_workers: Optional[int] = None,
+    ) -> list[pd.DataFrame]:
         """
-        Parse a single event dict into structured format.
+        Parse events for many fixtures across worker processes.
+        
+        Fixtures share no state, so each is parsed independently in a
+        process pool (see utils.fixture_pool.map_fixtures). Workers are
+        spawned, so scripts calling this must guard their entry point with
+        ``if __name__ == "__main__":``.
         
         Args:
-            event: Raw event dictionary
-            fixture_id: Fixture ID
+            fixture_ids: Fixture IDs to process
+            data_dir: Base directory containing raw data
+            max_workers: Worker processes (default: CPU count)
         
         Returns:
-            Parsed event dictionary or None if invalid
+            One DataFrame per fixture, in the order of fixture_ids (empty
+            where parse_events found nothing to parse)
+        
+        Example:
+            >>> frames = EventProcessor.parse_events_batch([18841624, 18841625])
+            >>> season_events = pd.concat(frames, ignore_index=True)
         """
-        try:
-            # Extract event type (handle nested structure)
-            event_type_data = event.get("type", {})
-            if isinstance(event_type_data, dict):
-                event_type = event_type_data.get("name", "Unknown")
-                event_type_id = event_type_data.get("id")
-            else:
-                event_type = str(event_type_data) if event_type_data else "Unknown"
-                event_type_id = None
-            
-            # Extract player info (handle nested structure)
-            player_data = event.get("player", {})
-            if isinstance(player_data, dict):
-                player_id = player_data.get("id")
-                player_name = player_data.get("display_name", "Unknown")
-            else:
-                player_id = None
-                player_name = "Unknown"
-            
-            # Extract team info (handle nested structure)
-            participant_data = event.get("participant", {})
-            if isinstance(participant_data, dict):
-                team_id = participant_data.get("id")
-                team_name = participant_data.get("name", "Unknown")
-            else:
-                team_id = None
-                team_name = "Unknown"
-            
-            # Build parsed event
-            parsed_event = {
-                "event_id": event.get("id"),
-                "fixture_id": fixture_id,
-                "minute": event.get("minute"),
-                "extra_minute": event.get("extra_minute", 0),
-                "period_id": event.get("period_id"),
-                "event_type": event_type,
-                "event_type_id": event_type_id,
-                "player_id": player_id,
-                "player_name": player_name,
-                "team_id": team_id,
-                "team_name": team_name,
-                "result": event.get("result"),
-                "info": event.get("info"),
-                "sort_order": event.get("sort_order"),
-            }
-            
-            return parsed_event
+        return map_fixtures(_parse_fixture_events, fixture_ids, data_dir, max_workers)
+    
+    def _flatten_events(self, events_list: list) -> pd.DataFrame:
+        """
+        Flatten raw event dicts one level with pd.json_normalize.
         
-        except Exception as e:
-            self.logger.warning(f"Failed to parse event: {e}")
-            return None
+        Nested objects become dotted columns (e.g. type.name); the default
+        "." separator keeps player.id apart from a top-level player_id.
+        Entries that are not dicts are skipped.
+        
+        Args:
+            events_list: Raw event dictionaries
+        
+        Returns:
+            DataFrame with one row per event
+        """
+        records = [event for event in events_list if isinstance(event, dict)]
+        if len(records) < len(events_list):
+            self.logger.warning(f"Skipped {len(events_list) - len(records)} malformed events")
+        if not records:
+            return pd.DataFrame()
+        
+        return pd.json_normalize(records, max_level=1)
+    
+    def _normalize_events(self, raw: pd.DataFrame, fixture_id: int) -> pd.DataFrame:
+        """
+        Map flattened event fields onto the structured event schema.
+        
+        Missing type, player and team names read "Unknown".
+        
+        Args:
+            raw: Events flattened to dotted columns (e.g. type.name)
+            fixture_id: Fixture ID
+        
+        Returns:
+            DataFrame with one row per event
+        """
+        def column(name: str, default=None) -> pd.Series:
+            if name in raw.columns:
+                return raw[name]
+            return pd.Series(default, index=raw.index, dtype=object if default is None else None)
+        
+        event_type = column("type.name")
+        if "type" in raw.columns:
+            # Event type given as a plain value rather than a nested object
+            plain = raw["type"].dropna()
+            event_type = event_type.copy()
+            event_type[plain.index] = [str(value) if value else "Unknown" for value in plain]
+        
+        df = pd.DataFrame({
+            "event_id": column("id"),
+            "fixture_id": fixture_id,
+            "minute": column("minute"),
+            "extra_minute": column("extra_minute", 0).fillna(0),
+            "period_id": column("period_id"),
+            "event_type": event_type.fillna("Unknown"),
+            "event_type_id": column("type.id"),
+            "player_id": column("player.id"),
+            "player_name": column("player.display_name").fillna("Unknown"),
+            "team_id": column("participant.id"),
+            "team_name": column("participant.name").fillna("Unknown"),
+            "result": column("result"),
+            "info": column("info"),
+            "sort_order": column("sort_order"),
+        })
+        
+        # Filled-in defaults leave object columns; give them their natural dtype
+        return df.infer_objects()
     
     def categorize_event(self, event_type: str) -> str:
         """
@@ -212,18 +379,38 @@ class EventProcessor:
         event_lower = event_type.lower()
         
         # Check each category
-        if any(action in event_lower for action in self.DEFENSIVE_ACTIONS):
-            return "defensive_action"
-        elif any(action in event_lower for action in self.PASSING_EVENTS):
-            return "passing"
-        elif any(action in event_lower for action in self.PROGRESSIVE_ACTIONS):
-            return "progressive"
-        elif any(action in event_lower for action in self.SET_PIECES):
-            return "set_piece"
-        elif any(action in event_lower for action in self.GOAL_RELATED):
-            return "goal_related"
-        else:
-            return "other"
+        for category, pattern in self._category_patterns.items():
+            if pattern.search(event_lower):
+                return category
+        return "other"
+    
+    def _categorize_events(self, event_types: pd.Series) -> pd.Categorical:
+        """
+        Categorize a column of event types in one vectorized pass.
+        
+        Same rules as categorize_event; missing types map to "other". Only
+        the distinct types (a few dozen per match) go through the regexes;
+        rows take their category by indexing with the factorized codes, so
+        a categorical column is never expanded back into strings.
+        
+        Args:
+            event_types: Raw event type strings (plain or categorical)
+        
+        Returns:
+            Categorical of the observed categories
+        """
+        codes, distinct = pd.factorize(event_types)
+        lowered = pd.Series(distinct).astype("string").str.lower()
+        masks = [
+            lowered.str.contains(pattern, na=False).to_numpy(dtype=bool)
+            for pattern in self._category_patterns.values()
+        ]
+        labels = np.select(masks, list(self._category_patterns), default="other").astype(object)
+        if (codes < 0).any():
+            # Missing types have code -1, which picks the trailing "other"
+            labels = np.append(labels, "other")
+        label_codes, categories = pd.factorize(labels, sort=True)
+        return pd.Categorical.from_codes(label_codes[codes], categories=categories)
     
     def link_to_ball_coordinates(
         self,
@@ -267,65 +454,62 @@ class EventProcessor:
         
         if len(coords_df) == 0:
             self.logger.warning("Empty coords DataFrame provided")
-            # Initialize columns with pd.NA
-            events_df["ball_x"] = pd.NA
-            events_df["ball_y"] = pd.NA
-            events_df["ball_zone"] = pd.NA
-            events_df["link_confidence"] = pd.NA
+            self._set_link_columns(events_df)
             return events_df
         
-        from .ball_coordinates import BallCoordinateProcessor
-        
-        # Initialize columns with pd.NA
-        events_df["ball_x"] = pd.NA
-        events_df["ball_y"] = pd.NA
-        events_df["ball_zone"] = pd.NA
-        events_df["link_confidence"] = pd.NA
+        from .ball_coordinates import CoordIndex
         
         # Ensure coordinates have estimated_minute
         if "estimated_minute" not in coords_df.columns:
             self.logger.warning("Coordinates missing estimated_minute - cannot link")
+            self._set_link_columns(events_df)
             return events_df
         
-        ball_processor = BallCoordinateProcessor()
+        # Sort coordinate times once (memoized on coords_df for later
+        # possession inference), then find every event's nearest coordinate
+        # with one vectorized binary search
+        coord_index = CoordIndex.for_frame(coords_df)
         
-        # Link each event (keeping loop simple for maintainability)
-        # Alternative would be merge_asof but the link_event_to_coordinate method
-        # has custom logic that would make vectorization complex
-        for idx in events_df.index:
-            event = events_df.loc[idx]
-            
-            try:
-                closest_coord = ball_processor.link_event_to_coordinate(
-                    event, coords_df, tolerance_seconds
-                )
-                
-                if closest_coord is not None:
-                    events_df.at[idx, "ball_x"] = closest_coord["x"]
-                    events_df.at[idx, "ball_y"] = closest_coord["y"]
-                    events_df.at[idx, "ball_zone"] = closest_coord.get("pitch_zone", "unknown")
-                    
-                    # Calculate confidence based on time difference
-                    event_minute = event.get("minute", 0)
-                    coord_minute = closest_coord.get("estimated_minute", 0)
-                    
-                    if pd.notna(event_minute) and pd.notna(coord_minute):
-                        time_diff = abs(coord_minute - event_minute)
-                        
-                        # Convert constants to minutes
-                        high_threshold = self.LINK_TOLERANCE_HIGH_SECONDS / 60.0
-                        medium_threshold = self.LINK_TOLERANCE_MEDIUM_SECONDS / 60.0
-                        
-                        if time_diff < high_threshold:
-                            events_df.at[idx, "link_confidence"] = "high"
-                        elif time_diff < medium_threshold:
-                            events_df.at[idx, "link_confidence"] = "medium"
-                        else:
-                            events_df.at[idx, "link_confidence"] = "low"
-            
-            except Exception as e:
-                self.logger.warning(f"Failed to link event {idx}: {e}")
-                continue
+        n_events = len(events_df)
+        if "minute" in events_df.columns:
+            event_minutes = pd.to_numeric(events_df["minute"], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+        else:
+            event_minutes = np.full(n_events, np.nan)
+        
+        positions = coord_index.query_positions(event_minutes, tolerance_seconds / 60)
+        matched = positions >= 0
+        matched_positions = positions[matched]
+        
+        ball_x = np.full(n_events, np.nan)
+        ball_y = np.full(n_events, np.nan)
+        ball_zone = np.full(n_events, pd.NA, dtype=object)
+        confidence_code = np.full(n_events, -1, dtype=np.int8)
+        
+        coord_x = coords_df["x"].to_numpy(dtype=np.float64, na_value=np.nan)
+        coord_y = coords_df["y"].to_numpy(dtype=np.float64, na_value=np.nan)
+        ball_x[matched] = coord_x[matched_positions]
+        ball_y[matched] = coord_y[matched_positions]
+        if "pitch_zone" in coords_df.columns:
+            ball_zone[matched] = coords_df["pitch_zone"].to_numpy()[matched_positions]
+        else:
+            ball_zone[matched] = "unknown"
+        
+        # Confidence based on time difference (constants converted to minutes),
+        # as LINK_CONFIDENCE_DTYPE category codes (2=high, 1=medium, 0=low)
+        coord_minutes = coords_df["estimated_minute"].to_numpy(dtype=np.float64, na_value=np.nan)
+        time_diff = np.abs(coord_minutes[matched_positions] - event_minutes[matched])
+        confidence_code[matched] = np.select(
+            [
+                time_diff < self.LINK_TOLERANCE_HIGH_SECONDS / 60.0,
+                time_diff < self.LINK_TOLERANCE_MEDIUM_SECONDS / 60.0,
+            ],
+            [2, 1],
+            default=0,
+        )
+        
+        self._set_link_columns(events_df, ball_x, ball_y, ball_zone, confidence_code)
         
         # Report linking success
         linked = events_df["ball_x"].notna().sum()
@@ -339,6 +523,41 @@ class EventProcessor:
         
         return events_df
     
+    @staticmethod
+    def _set_link_columns(
+        events_df: pd.DataFrame,
+        ball_x: Optional[np.ndarray] = None,
+        ball_y: Optional[np.ndarray] = None,
+        ball_zone: Optional[np.ndarray] = None,
+        confidence_code: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Store linking results as float coordinates, object zones and ordered categorical confidence.
+        
+        Args:
+            events_df: Events to update in place
+            ball_x: Ball x per event (NaN = unlinked); all NaN if omitted
+            ball_y: Ball y per event (NaN = unlinked); all NaN if omitted
+            ball_zone: Pitch zone per event; all NA if omitted
+            confidence_code: LINK_CONFIDENCE_DTYPE category codes (-1 = NA); all NA if omitted
+        """
+        n_events = len(events_df)
+        if ball_x is None:
+            ball_x = np.full(n_events, np.nan)
+        if ball_y is None:
+            ball_y = np.full(n_events, np.nan)
+        if ball_zone is None:
+            ball_zone = np.full(n_events, pd.NA, dtype=object)
+        if confidence_code is None:
+            confidence_code = np.full(n_events, -1, dtype=np.int8)
+        
+        events_df["ball_x"] = ball_x
+        events_df["ball_y"] = ball_y
+        events_df["ball_zone"] = pd.Series(ball_zone, index=events_df.index, dtype=object)
+        events_df["link_confidence"] = pd.Categorical.from_codes(
+            confidence_code, dtype=LINK_CONFIDENCE_DTYPE
+        )
+    
     def get_player_events(
         self,
         events_df: pd.DataFrame,
@@ -369,7 +588,7 @@ class EventProcessor:
         if len(events_df) == 0 or "player_id" not in events_df.columns:
             return pd.DataFrame()
         
-        return events_df[events_df["player_id"] == player_id].copy()
+        return select_rows(events_df, "player_id", player_id)
     
     def get_team_events(
         self,
@@ -408,7 +627,7 @@ class EventProcessor:
         if len(events_df) == 0 or "team_id" not in events_df.columns:
             return pd.DataFrame()
         
-        team_events = events_df[events_df["team_id"] == team_id].copy()
+        team_events = select_rows(events_df, "team_id", team_id)
         
         if category:
             if "event_category" not in team_events.columns:
@@ -455,18 +674,17 @@ class EventProcessor:
         
         # Add category stats if available
         if "event_category" in events_df.columns:
-            summary["by_category"] = events_df["event_category"].value_counts().to_dict()
+            summary["by_category"] = value_counts_dict(events_df["event_category"])
         
         # Add team stats if available
         if "team_name" in events_df.columns:
-            summary["by_team"] = events_df["team_name"].value_counts().to_dict()
+            summary["by_team"] = value_counts_dict(events_df["team_name"])
         
-        # Add minute range if available
+        # Add minute range if available (None when no event has a minute)
         if "minute" in events_df.columns:
-            summary["minute_range"] = (
-                events_df["minute"].min(),
-                events_df["minute"].max()
-            )
+            minutes = events_df["minute"].dropna()
+            if len(minutes) > 0:
+                summary["minute_range"] = (minutes.min(), minutes.max())
         
         # Add linking stats if available
         if "ball_x" in events_df.columns:
@@ -13,15 +13,67 @@ Key features:
 - Tactical shape analysis
 """
 
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
+from ..utils.file_io import find_json
 from ..utils.file_io import load_json as load_json_file
+from ..utils.fixture_pool import map_fixtures
+from ..utils.frame_cache import cached_frame
+from ..utils.frame_dtypes import arrow_string_columns, downcast_columns
+from ..utils.frame_index import first_row, select_rows, value_counts_dict
 from ..utils.logging_utils import get_logger
 
 
+@lru_cache(maxsize=256)
+def _formation_shape(formation_str: str) -> Optional[Mapping]:
+    """
+    Parse a formation string, reusing the result for repeated formations.
+    
+    Returns a read-only mapping, since the cached instance is shared by
+    every caller.
+    """
+    try:
+        numbers = tuple(int(p) for p in formation_str.split("-"))
+    except ValueError:
+        return None
+    
+    if len(numbers) == 3:
+        shape = {
+            "defenders": numbers[0],
+            "midfielders": numbers[1],
+            "forwards": numbers[2],
+            "total_outfield": sum(numbers)
+        }
+    elif len(numbers) == 4:
+        shape = {
+            "defenders": numbers[0],
+            "defensive_midfielders": numbers[1],
+            "attacking_midfielders": numbers[2],
+            "forwards": numbers[3],
+            "total_outfield": sum(numbers)
+        }
+    else:
+        shape = {"raw": formation_str, "parts": numbers}
+    return MappingProxyType(shape)
+
+
+def _parse_fixture_lineups(fixture_id: int, data_dir: str) -> pd.DataFrame:
+    """Parse one fixture's lineups in a worker process (module-level so it pickles)."""
+    return FormationParser(data_dir).parse_lineups(fixture_id)
+
+
+def _parse_fixture_formations(fixture_id: int, data_dir: str) -> pd.DataFrame:
+    """Parse one fixture's formations in a worker process (module-level so it pickles)."""
+    return FormationParser(data_dir).parse_formations(fixture_id)
+
+
 class FormationParser:
     """
     Parse and analyze team formations and lineups.
@@ -31,6 +83,9 @@ class FormationParser:
 
     Args:
         data_dir: Base directory containing raw data
+        cache_parsed: Cache parsed DataFrames in pickle sidecars next to the
+            raw files (see utils.frame_cache); off by default since sidecars
+            are unpickled from the data directory
 
     Example:
         >>> parser = FormationParser()
@@ -45,15 +100,39 @@ class FormationParser:
     MIDFIELDER_POSITIONS = ["CDM", "CM", "CAM", "LM", "RM", "DM", "AM"]
     FORWARD_POSITIONS = ["ST", "CF", "LW", "RW", "FW"]
 
+    # Low-cardinality string columns stored as pandas categoricals
+    CATEGORICAL_COLUMNS = ["position", "position_category", "team_name", "player_name"]
+
+    # Narrow dtypes for numeric columns (formation_x/y are parsed as Int8)
+    NUMERIC_DTYPES = {"player_id": "UInt32", "team_id": "UInt32", "jersey_number": "Int8"}
+
+    # Free-text columns stored as Arrow-backed strings
+    STRING_COLUMNS = ["formation_field"]
+
+    # Formation field grid coordinates (e.g. "2:2" -> x=2, y=2)
+    FORMATION_FIELD_PATTERN = re.compile(r"^\s*([+-]?\d+)\s*:\s*([+-]?\d+)\s*$")
+
     # Validation constants
     MIN_FIXTURE_ID = 1000000  # Minimum valid fixture ID
     MIN_TEAM_ID = 1  # Minimum valid team ID
     MIN_PLAYER_ID = 1  # Minimum valid player ID
     
-    def __init__(self, data_dir: str = "data/raw"):
+    def __init__(self, data_dir: str = "data/raw", cache_parsed: bool = False):
         """Initialize formation parser."""
         self.data_dir = Path(data_dir)
+        self.cache_parsed = cache_parsed
         self.logger = get_logger(self.__class__.__name__)
+        
+        # One alternation per category, in priority order (first match wins)
+        self._position_patterns = {
+            category: re.compile("|".join(map(re.escape, positions)))
+            for category, positions in (
+                ("Goalkeeper", self.GOALKEEPER_POSITIONS),
+                ("Defender", self.DEFENDER_POSITIONS),
+                ("Midfielder", self.MIDFIELDER_POSITIONS),
+                ("Forward", self.FORWARD_POSITIONS),
+            )
+        }
 
     def _get_team_name_mapping(self, fixture_id: int) -> dict[int, str]:
         """
@@ -71,7 +150,7 @@ class FormationParser:
             >>> print(mapping)  # {8: 'Liverpool', 18: 'Chelsea'}
         """
         fixture_dir = self.data_dir / str(fixture_id)
-        participants_file = fixture_dir / "participants.json"
+        participants_file = find_json(fixture_dir / "participants.json")
 
         if not participants_file.exists():
             self.logger.warning(f"Participants file not found for fixture {fixture_id}")
@@ -104,6 +183,7 @@ class FormationParser:
             self.logger.warning(f"Failed to load team names from participants: {e}")
             return {}
 
+    @cached_frame("lineups", "participants")
     def parse_lineups(self, fixture_id: int, season: Optional[str] = None) -> pd.DataFrame:
         """
         Parse player lineups from match data.
@@ -129,7 +209,7 @@ class FormationParser:
 
         # Load raw JSON
         fixture_dir = self.data_dir / str(fixture_id)
-        lineups_file = fixture_dir / "lineups.json"
+        lineups_file = find_json(fixture_dir / "lineups.json")
 
         if not lineups_file.exists():
             self.logger.error(f"Lineups file not found for fixture {fixture_id}")
@@ -170,12 +250,60 @@ class FormationParser:
         
         if len(df) > 0:
             # Add position categories
-            df["position_category"] = df["position"].apply(self.categorize_position)
+            df["position_category"] = self._categorize_positions(df["position"])
+            
+            # Parse formation fields into position coordinates
+            formation_x, formation_y = self._parse_formation_fields(df["formation_field"])
+            df.insert(df.columns.get_loc("formation_field") + 1, "formation_x", formation_x)
+            df.insert(df.columns.get_loc("formation_x") + 1, "formation_y", formation_y)
+            
+            # IDs and shirt numbers fit in a fraction of float64's 8 bytes, and free
+            # text packs into an Arrow buffer
+            df = downcast_columns(df, self.NUMERIC_DTYPES)
+            df = arrow_string_columns(df, self.STRING_COLUMNS)
+            
+            # Missing starting/captain flags read as False
+            for col in ("starting", "captain"):
+                df[col] = df[col].notna() & df[col].astype(bool)
+            
+            # Repeated names take far less memory (and compare/group faster)
+            # as categoricals
+            for col in self.CATEGORICAL_COLUMNS:
+                if col in df.columns:
+                    df[col] = df[col].astype("category")
             
             self.logger.info(f"Parsed {len(df)} lineup entries for fixture {fixture_id}")
         
         return df
     
+    @classmethod
+    def parse_lineups_batch(
+        cls,
+        fixture_ids: list[int],
+        data_dir: str = "data/raw",
+        max_workers: Optional[int] = None,
+    ) -> list[pd.DataFrame]:
+        """
+        Parse lineups for many fixtures across worker processes.
+        
+        Workers are spawned (see utils.fixture_pool.map_fixtures), so scripts
+        calling this must guard their entry point with
+        ``if __name__ == "__main__":``.
+        
+        Args:
+            fixture_ids: Fixture IDs to process
+            data_dir: Base directory containing raw data
+            max_workers: Worker processes (default: CPU count)
+        
+        Returns:
+            One DataFrame per fixture, in the order of fixture_ids (empty
+            where parse_lineups found nothing to parse)
+        
+        Example:
+            >>> frames = FormationParser.parse_lineups_batch([18841624, 18841625])
+        """
+        return map_fixtures(_parse_fixture_lineups, fixture_ids, data_dir, max_workers)
+    
     def _parse_lineup_entry(self, entry: dict, fixture_id: int, team_name_mapping: dict[int, str] = None) -> Optional[dict]:
         """
         Parse a single lineup entry.
@@ -192,7 +320,7 @@ class FormationParser:
             team_name_mapping = {}
         try:
             # Extract player info - try nested first, then direct
-            player_data = entry.get("player", {})
+            player_data = entry.get("player")
             if isinstance(player_data, dict) and player_data:
                 player_id = player_data.get("id")
                 player_name = player_data.get("display_name", "Unknown")
@@ -202,7 +330,7 @@ class FormationParser:
                 player_name = entry.get("player_name", "Unknown")
 
             # Extract team info - try nested first, then direct
-            participant_data = entry.get("participant", {})
+            participant_data = entry.get("participant")
             if isinstance(participant_data, dict) and participant_data:
                 team_id = participant_data.get("id")
                 team_name = participant_data.get("name", "Unknown")
@@ -212,26 +340,16 @@ class FormationParser:
                 team_name = team_name_mapping.get(team_id, f"Team_{team_id}")
 
             # Extract position info - try nested first, then direct
-            detailed_position = entry.get("detailedPosition", {})
+            detailed_position = entry.get("detailedPosition")
             if isinstance(detailed_position, dict) and detailed_position:
                 position = detailed_position.get("name", "Unknown")
             else:
                 position = entry.get("position", "Unknown")
             
-            # Formation field (e.g., "2:2" for center-back)
+            # Formation field (e.g., "2:2" for center-back), split into
+            # coordinates per column in parse_lineups
             formation_field = entry.get("formation_field")
             
-            # Parse formation field into position coordinates
-            formation_x, formation_y = None, None
-            if formation_field and ":" in str(formation_field):
-                try:
-                    parts = str(formation_field).split(":")
-                    if len(parts) == 2:
-                        formation_x = int(parts[0])
-                        formation_y = int(parts[1])
-                except ValueError:
-                    pass
-            
             # Determine if starting XI - type_id 11 is starting player
             type_id = entry.get("type_id")
             starting = entry.get("starting", type_id == 11 if type_id else False)
@@ -244,8 +362,6 @@ class FormationParser:
                 "team_name": team_name,
                 "position": position,
                 "formation_field": formation_field,
-                "formation_x": formation_x,
-                "formation_y": formation_y,
                 "jersey_number": entry.get("jersey_number"),
                 "starting": starting,
                 "captain": entry.get("captain", False),
@@ -277,17 +393,60 @@ class FormationParser:
         
         position_upper = position.upper()
         
-        if any(pos in position_upper for pos in self.GOALKEEPER_POSITIONS):
-            return "Goalkeeper"
-        elif any(pos in position_upper for pos in self.DEFENDER_POSITIONS):
-            return "Defender"
-        elif any(pos in position_upper for pos in self.MIDFIELDER_POSITIONS):
-            return "Midfielder"
-        elif any(pos in position_upper for pos in self.FORWARD_POSITIONS):
-            return "Forward"
-        else:
-            return "Unknown"
+        for category, pattern in self._position_patterns.items():
+            if pattern.search(position_upper):
+                return category
+        return "Unknown"
+    
+    def _categorize_positions(self, positions: pd.Series) -> pd.Categorical:
+        """
+        Categorize a column of positions in one vectorized pass.
+        
+        Same rules as categorize_position; missing positions map to
+        "Unknown". Only the distinct positions go through the regexes; rows
+        take their category by indexing with the factorized codes.
+        
+        Args:
+            positions: Detailed position strings (plain or categorical)
+        
+        Returns:
+            Categorical of the observed categories
+        """
+        codes, distinct = pd.factorize(positions)
+        uppered = pd.Series(distinct).astype("string").str.upper()
+        masks = [
+            uppered.str.contains(pattern, na=False).to_numpy(dtype=bool)
+            for pattern in self._position_patterns.values()
+        ]
+        labels = np.select(masks, list(self._position_patterns), default="Unknown").astype(object)
+        if (codes < 0).any():
+            # Missing positions have code -1, which picks the trailing "Unknown"
+            labels = np.append(labels, "Unknown")
+        label_codes, categories = pd.factorize(labels, sort=True)
+        return pd.Categorical.from_codes(label_codes[codes], categories=categories)
     
+    def _parse_formation_fields(self, formation_fields: pd.Series) -> tuple[pd.Series, pd.Series]:
+        """
+        Split a column of formation fields into grid coordinates.
+        
+        Fields that are missing, malformed or outside the Int8 range map to
+        <NA>.
+        
+        Args:
+            formation_fields: Formation field strings (e.g. "2:2")
+        
+        Returns:
+            Tuple of (formation_x, formation_y) Int8 Series
+        """
+        extracted = formation_fields.astype("string").str.extract(self.FORMATION_FIELD_PATTERN)
+        int8 = np.iinfo(np.int8)
+        coordinates = []
+        for col in extracted.columns:
+            values = pd.to_numeric(extracted[col], errors="coerce")
+            coordinates.append(values.where(values.between(int8.min, int8.max)).astype("Int8"))
+        return coordinates[0], coordinates[1]
+    
+    @cached_frame("formations")
     def parse_formations(self, fixture_id: int, season: Optional[str] = None) -> pd.DataFrame:
         """
         Parse team formations from match data.
@@ -313,7 +472,7 @@ class FormationParser:
 
         # Load raw JSON
         fixture_dir = self.data_dir / str(fixture_id)
-        formations_file = fixture_dir / "formations.json"
+        formations_file = find_json(fixture_dir / "formations.json")
 
         if not formations_file.exists():
             self.logger.warning(f"Formations file not found for fixture {fixture_id}")
@@ -371,6 +530,34 @@ class FormationParser:
         
         return df
     
+    @classmethod
+    def parse_formations_batch(
+        cls,
+        fixture_ids: list[int],
+        data_dir: str = "data/raw",
+        max_workers: Optional[int] = None,
+    ) -> list[pd.DataFrame]:
+        """
+        Parse formations for many fixtures across worker processes.
+        
+        Workers are spawned (see utils.fixture_pool.map_fixtures), so scripts
+        calling this must guard their entry point with
+        ``if __name__ == "__main__":``.
+        
+        Args:
+            fixture_ids: Fixture IDs to process
+            data_dir: Base directory containing raw data
+            max_workers: Worker processes (default: CPU count)
+        
+        Returns:
+            One DataFrame per fixture, in the order of fixture_ids (empty
+            where parse_formations found nothing to parse)
+        
+        Example:
+            >>> frames = FormationParser.parse_formations_batch([18841624, 18841625])
+        """
+        return map_fixtures(_parse_fixture_formations, fixture_ids, data_dir, max_workers)
+    
     def get_team_lineup(
         self,
         lineups_df: pd.DataFrame,
@@ -399,7 +586,7 @@ class FormationParser:
                 f"Invalid team_id: {team_id}. Must be integer >= {self.MIN_TEAM_ID}"
             )
 
-        team_lineup = lineups_df[lineups_df["team_id"] == team_id].copy()
+        team_lineup = select_rows(lineups_df, "team_id", team_id)
 
         if starting_only:
             team_lineup = team_lineup[team_lineup["starting"]]
@@ -433,14 +620,12 @@ class FormationParser:
                 f"Invalid player_id: {player_id}. Must be integer >= {self.MIN_PLAYER_ID}"
             )
 
-        player_lineup = lineups_df[lineups_df["player_id"] == player_id]
+        # Return first match (should only be one per fixture)
+        player_row = first_row(lineups_df, "player_id", player_id)
         
-        if len(player_lineup) == 0:
+        if player_row is None:
             return None
         
-        # Return first match (should only be one per fixture)
-        player_row = player_lineup.iloc[0]
-        
         return {
             "player_name": player_row["player_name"],
             "position": player_row["position"],
@@ -450,10 +635,14 @@ class FormationParser:
             "jersey_number": player_row.get("jersey_number"),
         }
     
-    def extract_formation_shape(self, formation_str: Optional[str]) -> Optional[dict]:
+    @staticmethod
+    def extract_formation_shape(formation_str: Optional[str]) -> Optional[dict]:
         """
         Parse formation string (e.g., "4-3-3") into structured shape.
 
+        Parsing is cached per formation string; each call returns a new
+        dictionary, so callers may modify it.
+
         Args:
             formation_str: Formation string (e.g., "4-3-3", "4-2-3-1")
 
@@ -472,30 +661,13 @@ class FormationParser:
         if not formation_str.strip():
             return None
 
-        try:
-            parts = formation_str.split("-")
-            numbers = [int(p) for p in parts]
-            
-            if len(numbers) == 3:
-                return {
-                    "defenders": numbers[0],
-                    "midfielders": numbers[1],
-                    "forwards": numbers[2],
-                    "total_outfield": sum(numbers)
-                }
-            elif len(numbers) == 4:
-                return {
-                    "defenders": numbers[0],
-                    "defensive_midfielders": numbers[1],
-                    "attacking_midfielders": numbers[2],
-                    "forwards": numbers[3],
-                    "total_outfield": sum(numbers)
-                }
-            else:
-                return {"raw": formation_str, "parts": numbers}
-        
-        except (ValueError, AttributeError):
+        shape = _formation_shape(formation_str)
+        if shape is None:
             return None
+        result = dict(shape)
+        if "parts" in result:
+            result["parts"] = list(result["parts"])
+        return result
     
     def calculate_lineup_summary(self, lineups_df: pd.DataFrame) -> dict:
         """
@@ -517,8 +689,16 @@ class FormationParser:
             "total_players": len(lineups_df),
             "num_teams": lineups_df["team_id"].nunique(),
             "num_starting": lineups_df["starting"].sum() if "starting" in lineups_df.columns else 0,
-            "by_position_category": lineups_df["position_category"].value_counts().to_dict() if "position_category" in lineups_df.columns else {},
-            "by_team": lineups_df["team_name"].value_counts().to_dict() if "team_name" in lineups_df.columns else {},
+            "by_position_category": (
+                value_counts_dict(lineups_df["position_category"])
+                if "position_category" in lineups_df.columns
+                else {}
+            ),
+            "by_team": (
+                value_counts_dict(lineups_df["team_name"])
+                if "team_name" in lineups_df.columns
+                else {}
+            ),
         }
         
         return summary
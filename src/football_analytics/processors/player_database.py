@@ -17,6 +17,7 @@ from typing import Optional
 import pandas as pd
 
 from ..utils.file_io import load_json as load_json_file
+from ..utils.frame_index import first_row
 from ..utils.logging_utils import get_logger
 from .formations import FormationParser
 
@@ -57,6 +58,29 @@ class PlayerIDExtractor:
         self.data_dir = Path(data_dir)
         self.logger = get_logger(self.__class__.__name__)
         self.formation_parser = FormationParser(data_dir)
+        # Parsed lineups by fixture ID, shared by repeated extractions
+        self._lineup_cache: dict[int, pd.DataFrame] = {}
+    
+    def _get_lineups(self, fixture_id: int) -> pd.DataFrame:
+        """
+        Parse a fixture's lineups, reusing the result of earlier calls.
+
+        Empty results (missing or unreadable data) are not cached, so a
+        fixture collected later is picked up. The returned DataFrame is
+        shared between calls and must not be modified in place.
+
+        Args:
+            fixture_id: Fixture ID
+
+        Returns:
+            DataFrame with lineup information
+        """
+        lineups = self._lineup_cache.get(fixture_id)
+        if lineups is None:
+            lineups = self.formation_parser.parse_lineups(fixture_id)
+            if len(lineups) > 0:
+                self._lineup_cache[fixture_id] = lineups
+        return lineups
     
     def extract_all_players(
         self,
@@ -97,13 +121,13 @@ class PlayerIDExtractor:
             if not isinstance(fid, int) or fid < self.MIN_FIXTURE_ID:
                 raise ValueError(f"Invalid fixture_id: {fid}")
         
-        players_database = {}
+        team_lineups = []
         
         self.logger.info(f"Extracting players from {len(fixture_ids)} fixtures...")
         
         for fixture_id in fixture_ids:
             try:
-                lineups = self.formation_parser.parse_lineups(fixture_id)
+                lineups = self._get_lineups(fixture_id)
                 
                 if len(lineups) == 0:
                     continue
@@ -111,79 +135,57 @@ class PlayerIDExtractor:
                 # Filter for team by team_id
                 team_lineup = lineups[lineups["team_id"] == team_id]
 
-                if len(team_lineup) == 0:
-                    continue
-                
-                # Process all players using vectorized operations
-                # Filter out players with missing IDs
-                valid_players = team_lineup[~team_lineup["player_id"].isna()].copy()
-                
-                if len(valid_players) == 0:
-                    continue
-                
-                # Convert player_id to int with error handling
-                try:
-                    valid_players["player_id"] = valid_players["player_id"].astype(int)
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(f"Failed to convert player_id to int in fixture {fixture_id}: {e}")
-                    continue
-                
-                # Process each player
-                for idx in valid_players.index:
-                    player_row = valid_players.loc[idx]
-                    player_id = player_row["player_id"]
-                    
-                    # Add to database or update existing
-                    if player_id not in players_database:
-                        players_database[player_id] = {
-                            "player_id": player_id,
-                            "player_name": player_row["player_name"],
-                            "positions": set(),
-                            "jersey_numbers": set(),
-                            "appearances": 0,
-                            "starts": 0,
-                            "captain_appearances": 0,
-                        }
-                    
-                    # Update player data
-                    player_entry = players_database[player_id]
-                    
-                    if not pd.isna(player_row["position"]):
-                        player_entry["positions"].add(player_row["position"])
-                    
-                    if not pd.isna(player_row["jersey_number"]):
-                        try:
-                            jersey_num = int(player_row["jersey_number"])
-                            player_entry["jersey_numbers"].add(jersey_num)
-                        except (ValueError, TypeError) as e:
-                            self.logger.warning(f"Invalid jersey_number for player {player_id}: {e}")
-                    
-                    player_entry["appearances"] += 1
-                    
-                    if player_row.get("starting", False):
-                        player_entry["starts"] += 1
-                    
-                    if player_row.get("captain", False):
-                        player_entry["captain_appearances"] += 1
+                if len(team_lineup) > 0:
+                    team_lineups.append(team_lineup)
             
             except Exception as e:
                 self.logger.warning(f"Failed to process fixture {fixture_id}: {e}")
                 continue
         
-        # Convert to DataFrame
-        if not players_database:
+        # Aggregate all appearances at once instead of row by row
+        appearances = (
+            pd.concat(team_lineups, ignore_index=True).dropna(subset=["player_id"])
+            if team_lineups
+            else pd.DataFrame()
+        )
+        
+        if len(appearances) == 0:
             self.logger.warning("No players found!")
             return pd.DataFrame()
         
-        players_df = pd.DataFrame.from_dict(players_database, orient="index")
-        
-        # Convert sets to strings
-        players_df["positions"] = players_df["positions"].apply(
-            lambda x: ", ".join(sorted(x)) if x else ""
+        appearances["player_id"] = appearances["player_id"].astype("int64")
+        by_player = appearances.groupby("player_id", sort=False)
+        
+        # One row per player, named from their first appearance
+        players_df = appearances.drop_duplicates("player_id")[["player_id", "player_name"]]
+        players_df = players_df.set_index("player_id", drop=False).rename_axis(None)
+        
+        # Distinct positions and jersey numbers, sorted and joined
+        positions = (
+            appearances[["player_id", "position"]]
+            .dropna()
+            .astype({"position": str})
+            .drop_duplicates()
+            .sort_values("position")
+            .groupby("player_id")["position"]
+            .agg(", ".join)
         )
-        players_df["jersey_numbers"] = players_df["jersey_numbers"].apply(
-            lambda x: ", ".join(map(str, sorted(x))) if x else ""
+        jersey_numbers = (
+            appearances[["player_id", "jersey_number"]]
+            .dropna()
+            .astype({"jersey_number": "int64"})
+            .drop_duplicates()
+            .sort_values("jersey_number")
+            .astype({"jersey_number": str})
+            .groupby("player_id")["jersey_number"]
+            .agg(", ".join)
         )
+        players_df["positions"] = positions.reindex(players_df.index, fill_value="")
+        players_df["jersey_numbers"] = jersey_numbers.reindex(players_df.index, fill_value="")
+        
+        players_df["appearances"] = by_player.size()
+        players_df["starts"] = by_player["starting"].sum()
+        players_df["captain_appearances"] = by_player["captain"].sum()
         
         # Sort by appearances
         players_df = players_df.sort_values("appearances", ascending=False)
@@ -193,6 +195,29 @@ class PlayerIDExtractor:
         
         return players_df
     
+    @staticmethod
+    def _upper_names(players_df: pd.DataFrame) -> list[str]:
+        """
+        Upper-case player names once for case-insensitive substring matching.
+
+        Missing names become "" so they match no query. For categorical
+        names only the distinct categories are upper-cased.
+
+        Args:
+            players_df: Players DataFrame
+
+        Returns:
+            Upper-cased names, in row order
+        """
+        names = players_df["player_name"]
+        if isinstance(names.dtype, pd.CategoricalDtype):
+            upper = [
+                name.upper() if isinstance(name, str) else ""
+                for name in names.cat.categories.tolist()
+            ]
+            return [upper[code] if code >= 0 else "" for code in names.cat.codes.tolist()]
+        return [name.upper() if isinstance(name, str) else "" for name in names.tolist()]
+    
     def find_key_players(self, players_df: pd.DataFrame) -> dict:
         """
         Identify specific key players of interest.
@@ -224,6 +249,20 @@ class PlayerIDExtractor:
         if missing_columns:
             raise ValueError(f"players_df missing required columns: {missing_columns}")
         
+        # One pass over the names, recording the first row each variant
+        # matches (case-insensitive substring, as str.contains(case=False))
+        variants = {
+            variant.upper() for name_variants in self.KEY_PLAYERS.values()
+            for variant in name_variants
+        }
+        first_match = {}
+        for position, name in enumerate(self._upper_names(players_df)):
+            for variant in variants:
+                if variant not in first_match and variant in name:
+                    first_match[variant] = position
+            if len(first_match) == len(variants):
+                break
+        
         found_players = {}
         
         for canonical_name, name_variants in self.KEY_PLAYERS.items():
@@ -233,15 +272,11 @@ class PlayerIDExtractor:
             
             # Try each name variant
             for name_variant in name_variants:
-                matches = players_df[
-                    players_df["player_name"].str.contains(
-                        name_variant, case=False, na=False, regex=False
-                    )
-                ]
+                position = first_match.get(name_variant.upper())
                 
-                if len(matches) > 0:
+                if position is not None:
                     # Use the player with most appearances if multiple matches
-                    player_data = matches.iloc[0]
+                    player_data = players_df.iloc[position]
                     player_id = player_data["player_id"]
                     player_name = player_data["player_name"]
                     
@@ -295,17 +330,14 @@ class PlayerIDExtractor:
         if "player_name" not in players_df.columns:
             raise ValueError("players_df missing 'player_name' column")
         
-        matches = players_df[
-            players_df["player_name"].str.contains(
-                name_query, case=False, na=False, regex=False
-            )
-        ]
+        # Stop at the first case-insensitive substring match
+        query = name_query.upper()
+        for position, name in enumerate(self._upper_names(players_df)):
+            if query in name:
+                # Return player with most appearances if multiple matches
+                return players_df.iloc[position]
         
-        if len(matches) == 0:
-            return None
-        
-        # Return player with most appearances if multiple matches
-        return matches.iloc[0]
+        return None
     
     def save_player_database(
         self,
@@ -427,13 +459,11 @@ class PlayerIDExtractor:
         if "player_id" not in players_df.columns:
             raise ValueError("players_df missing 'player_id' column")
         
-        player_row = players_df[players_df["player_id"] == player_id]
+        player = first_row(players_df, "player_id", player_id)
         
-        if len(player_row) == 0:
+        if player is None:
             return None
         
-        player = player_row.iloc[0]
-        
         return {
             "player_id": int(player["player_id"]),
             "player_name": player["player_name"],
@@ -11,7 +11,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from ..utils.file_io import load_json
+from ..utils.file_io import find_json, load_json
 from ..utils.logging_utils import get_logger
 
 
@@ -54,7 +54,7 @@ class ScoresProcessor:
             description, goals, participant.
             Empty DataFrame if file not found or no scores present.
         """
-        scores_file = self.data_dir / str(fixture_id) / "scores.json"
+        scores_file = find_json(self.data_dir / str(fixture_id) / "scores.json")
 
         if not scores_file.exists():
             self.logger.error(f"scores.json not found for fixture {fixture_id}")
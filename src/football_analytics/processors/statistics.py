@@ -8,7 +8,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from ..utils.file_io import load_json
+from ..utils.file_io import find_json, load_json
 from ..utils.logging_utils import get_logger
 
 
@@ -44,7 +44,7 @@ class StatisticsProcessor:
             DataFrame with columns: fixture_id, type_id, participant_id, location, value.
             Empty DataFrame if file not found or no statistics present.
         """
-        stats_file = self.data_dir / str(fixture_id) / "statistics.json"
+        stats_file = find_json(self.data_dir / str(fixture_id) / "statistics.json")
 
         if not stats_file.exists():
             self.logger.error(f"statistics.json not found for fixture {fixture_id}")
@@ -2,18 +2,27 @@
 
 from .backup import BackupManager
 from .data_quality import DataQualityValidator
-from .file_io import backup_directory, file_exists, load_json, save_json
+from .file_io import backup_directory, file_exists, find_json, load_json, save_json, save_json_zst
+from .frame_dtypes import downcast_columns
+from .frame_index import first_row, select_rows, value_counts_dict
 from .logging_utils import setup_logging
 from .manifest import CollectionManifest
-from .rate_limiter import RateLimiter
+from .rate_limiter import RateLimiter, TokenBucketRateLimiter
 
 __all__ = [
     "save_json",
     "load_json",
+    "save_json_zst",
+    "find_json",
     "file_exists",
     "backup_directory",
+    "downcast_columns",
+    "first_row",
+    "select_rows",
+    "value_counts_dict",
     "setup_logging",
     "RateLimiter",
+    "TokenBucketRateLimiter",
     "BackupManager",
     "CollectionManifest",
     "DataQualityValidator",
@@ -20,6 +20,7 @@ from typing import Optional
 
 import pandas as pd
 
+from ..utils.file_io import find_json
 from ..utils.file_io import load_json as load_json_file
 from ..utils.logging_utils import get_logger
 
@@ -180,7 +181,7 @@ class DataQualityValidator:
         existing_files = []
         
         for filename in required_files:
-            filepath = fixture_dir / filename
+            filepath = find_json(fixture_dir / filename)
             if filepath.exists():
                 existing_files.append(filename)
             else:
@@ -210,7 +211,7 @@ class DataQualityValidator:
         Returns:
             Check result dictionary
         """
-        coords_file = fixture_dir / "ballCoordinates.json"
+        coords_file = find_json(fixture_dir / "ballCoordinates.json")
         
         try:
             coords_data = load_json_file(coords_file)
@@ -289,7 +290,7 @@ class DataQualityValidator:
         Returns:
             Check result dictionary
         """
-        events_file = fixture_dir / "events.json"
+        events_file = find_json(fixture_dir / "events.json")
         
         try:
             events_data = load_json_file(events_file)
@@ -363,7 +364,7 @@ class DataQualityValidator:
         Returns:
             Check result dictionary
         """
-        lineups_file = fixture_dir / "lineups.json"
+        lineups_file = find_json(fixture_dir / "lineups.json")
         
         try:
             lineups_data = load_json_file(lineups_file)
@@ -5,29 +5,44 @@ throughout the football analytics pipeline.
 
 TODO (Framework Evolution):
     - Add support for other formats (CSV, Parquet, Feather)
-    - Implement compression (gzip, bz2) for storage efficiency
+    - Implement compression (gzip, bz2) for storage efficiency (zstd done)
     - Add checksum validation for data integrity
     - Cloud storage support (S3, Google Cloud Storage)
 """
 
 import json
+import mmap
 import shutil
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
+
+import orjson
+
+# Suffix appended to JSON files stored zstd-compressed (e.g. events.json.zst)
+ZSTD_SUFFIX = ".zst"
+
+# Suffix of parsed-DataFrame sidecars written by utils.frame_cache
+FRAME_SIDECAR_SUFFIX = ".frame.pkl"
+
+# Plain JSON files larger than this are decoded from a memory map rather
+# than read into a bytes copy first
+MMAP_THRESHOLD_BYTES = 50 * 1024 * 1024
 
 
 def save_json(
-    data: Union[dict[str, Any], list], filepath: Union[str, Path], indent: int = 2
+    data: Union[dict[str, Any], list], filepath: Union[str, Path], indent: Optional[int] = 2
 ) -> Path:
     """
     Save data to JSON file with pretty formatting.
 
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. Serializes with orjson
+    straight to UTF-8 bytes (numpy values and non-string keys included);
+    indents other than 2 or None fall back to the standard json encoder.
 
     Args:
         data: Dictionary or list to save
         filepath: Path where to save the JSON file
-        indent: Number of spaces for indentation (default: 2)
+        indent: Number of spaces for indentation (default: 2, None for compact)
 
     Returns:
         Path object of the saved file
@@ -39,16 +54,111 @@ def save_json(
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    if indent not in (2, None):
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        return filepath
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(data, option=option))
+
+    return filepath
+
+
+def save_json_zst(
+    data: Union[dict[str, Any], list, bytes], filepath: Union[str, Path], level: int = 3
+) -> Path:
+    """
+    Save data as zstd-compressed compact JSON.
+
+    Args:
+        data: Dictionary or list to save, or an already encoded JSON body
+        filepath: Path of the file to write (conventionally ending .json.zst)
+        level: zstd compression level (default: 3)
+
+    Returns:
+        Path object of the saved file
+
+    Raises:
+        ImportError: If zstandard is not installed
+
+    Example:
+        >>> save_json_zst({"team": "Liverpool"}, "data/teams.json.zst")
+        PosixPath('data/teams.json.zst')
+    """
+    import zstandard
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    if not isinstance(data, bytes):
+        data = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    with open(filepath, "wb") as f:
+        f.write(zstandard.ZstdCompressor(level=level).compress(data))
 
     return filepath
 
 
+def find_json(filepath: Union[str, Path]) -> Path:
+    """
+    Locate a JSON file that may have been stored zstd-compressed.
+
+    Args:
+        filepath: Path of the uncompressed JSON file
+
+    Returns:
+        filepath if it exists, else its .zst sibling if that exists, else
+        filepath unchanged (so callers' missing-file handling still applies)
+
+    Example:
+        >>> find_json("data/raw/12345/events.json")
+        PosixPath('data/raw/12345/events.json.zst')
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        compressed = filepath.with_name(filepath.name + ZSTD_SUFFIX)
+        if compressed.exists():
+            return compressed
+    return filepath
+
+
+def read_json_bytes(filepath: Union[str, Path]) -> bytes:
+    """
+    Read the raw bytes of a JSON file, decompressing .zst files.
+
+    Args:
+        filepath: Path to JSON file (plain or ending in .zst)
+
+    Returns:
+        Undecoded JSON document
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    filepath = Path(filepath)
+
+    with open(filepath, "rb") as f:
+        raw = f.read()
+
+    if filepath.suffix == ZSTD_SUFFIX:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(raw)
+    return raw
+
+
 def load_json(filepath: Union[str, Path]) -> Union[dict[str, Any], list]:
     """
     Load JSON file and return parsed data.
 
+    Parsed with orjson; files ending in .zst are decompressed first
+    (requires zstandard). Plain files over MMAP_THRESHOLD_BYTES are decoded
+    straight from a memory map, skipping the copy into a bytes object.
+
     Args:
         filepath: Path to JSON file
 
@@ -66,8 +176,14 @@ def load_json(filepath: Union[str, Path]) -> Union[dict[str, Any], list]:
     """
     filepath = Path(filepath)
 
-    with open(filepath, encoding="utf-8") as f:
-        return json.load(f)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if filepath.suffix != ZSTD_SUFFIX and filepath.stat().st_size > MMAP_THRESHOLD_BYTES:
+        with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Release the view before the map closes
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+    return orjson.loads(read_json_bytes(filepath))
 
 
 def file_exists(filepath: Union[str, Path]) -> bool:
@@ -94,7 +210,8 @@ def backup_directory(
     Create a backup copy of an entire directory.
 
     Preserves directory structure. If backup already exists, it will be
-    overwritten.
+    overwritten. Parse-cache sidecars (see utils.frame_cache) are derived
+    data and are not copied.
 
     Args:
         source_dir: Directory to backup
@@ -128,8 +245,9 @@ def backup_directory(
     if backup_path.exists():
         shutil.rmtree(backup_path)
 
-    # Copy directory
-    shutil.copytree(source_dir, backup_path)
+    # Copy directory, leaving out parse-cache sidecars
+    sidecars = shutil.ignore_patterns(f"*{FRAME_SIDECAR_SUFFIX}", f"*{FRAME_SIDECAR_SUFFIX}.tmp")
+    shutil.copytree(source_dir, backup_path, ignore=sidecars)
 
     return backup_path
 
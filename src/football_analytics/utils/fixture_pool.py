@@ -0,0 +1,58 @@
+"""Parse many fixtures across worker processes.
+
+Fixtures share no state, so season-wide parsing is embarrassingly parallel.
+This module fans a per-fixture parse function out over a process pool; the
+processors' ``parse_*_batch`` methods build on it.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+import pandas as pd
+
+
+def map_fixtures(
+    parse: Callable[[int, str], pd.DataFrame],
+    fixture_ids: list[int],
+    data_dir: str = "data/raw",
+    max_workers: Optional[int] = None,
+) -> list[pd.DataFrame]:
+    """
+    Run ``parse(fixture_id, data_dir)`` for every fixture in worker processes.
+
+    Fixture IDs are sent in chunks to amortize the per-task overhead. With a
+    single worker (or fixture) everything runs in this process. Workers are
+    spawned, so ``parse`` must be a module-level function and scripts calling
+    this must guard their entry point with ``if __name__ == "__main__":``.
+
+    Args:
+        parse: Module-level function parsing one fixture; it should build its
+            processor (and logger) itself, as processors are not sent to workers
+        fixture_ids: Fixture IDs to process
+        data_dir: Base directory containing raw data
+        max_workers: Worker processes (default: CPU count)
+
+    Returns:
+        One DataFrame per fixture, in the order of fixture_ids
+
+    Example:
+        >>> frames = map_fixtures(_parse_fixture_events, [18841624, 18841625])
+    """
+    fixture_ids = list(fixture_ids)
+    workers = min(max_workers or os.cpu_count() or 1, len(fixture_ids))
+
+    # Not worth starting processes for a single worker
+    if workers <= 1:
+        return [parse(fixture_id, data_dir) for fixture_id in fixture_ids]
+
+    chunksize = max(1, len(fixture_ids) // (workers * 4))
+    # Spawn rather than fork: forking after numba has compiled its kernels
+    # leaves workers that hang on exit
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(
+            executor.map(parse, fixture_ids, [data_dir] * len(fixture_ids), chunksize=chunksize)
+        )
@@ -0,0 +1,116 @@
+"""On-disk caching of parsed fixture DataFrames.
+
+Decoding a raw API dump is the dominant cost of re-parsing a fixture. This
+module caches a parser's DataFrame in a pickle sidecar next to the raw
+files, keyed by a SHA-512 of those files and of the parser's code, so
+re-parsing an unchanged fixture is a pickle load instead of a JSON decode.
+Caching is opt-in (``cache_parsed=True`` on the processors): sidecars are
+unpickled, so only enable it for data directories you trust.
+
+TODO (Framework Evolution):
+    - Switch the sidecar to Parquet once pyarrow is a core dependency
+"""
+
+import functools
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from .file_io import FRAME_SIDECAR_SUFFIX, find_json
+
+# Bump when output changes in code outside the parser's own module (which
+# is fingerprinted automatically) so existing sidecars are ignored
+FRAME_CACHE_VERSION = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _code_fingerprint(module_name: str) -> str:
+    """SHA-512 of a parser module's source and the pandas version."""
+    digest = hashlib.sha512(pd.__version__.encode())
+    module_file = getattr(sys.modules.get(module_name), "__file__", None)
+    if module_file:
+        digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()
+
+
+def _sources_digest(sources: list[Path], key: str, fingerprint: str) -> str:
+    """SHA-512 over the cache key, the code fingerprint and each source file's name and bytes."""
+    digest = hashlib.sha512(f"{FRAME_CACHE_VERSION}:{fingerprint}:{key}".encode())
+    for source in sources:
+        digest.update(source.name.encode())
+        if source.exists():
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def cached_frame(*includes: str) -> Callable:
+    """
+    Cache a fixture parser's DataFrame in a pickle sidecar.
+
+    Decorates ``parse_*(self, fixture_id, ...)`` methods of processors that
+    have ``data_dir``, ``logger`` and ``cache_parsed`` attributes. The
+    sidecar is written to the fixture directory as
+    ``{first include}.{key hash[:8]}.{digest[:16]}.frame.pkl``. The key hash
+    identifies the parser and its arguments; the digest also covers the raw
+    files of every listed include and the source of the parser's module, so
+    re-collected data and edited parsers are parsed afresh. Writing a
+    sidecar replaces older ones for the same key only. Empty results
+    (missing or unreadable data) are not cached.
+
+    Args:
+        *includes: Raw include names the parser reads, primary one first
+            (e.g. "lineups", "participants")
+
+    Returns:
+        Method decorator
+
+    Example:
+        >>> @cached_frame("events")
+        ... def parse_events(self, fixture_id, season=None):
+        ...     ...
+    """
+    def decorator(parse: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        @functools.wraps(parse)
+        def wrapper(self, fixture_id, *args, **kwargs) -> pd.DataFrame:
+            fixture_dir = Path(self.data_dir) / str(fixture_id)
+            sources = [find_json(fixture_dir / f"{include}.json") for include in includes]
+
+            # Let the parser validate its input and report missing data
+            if not self.cache_parsed or not isinstance(fixture_id, int) or not sources[0].exists():
+                return parse(self, fixture_id, *args, **kwargs)
+
+            key = f"{parse.__qualname__}:{fixture_id}:{args!r}:{sorted(kwargs.items())!r}"
+            key_hash = hashlib.sha512(key.encode()).hexdigest()[:8]
+            digest = _sources_digest(sources, key, _code_fingerprint(parse.__module__))
+            prefix = f"{includes[0]}.{key_hash}."
+            cache_path = fixture_dir / f"{prefix}{digest[:16]}{FRAME_SIDECAR_SUFFIX}"
+
+            if cache_path.exists():
+                try:
+                    return pd.read_pickle(cache_path)
+                except Exception as e:
+                    self.logger.warning(f"Ignoring unreadable parse cache {cache_path}: {e}")
+
+            df = parse(self, fixture_id, *args, **kwargs)
+
+            if len(df) > 0:
+                try:
+                    # Drop this key's sidecars for earlier file versions, then
+                    # write atomically
+                    for stale in fixture_dir.glob(f"{prefix}*{FRAME_SIDECAR_SUFFIX}"):
+                        stale.unlink(missing_ok=True)
+                    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+                    df.to_pickle(tmp_path)
+                    os.replace(tmp_path, cache_path)
+                except OSError as e:
+                    self.logger.warning(f"Failed to write parse cache {cache_path}: {e}")
+
+            return df
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,82 @@
+"""Narrow dtypes for parsed DataFrame columns.
+
+Parsers build their DataFrames from raw JSON, which leaves numeric columns as
+float64 (or object when a field is missing) even though minutes, periods and
+IDs fit in far fewer bytes, and free-text columns hold one Python str object
+per cell. This module casts numeric columns to the narrow nullable dtypes
+their values allow, and text columns to Arrow-backed strings.
+"""
+
+import pandas as pd
+
+
+def downcast_columns(df: pd.DataFrame, dtypes: dict[str, str]) -> pd.DataFrame:
+    """
+    Cast numeric columns to narrower dtypes, where their values allow it.
+
+    Columns missing from the DataFrame are ignored. A column whose values do
+    not fit the target dtype (fractions, out-of-range numbers, text) is left
+    as it was, so a malformed fixture never fails to parse here.
+
+    Args:
+        df: DataFrame to cast (not modified)
+        dtypes: Mapping of column name to target dtype (e.g. "Int16")
+
+    Returns:
+        DataFrame with the castable columns narrowed
+
+    Example:
+        >>> events = downcast_columns(events, {"minute": "Int16", "period_id": "Int8"})
+    """
+    narrowed = {}
+    for col, dtype in dtypes.items():
+        if col not in df.columns:
+            continue
+        try:
+            narrowed[col] = pd.to_numeric(df[col]).astype(dtype)
+        except (TypeError, ValueError, OverflowError):
+            continue
+
+    if not narrowed:
+        return df
+    return df.assign(**narrowed)
+
+
+def arrow_string_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """
+    Store text columns as Arrow-backed strings, when pyarrow is installed.
+
+    Arrow keeps the strings in one contiguous buffer instead of a Python str
+    object per cell, and backs the ``.str`` methods with Arrow compute
+    kernels. Columns missing from the DataFrame, or holding values that are
+    not strings, are left as they were.
+
+    Args:
+        df: DataFrame to cast (not modified)
+        columns: Names of the text columns
+
+    Returns:
+        DataFrame with the text columns Arrow-backed, or df unchanged if
+        pyarrow is not installed
+
+    Example:
+        >>> events = arrow_string_columns(events, ["result", "info"])
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return df
+
+    dtype = pd.ArrowDtype(pa.string())
+    converted = {}
+    for col in columns:
+        if col not in df.columns:
+            continue
+        try:
+            converted[col] = df[col].astype(dtype)
+        except (TypeError, ValueError, pa.ArrowInvalid, pa.ArrowTypeError):
+            continue
+
+    if not converted:
+        return df
+    return df.assign(**converted)
@@ -0,0 +1,136 @@
+"""Memoized row lookups for repeatedly sliced DataFrames.
+
+Report code often slices the same events or lineups DataFrame by team or
+player many times. Each ``df[df[col] == value]`` is a full scan; this module
+groups the rows by a column once and serves later slices from the grouping.
+It also counts rows per value of categorical columns straight from their
+codes.
+
+TODO (Framework Evolution):
+    - Support multi-column keys (e.g. team_id + event_category)
+"""
+
+import weakref
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# (id(df), column) -> (weak reference to df, column values, value -> row positions)
+_ROW_GROUPS: dict[tuple[int, str], tuple[weakref.ref, np.ndarray, dict]] = {}
+
+
+def _row_groups(df: pd.DataFrame, column: str) -> dict:
+    """
+    Map each value of a column to its row positions, memoized per DataFrame.
+
+    The grouping is rebuilt if the column has been reassigned since it was
+    cached, and dropped when the DataFrame is garbage collected. In-place
+    edits to the column are not detected.
+    """
+    key = (id(df), column)
+    values = df[column].to_numpy()
+
+    cached = _ROW_GROUPS.get(key)
+    if cached is not None:
+        df_ref, source, groups = cached
+        if (
+            df_ref() is df
+            and len(source) == len(values)
+            and np.may_share_memory(source, values)
+        ):
+            return groups
+
+    groups = df.groupby(column, sort=False, observed=True).indices
+    _ROW_GROUPS[key] = (
+        weakref.ref(df, lambda _, key=key: _ROW_GROUPS.pop(key, None)),
+        values,
+        groups,
+    )
+    return groups
+
+
+def select_rows(df: pd.DataFrame, column: str, value: Any) -> pd.DataFrame:
+    """
+    Select the rows where a column equals a value.
+
+    Equivalent to ``df[df[column] == value]``, but the first call groups the
+    rows by column and later calls on the same DataFrame are a dictionary
+    lookup instead of a scan. The result is a new DataFrame, so callers may
+    modify it freely.
+
+    Args:
+        df: DataFrame to slice
+        column: Column to match on
+        value: Value to select (missing values never match)
+
+    Returns:
+        Matching rows in their original order
+
+    Example:
+        >>> liverpool = select_rows(events_df, "team_id", 8)
+        >>> salah = select_rows(events_df, "player_id", 123456)
+    """
+    positions = _row_groups(df, column).get(value)
+    if positions is None:
+        return df.iloc[:0].copy()
+    return df.iloc[positions]
+
+
+def first_row(df: pd.DataFrame, column: str, value: Any) -> Optional[dict]:
+    """
+    Get the first row where a column equals a value, as a dictionary.
+
+    Uses the same memoized grouping as select_rows, and reads the row's
+    values straight from the columns instead of slicing a DataFrame and
+    taking a row Series from it.
+
+    Args:
+        df: DataFrame to search
+        column: Column to match on
+        value: Value to find (missing values never match)
+
+    Returns:
+        Mapping of column name to value, or None if no row matches
+
+    Example:
+        >>> row = first_row(lineups_df, "player_id", 123456)
+        >>> if row is not None:
+        ...     print(row["position"])
+    """
+    positions = _row_groups(df, column).get(value)
+    if positions is None:
+        return None
+    position = positions[0]
+    return {name: values.iat[position] for name, values in df.items()}
+
+
+def value_counts_dict(values: pd.Series) -> dict:
+    """
+    Count the rows per value, most frequent first, as a dictionary.
+
+    Equivalent to ``values.value_counts().to_dict()`` without the zero counts
+    a categorical reports for unused categories. Categorical columns are
+    counted with one bincount over their codes instead of a hash-based count.
+    Missing values are not counted.
+
+    Args:
+        values: Column to count
+
+    Returns:
+        Mapping of value to row count, in descending count order
+
+    Example:
+        >>> value_counts_dict(events_df["event_category"])
+        {'passing': 812, 'defensive': 240, ...}
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        counts = values.value_counts()
+        return counts[counts > 0].to_dict()
+
+    codes = values.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+    # Stable sort keeps categories with equal counts in category order
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+    return dict(zip(values.cat.categories[order].tolist(), counts[order].tolist()))
@@ -1,15 +1,18 @@
 """Rate limiting utilities for API requests.
 
-Simple rate limiter to avoid overwhelming the SportsMonk API.
+Rate limiters to avoid overwhelming the SportsMonk API:
+- RateLimiter: fixed minimum delay between consecutive requests
+- TokenBucketRateLimiter: quota of requests per time period, allowing bursts
 
 TODO (Framework Evolution):
-    - Token bucket algorithm for burst handling
     - Adaptive rate limiting based on API response headers
     - Retry logic with exponential backoff
     - Rate limit per endpoint (different limits for different endpoints)
 """
 
+import asyncio
 import logging
+import threading
 import time
 from typing import Optional
 
@@ -19,7 +22,8 @@ class RateLimiter:
     Simple rate limiter with fixed delay between requests.
 
     Ensures minimum time between consecutive API calls to respect
-    rate limits and avoid 429 (Too Many Requests) errors.
+    rate limits and avoid 429 (Too Many Requests) errors. Safe to share
+    between threads: callers queue up and are released one delay apart.
 
     Example:
         >>> limiter = RateLimiter(delay=2.0)
@@ -39,6 +43,7 @@ class RateLimiter:
         self.last_request_time: Optional[float] = None
         self.logger = logging.getLogger(__name__)
         self.request_count = 0
+        self._lock = threading.Lock()
 
     def wait(self) -> float:
         """
@@ -54,6 +59,11 @@ class RateLimiter:
             >>> wait_time >= 0.5  # Waited at least 0.5s more
             True
         """
+        with self._lock:
+            return self._wait_locked()
+
+    def _wait_locked(self) -> float:
+        """Wait for the next slot; caller holds the lock."""
         if self.last_request_time is None:
             # First request, no need to wait
             self.last_request_time = time.time()
@@ -65,7 +75,7 @@ class RateLimiter:
         if elapsed < self.delay:
             sleep_time = self.delay - elapsed
             self.logger.debug(
-                f"Rate limiting: waiting {sleep_time:.2f}s " f"(request #{self.request_count + 1})"
+                "Rate limiting: waiting %.2fs (request #%d)", sleep_time, self.request_count + 1
             )
             time.sleep(sleep_time)
             self.last_request_time = time.time()
@@ -113,3 +123,141 @@ class RateLimiter:
             "delay": self.delay,
             "last_request_time": self.last_request_time,
         }
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket rate limiter allowing bursts up to a per-period quota.
+
+    The bucket holds up to ``max_rate`` tokens and refills continuously at
+    ``max_rate / time_period`` tokens per second. Each request takes one
+    token, so a full bucket lets ``max_rate`` requests through at once
+    instead of spacing every request by a fixed delay. The long-run rate
+    is the same as ``RateLimiter(delay=time_period / max_rate)``. Safe to
+    share between threads.
+
+    Provides the same ``wait()`` interface as RateLimiter for synchronous
+    collectors, plus ``wait_async()`` for use with asyncio.
+
+    Example:
+        >>> limiter = TokenBucketRateLimiter(max_rate=10, time_period=60)
+        >>> [limiter.wait() for _ in range(10)]  # First 10 go through at once
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        >>> limiter.wait()  # 11th waits for a token (~6s)
+    """
+
+    def __init__(self, max_rate: int = 10, time_period: float = 60.0):
+        """
+        Initialize token bucket rate limiter.
+
+        Args:
+            max_rate: Maximum requests allowed per time period (bucket size)
+            time_period: Length of the quota period in seconds (default: 60.0)
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.interval = time_period / max_rate
+        self.tokens = float(max_rate)
+        self.last_refill_time: Optional[float] = None
+        self.logger = logging.getLogger(__name__)
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token, refilling the bucket first.
+
+        The token is taken immediately (the count may go negative), so
+        concurrent callers each reserve their own slot and then sleep
+        outside the lock.
+
+        Returns:
+            Seconds the caller must wait before making its request
+        """
+        with self._lock:
+            return self._reserve_locked()
+
+    def _reserve_locked(self) -> float:
+        """Take a token; caller holds the lock."""
+        now = time.monotonic()
+        if self.interval <= 0:
+            self.tokens = float(self.max_rate)
+        elif self.last_refill_time is not None:
+            refill = (now - self.last_refill_time) / self.interval
+            self.tokens = min(float(self.max_rate), self.tokens + refill)
+        self.last_refill_time = now
+
+        self.tokens -= 1
+        self.request_count += 1
+        return max(0.0, -self.tokens * self.interval)
+
+    def wait(self) -> float:
+        """
+        Wait until a token is available.
+
+        Returns:
+            Actual time waited in seconds
+        """
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            self.logger.debug(
+                "Rate limiting: waiting %.2fs (request #%d)", sleep_time, self.request_count
+            )
+            time.sleep(sleep_time)
+        return sleep_time
+
+    async def wait_async(self) -> float:
+        """
+        Wait until a token is available without blocking the event loop.
+
+        Returns:
+            Actual time waited in seconds
+
+        Example:
+            >>> limiter = TokenBucketRateLimiter(max_rate=10, time_period=60)
+            >>> await limiter.wait_async()
+            0.0
+        """
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            self.logger.debug(
+                "Rate limiting: waiting %.2fs (request #%d)", sleep_time, self.request_count
+            )
+            await asyncio.sleep(sleep_time)
+        return sleep_time
+
+    def reset(self) -> None:
+        """
+        Reset the rate limiter to a full bucket.
+
+        Example:
+            >>> limiter = TokenBucketRateLimiter()
+            >>> limiter.wait()
+            >>> limiter.reset()
+            >>> limiter.request_count
+            0
+        """
+        self.tokens = float(self.max_rate)
+        self.last_refill_time = None
+        self.request_count = 0
+        self.logger.debug("Rate limiter reset")
+
+    def get_stats(self) -> dict:
+        """
+        Get rate limiter statistics.
+
+        Returns:
+            Dictionary with request_count, max_rate, time_period and tokens
+
+        Example:
+            >>> limiter = TokenBucketRateLimiter(max_rate=10, time_period=60)
+            >>> limiter.wait()
+            >>> limiter.get_stats()["tokens"]
+            9.0
+        """
+        return {
+            "request_count": self.request_count,
+            "max_rate": self.max_rate,
+            "time_period": self.time_period,
+            "tokens": self.tokens,
+        }
@@ -2,6 +2,8 @@
 Game state analysis helpers.
 """
 
+from bisect import bisect_right
+from operator import itemgetter
 from pathlib import Path
 
 import pandas as pd
@@ -53,8 +55,10 @@ def reconstruct_game_states(
 
     intervals = [(0, 0, 0, "DRAW")]  # kick-off: 0-0
 
-    for _, row in goals.iterrows():
-        result_str = str(row["result"]).strip()
+    # Only two columns are read per goal: iterate them as plain values
+    # rather than building a Series per row with iterrows()
+    for result, eff_minute in zip(goals["result"].to_numpy(), goals["eff_minute"].to_numpy()):
+        result_str = str(result).strip()
         if "-" not in result_str:
             continue
         parts = result_str.split("-")
@@ -75,20 +79,19 @@ def reconstruct_game_states(
         else:
             state = "DRAW"
 
-        intervals.append((int(row["eff_minute"]), lfc_g, opp_g, state))
+        intervals.append((int(eff_minute), lfc_g, opp_g, state))
 
     return intervals
 
 
 def get_state_at_minute(intervals: list[tuple[int, int, int, str]], minute: int) -> str:
-    """Return Liverpool game state at a given match minute."""
-    state = "DRAW"
-    for m, _lg, _og, s in intervals:
-        if m <= minute:
-            state = s
-        else:
-            break
-    return state
+    """Return Liverpool game state at a given match minute.
+
+    ``intervals`` is sorted by minute (as built by reconstruct_game_states),
+    so the interval in force is found by binary search.
+    """
+    i = bisect_right(intervals, minute, key=itemgetter(0))
+    return intervals[i - 1][3] if i else "DRAW"
 
 
 def final_score(intervals: list[tuple[int, int, int, str]]) -> tuple[int, int]:
@@ -1,10 +1,151 @@
 """Tests for SportsMonk API client."""
 
+import asyncio
+from unittest.mock import Mock
+
 import pytest
-from football_analytics.api_client import SportsMonkClient
+from football_analytics.api_client import AsyncSportsMonkClient, SportsMonkClient
 
 
 def test_client_initialization_without_key():
     """Test that client raises error when API key is not provided."""
     with pytest.raises(ValueError, match="API key must be provided"):
         SportsMonkClient()
+
+
+def test_async_client_initialization_without_key(monkeypatch):
+    """Test that async client raises error when API key is not provided."""
+    monkeypatch.delenv("SPORTSMONK_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="API key must be provided"):
+        AsyncSportsMonkClient()
+
+
+def test_make_request_uses_disk_cache(tmp_path):
+    """Test that a cached response is returned without another HTTP call."""
+    client = SportsMonkClient(api_key="test", cache_dir=str(tmp_path))
+    response = Mock(content=b'{"data": [{"id": 8}]}')
+    client.session.get = Mock(return_value=response)
+
+    first = client._make_request("seasons", {"per_page": 100})
+    second = client._make_request("seasons", {"per_page": 100})
+
+    assert first == second == {"data": [{"id": 8}]}
+    assert client.session.get.call_count == 1
+
+    client._make_request("seasons", {"per_page": 100}, use_cache=False)
+    assert client.session.get.call_count == 2
+
+
+def test_use_cache_false_leaves_cache_untouched(tmp_path):
+    """Test that a request with use_cache=False neither reads nor writes the cache."""
+    client = SportsMonkClient(api_key="test", cache_dir=str(tmp_path))
+    client.session.get = Mock(return_value=Mock(content=b'{"data": []}'))
+
+    client._make_request("seasons", use_cache=False)
+
+    assert list(tmp_path.iterdir()) == []
+    assert client.get_cached_response("seasons") is None
+
+
+def test_no_cache_dir_disables_caching(tmp_path, monkeypatch):
+    """Test that without a cache_dir every request goes to the API and nothing is written."""
+    monkeypatch.chdir(tmp_path)
+    client = SportsMonkClient(api_key="test")
+    client.session.get = Mock(return_value=Mock(content=b'{"data": []}'))
+
+    client._make_request("seasons")
+    client._make_request("seasons")
+    client.cache_response("seasons", None, {"data": []})
+
+    assert client.session.get.call_count == 2
+    assert client.get_cached_response("seasons") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fixture_details_raw_returns_body_and_shares_cache(tmp_path):
+    """Test that the raw fetch returns the body untouched and fills the JSON cache."""
+    client = SportsMonkClient(api_key="test", cache_dir=str(tmp_path))
+    body = b'{"data":{"id":1,"events":[]}}'
+    response = Mock(content=body, headers={"Content-Type": "application/json"})
+    client.session.get = Mock(return_value=response)
+
+    assert client.get_fixture_details_raw(1, include="events") == (body, "application/json")
+    assert client.get_fixture_details_raw(1, include="events")[0] == body
+    assert client.get_fixture_details(1, include="events") == {"data": {"id": 1, "events": []}}
+    assert client.session.get.call_count == 1
+
+
+def test_async_paginate_follows_has_more():
+    """Test that pagination yields rows from every page until has_more is False."""
+    client = AsyncSportsMonkClient(api_key="test")
+    pages_requested = []
+
+    async def fake_request(endpoint, params=None):
+        page = params["page"]
+        pages_requested.append(page)
+        return {"data": [{"id": page}], "pagination": {"has_more": page < 3}}
+
+    client._make_request = fake_request
+
+    async def collect():
+        return [row async for row in client.get_seasons_all(league_id=8)]
+
+    assert asyncio.run(collect()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert pages_requested == [1, 2, 3]
+
+
+def test_async_paginate_cancels_prefetch_when_stopped_early():
+    """Test that stopping iteration early cancels the prefetched page request."""
+    client = AsyncSportsMonkClient(api_key="test")
+
+    async def fake_request(endpoint, params=None):
+        if params["page"] > 1:
+            await asyncio.sleep(10)
+        return {"data": [{"id": params["page"]}], "pagination": {"has_more": True}}
+
+    client._make_request = fake_request
+
+    async def first_row():
+        rows = client.get_seasons_all(league_id=8)
+        async for row in rows:
+            await rows.aclose()
+            return row, asyncio.all_tasks() - {asyncio.current_task()}
+
+    row, pending = asyncio.run(first_row())
+
+    assert row == {"id": 1}
+    assert not pending
+
+
+def test_lookup_methods_are_memoized(tmp_path):
+    """Test that repeated read-only lookups reuse the first result."""
+    client = SportsMonkClient(api_key="test", cache_dir=str(tmp_path))
+    client._make_request = Mock(return_value={"data": [{"id": 8}]})
+
+    client.search_team("Liverpool")
+    client.search_team("Liverpool")
+    client.search_team("Arsenal")
+
+    assert client._make_request.call_count == 2
+
+
+def test_memoized_lookups_are_bounded_and_expire(tmp_path, monkeypatch):
+    """Test that the lookup memo evicts least recently used entries and expires old ones."""
+    client = SportsMonkClient(api_key="test", cache_dir=str(tmp_path))
+    client._make_request = Mock(return_value={"data": []})
+    monkeypatch.setattr(SportsMonkClient, "MEMO_MAXSIZE", 2)
+
+    client.search_team("Liverpool")
+    client.search_team("Arsenal")
+    client.search_team("Liverpool")  # Hit; Arsenal is now least recently used
+    client.search_team("Chelsea")  # Evicts Arsenal
+    assert client._make_request.call_count == 3
+
+    client.search_team("Liverpool")
+    assert client._make_request.call_count == 3
+    client.search_team("Arsenal")
+    assert client._make_request.call_count == 4
+
+    monkeypatch.setattr(SportsMonkClient, "MEMO_TTL", 0)
+    client.search_team("Arsenal")
+    assert client._make_request.call_count == 5
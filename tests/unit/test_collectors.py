@@ -1,9 +1,15 @@
 """Unit tests for data collectors."""
 
+import json
+from datetime import date, timedelta
 from unittest.mock import Mock, patch
 
+import pytest
+
 from football_analytics.collectors import FixtureCollector, MatchDataCollector
 from football_analytics.collectors.base import BaseCollector
+from football_analytics.data_processor import DataProcessor
+from football_analytics.utils import load_json
 
 
 class TestBaseCollector:
@@ -16,7 +22,7 @@ class TestBaseCollector:
         assert collector.output_dir == tmp_path
         assert tmp_path.exists()
         assert collector.resume is True
-        assert collector.stats["api_calls"] == 0
+        assert collector.stats.api_calls == 0
 
     def test_should_skip_when_resume_enabled(self, tmp_path):
         """Test should_skip returns True for existing files when resume enabled."""
@@ -26,7 +32,7 @@ class TestBaseCollector:
         existing_file.touch()
 
         assert collector.should_skip(existing_file) is True
-        assert collector.stats["files_skipped"] == 1
+        assert collector.stats.files_skipped == 1
 
     def test_should_not_skip_when_resume_disabled(self, tmp_path):
         """Test should_skip returns False when resume disabled."""
@@ -37,6 +43,28 @@ class TestBaseCollector:
 
         assert collector.should_skip(existing_file) is False
 
+    def test_note_written_updates_resume_manifest(self, tmp_path):
+        """Test files recorded with note_written are skipped without a rescan."""
+        collector = BaseCollector(output_dir=str(tmp_path), resume=True)
+
+        output_file = tmp_path / "12345" / "events.json"
+        assert collector.should_skip(output_file) is False
+
+        output_file.parent.mkdir()
+        output_file.touch()
+        collector.note_written(output_file)
+
+        assert collector.should_skip(output_file) is True
+
+    def test_make_output_dir_primes_manifest_for_new_directory(self, tmp_path):
+        """Test a newly created directory is recorded as empty without a scan."""
+        collector = BaseCollector(output_dir=str(tmp_path))
+
+        fixture_dir = collector.make_output_dir(tmp_path / "12345")
+
+        assert fixture_dir.is_dir()
+        assert collector._existing[fixture_dir] == set()
+
     def test_statistics_tracking(self, tmp_path):
         """Test statistics are tracked correctly."""
         collector = BaseCollector(output_dir=str(tmp_path))
@@ -113,6 +141,167 @@ class TestFixtureCollector:
         assert 99999 in collector.SEASON_DATE_RANGES
         assert collector.SEASON_DATE_RANGES[99999] == ("2025-08-01", "2026-05-31")
 
+    def test_find_fixtures_for_season_ignores_404_dates(self, tmp_path):
+        """Test dates without matches (404) are skipped without counting errors."""
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.add_season_date_range(99998, "2024-08-17", "2024-08-31")
+
+        fixture = {
+            "id": 19134454,
+            "starting_at": "2024-08-17T12:00:00",
+            "participants": [{"id": 14, "name": "Ipswich Town"}, {"id": 8, "name": "Liverpool"}],
+        }
+        collector.client = Mock()
+        collector.client.get_cached_response.return_value = None
+        collector.client._make_request.side_effect = [
+            # Schedule endpoint finds nothing, so the date search runs
+            Exception("404 Client Error: Not Found"),
+            {"data": [fixture]},
+            Exception("404 Client Error: Not Found"),
+            {"data": []},
+        ]
+
+        fixtures = collector._find_fixtures_for_season(99998)
+
+        assert [f["fixture_id"] for f in fixtures] == [19134454]
+        assert collector.stats.api_calls == 2
+        assert collector.stats.errors == 0
+
+    def test_schedule_falls_back_to_date_search_only_when_empty(self, tmp_path):
+        """Test an empty schedule falls back to the date search."""
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.add_season_date_range(99995, "2024-08-17", "2024-08-17")
+        collector.client = Mock()
+        collector.client.get_cached_response.return_value = None
+        collector.client._make_request.side_effect = [{"data": []}, {"data": []}]
+
+        assert collector._find_fixtures_for_season(99995) == []
+        endpoints = [c.args[0] for c in collector.client._make_request.call_args_list]
+        assert endpoints[0].startswith("fixtures/between/")
+        assert endpoints[1] == "fixtures/date/2024-08-17"
+
+    def test_schedule_errors_are_raised_not_masked(self, tmp_path):
+        """Test a non-404 schedule failure is counted and raised instead of falling back."""
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.add_season_date_range(99994, "2024-08-17", "2024-08-24")
+        collector.client = Mock()
+        collector.client.get_cached_response.return_value = None
+        collector.client._make_request.side_effect = Exception("401 Client Error: Unauthorized")
+
+        with pytest.raises(Exception, match="401"):
+            collector._find_fixtures_for_season(99994)
+        assert collector.client._make_request.call_count == 1
+        assert collector.stats.errors == 1
+
+    def test_settled_dates_served_from_cache(self, tmp_path):
+        """Test cached responses for past dates are used without a request."""
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.client = Mock()
+        collector.client.get_cached_response.return_value = {"data": []}
+
+        results = list(collector._fetch_dates(["2024-08-17"]))
+
+        assert results == [("2024-08-17", {"data": []})]
+        collector.client._make_request.assert_not_called()
+        assert collector.client.get_cached_response.call_args.args[2] == float("inf")
+        assert collector.stats.api_calls == 0
+
+    def test_only_fetched_dates_count_as_api_calls(self, tmp_path):
+        """Test dates served from the cache are not counted as API calls."""
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.client = Mock()
+        collector.client.get_cached_response.side_effect = [{"data": []}, None]
+        collector.client._make_request.return_value = {"data": []}
+
+        results = list(collector._fetch_dates(["2024-08-17", "2024-08-24"]))
+
+        assert [date_str for date_str, _ in results] == ["2024-08-17", "2024-08-24"]
+        assert collector.client._make_request.call_count == 1
+        assert collector.stats.api_calls == 1
+
+    def test_collect_fixtures_writes_jsonl_and_sorted_list(self, tmp_path):
+        """Test each season is checkpointed to JSONL and consolidated sorted by date."""
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.add_season_date_range(99997, "2024-08-17", "2024-08-24")
+
+        def fixture(fixture_id, date):
+            return {"id": fixture_id, "starting_at": date, "participants": [{"id": 8}]}
+
+        collector.client = Mock()
+        collector.client.get_cached_response.return_value = None
+        collector.client._make_request.side_effect = [
+            {"data": [fixture(2, "2024-08-18T15:00:00")], "pagination": {"has_more": True}},
+            {"data": [fixture(1, "2024-08-17T12:00:00")]},
+        ]
+
+        fixtures = collector.collect_fixtures_for_seasons([99997])
+
+        assert [f["fixture_id"] for f in fixtures] == [1, 2]
+        assert collector.stats.api_calls == 2
+        season_lines = (tmp_path / "fixtures_list.99997.jsonl").read_text().splitlines()
+        assert [json.loads(line)["fixture_id"] for line in season_lines] == [1, 2]
+        assert json.loads((tmp_path / "fixtures_list.json").read_text()) == fixtures
+
+        pytest.importorskip("pyarrow")
+        reloaded = DataProcessor.load_fixtures_parquet(tmp_path / "fixtures_list.parquet")
+        assert reloaded["fixture_id"].tolist() == [1, 2]
+
+    def test_resume_reads_checkpointed_seasons(self, tmp_path):
+        """Test a rerun with resume loads completed seasons instead of re-collecting them."""
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.add_season_date_range(99996, "2024-08-17", "2024-08-24")
+        collector.client = Mock()
+        collector.client.get_cached_response.return_value = None
+        collector.client._make_request.return_value = {
+            "data": [{"id": 1, "starting_at": "2024-08-17T12:00:00", "participants": [{"id": 8}]}]
+        }
+        first = collector.collect_fixtures_for_seasons([99996])
+
+        rerun = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        rerun.client = Mock()
+
+        assert rerun.collect_fixtures_for_seasons([99996]) == first
+        rerun.client._make_request.assert_not_called()
+        assert (tmp_path / "fixtures_list.99996.jsonl").read_text().count("\n") == 1
+
+    def test_resume_recollects_current_season(self, tmp_path):
+        """Test a rerun re-collects a season that has not finished yet."""
+        today = date.today()
+        collector = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.add_season_date_range(
+            99995, f"{today - timedelta(days=7):%Y-%m-%d}", f"{today + timedelta(days=30):%Y-%m-%d}"
+        )
+
+        def schedule(state_id):
+            fixture = {
+                "id": 1,
+                "starting_at": f"{today:%Y-%m-%d}T12:00:00",
+                "state_id": state_id,
+                "participants": [{"id": 8}],
+            }
+            return {"data": [fixture]}
+
+        collector.client = Mock()
+        collector.client.get_cached_response.return_value = None
+        collector.client._make_request.return_value = schedule(1)  # not started
+        collector.collect_fixtures_for_seasons([99995])
+
+        rerun = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        rerun.client = collector.client
+        rerun.client._make_request.return_value = schedule(5)  # finished
+
+        fixtures = rerun.collect_fixtures_for_seasons([99995])
+
+        assert [f["state_id"] for f in fixtures] == [5]
+        assert rerun.stats.api_calls == 1
+
+        # Every fixture is now finished, so the checkpoint is reused
+        final = FixtureCollector(team_id=8, output_dir=str(tmp_path), rate_limit_seconds=0)
+        final.client = Mock()
+
+        assert final.collect_fixtures_for_seasons([99995]) == fixtures
+        final.client._make_request.assert_not_called()
+
 
 class TestMatchDataCollector:
     """Tests for MatchDataCollector."""
@@ -130,7 +319,7 @@ class TestMatchDataCollector:
     def test_collect_fixture_creates_directory(self, mock_client_class, tmp_path):
         """Test that collecting a fixture creates its directory."""
         mock_client = Mock()
-        mock_client.get_fixture_details.return_value = {"data": {}}
+        mock_client.get_fixture_details_raw.return_value = (b'{"data":{}}', "application/json")
 
         with patch(
             "football_analytics.collectors.match_data.SportsMonkClient", return_value=mock_client
@@ -146,7 +335,9 @@ class TestMatchDataCollector:
     def test_collect_fixture_saves_all_includes(self, mock_client_class, tmp_path):
         """Test that all includes are fetched and saved."""
         mock_client = Mock()
-        mock_client.get_fixture_details.return_value = {"data": {"test": "data"}}
+        mock_client.get_fixture_details_raw.return_value = (
+            b'{"data":{"test":"data"}}', "application/json"
+        )
 
         with patch(
             "football_analytics.collectors.match_data.SportsMonkClient", return_value=mock_client
@@ -167,7 +358,7 @@ class TestMatchDataCollector:
     def test_resume_skips_existing_files(self, mock_client_class, tmp_path):
         """Test that resume skips existing files."""
         mock_client = Mock()
-        mock_client.get_fixture_details.return_value = {"data": {}}
+        mock_client.get_fixture_details_raw.return_value = (b'{"data":{}}', "application/json")
 
         with patch(
             "football_analytics.collectors.match_data.SportsMonkClient", return_value=mock_client
@@ -188,13 +379,145 @@ class TestMatchDataCollector:
         assert results["ballCoordinates"] is True
 
         # Other includes should have been fetched
-        assert mock_client.get_fixture_details.call_count == 6  # 7 total - 1 skipped
+        assert mock_client.get_fixture_details_raw.call_count == 6  # 7 total - 1 skipped
+
+    def test_concurrent_collection_fetches_missing_includes(self, tmp_path):
+        """Test concurrency > 1 gathers missing includes in one batch, saved as raw bodies."""
+        requested = []
+
+        class FakeAsyncClient:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                pass
+
+            async def gather_requests(self, requests, raw=False):
+                assert raw
+                requested.append(requests)
+                return [b'{"data":{}}' for _ in requests]
+
+        collector = MatchDataCollector(output_dir=str(tmp_path), concurrency=4)
+        collector._async_client = FakeAsyncClient
+
+        fixture_dir = tmp_path / "12345"
+        fixture_dir.mkdir()
+        (fixture_dir / "events.json").write_text("{}")
+
+        results = collector.collect_all_fixtures([{"fixture_id": 12345}])
+
+        assert all(results[12345].values())
+        assert len(requested) == 1
+        assert [params["include"] for _, params in requested[0]] == [
+            include for include in collector.INCLUDES if include != "events"
+        ]
+        assert collector.stats.files_created == 6
+        assert (fixture_dir / "lineups.json").read_bytes() == b'{"data":{}}'
+
+    def test_skips_includes_predicted_empty(self, tmp_path):
+        """Test includes that are almost never populated for a league/state are skipped."""
+        collector = MatchDataCollector(output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.client = Mock()
+        collector.client.get_fixture_details_raw.return_value = (
+            b'{"data":{"id":12345,"events":[{"id":1}]}}',
+            "application/json",
+        )
+        collector._hit_rates = {"8:5:ballCoordinates": [1, 60]}
+
+        fixture = {"fixture_id": 12345, "league_id": 8, "state_id": 5}
+        results = collector.collect_all_fixtures([fixture])
+
+        assert results[12345]["ballCoordinates"] is None
+        assert all(
+            success for name, success in results[12345].items() if name != "ballCoordinates"
+        )
+        raw_calls = collector.client.get_fixture_details_raw.call_args_list
+        fetched = [c.kwargs["include"] for c in raw_calls]
+        assert "ballCoordinates" not in fetched
+        assert len(fetched) == 6
+        assert not (tmp_path / "12345" / "ballCoordinates.json").exists()
+
+        hit_rates = load_json(tmp_path / collector.HIT_RATE_FILE)
+        assert hit_rates["8:5:events"] == [1, 1, 0]
+        assert hit_rates["8:5:lineups"] == [0, 1, 0]
+        assert hit_rates["8:5:ballCoordinates"] == [1, 60, 1]
+
+    def test_skipped_includes_are_reprobed(self, tmp_path):
+        """Test a skipped include is fetched periodically and unskipped once it has data."""
+        collector = MatchDataCollector(output_dir=str(tmp_path), rate_limit_seconds=0)
+        fixture = {"fixture_id": 12345, "league_id": 8, "state_id": 5}
+        collector._hit_rates = {"8:5:ballCoordinates": [1, 60]}
+
+        skips = [collector._predict_empty(fixture, "ballCoordinates") for _ in range(25)]
+
+        # Every REPROBE_EVERY-th would-be skip is fetched instead
+        assert skips.count(False) == 1
+        assert skips.index(False) == collector.REPROBE_EVERY - 1
+
+        collector._record_hit(fixture, "ballCoordinates", b'{"data":{"ballcoordinates":[{}]}}')
+
+        assert collector._hit_rates["8:5:ballCoordinates"] == [1, 1, 0]
+        assert not collector._predict_empty(fixture, "ballCoordinates")
+
+    def test_record_hit_reads_the_include_field_of_raw_bodies(self, tmp_path):
+        """Test raw bodies are judged by data[include], whatever their formatting."""
+        collector = MatchDataCollector(output_dir=str(tmp_path), rate_limit_seconds=0)
+        fixture = {"fixture_id": 12345, "league_id": 8, "state_id": 5}
+
+        # Pretty-printed, and an empty "events" key nested before the real one
+        body = b'{\n  "data": {\n    "meta": {"events" : []},\n    "events" : [{"id": 1}]\n  }\n}'
+        collector._record_hit(fixture, "events", body)
+        collector._record_hit(fixture, "lineups", b'{"data": {"lineups": []}}')
+        collector._record_hit(fixture, "scores", b"not json")
+
+        assert collector._hit_rates["8:5:events"] == [1, 1, 0]
+        assert collector._hit_rates["8:5:lineups"] == [0, 1, 0]
+        assert collector._hit_rates["8:5:scores"] == [0, 1, 0]
+
+    def test_retry_failed_includes_counts_across_threads(self, tmp_path):
+        """Test retries on the thread pool are all reflected in the collector stats."""
+        collector = MatchDataCollector(output_dir=str(tmp_path), rate_limit_seconds=0)
+        collector.client = Mock()
+        collector.client.get_fixture_details_raw.return_value = (b'{"data":{}}', "application/json")
+        results = {
+            fixture_id: {include_name: False for include_name in collector.INCLUDES}
+            for fixture_id in range(1, 11)
+        }
+
+        collector.retry_failed_includes(results, max_workers=8)
+
+        assert all(all(includes.values()) for includes in results.values())
+        assert collector.stats.api_calls == 70
+        assert collector.stats.files_created == 70
+        assert collector.stats.errors == 0
+
+    def test_compressed_includes_written_and_resumed(self, tmp_path):
+        """Test compress=True writes .json.zst and resume accepts either format."""
+        pytest.importorskip("zstandard")
+        collector = MatchDataCollector(
+            output_dir=str(tmp_path), rate_limit_seconds=0, compress=True
+        )
+        collector.client = Mock()
+        collector.client.get_fixture_details_raw.return_value = (b'{"data":{}}', "application/json")
+
+        fixture_dir = tmp_path / "12345"
+        fixture_dir.mkdir()
+        (fixture_dir / "events.json").write_text("{}")
+
+        results = collector._collect_fixture(12345)
+
+        assert all(results.values())
+        assert collector.client.get_fixture_details_raw.call_count == 6
+        assert load_json(fixture_dir / "scores.json.zst") == {"data": {}}
+        assert not (fixture_dir / "events.json.zst").exists()
 
     @patch("football_analytics.collectors.match_data.SportsMonkClient")
     def test_collect_single_include(self, mock_client_class, tmp_path):
         """Test collecting a single include."""
         mock_client = Mock()
-        mock_client.get_fixture_details.return_value = {"data": {"test": "data"}}
+        mock_client.get_fixture_details_raw.return_value = (
+            b'{"data":{"test":"data"}}', "application/json"
+        )
 
         with patch(
             "football_analytics.collectors.match_data.SportsMonkClient", return_value=mock_client
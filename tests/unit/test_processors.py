@@ -0,0 +1,80 @@
+"""Unit tests for data processors."""
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from football_analytics.processors.ball_coordinates import (
+    _COORD_INDEXES,
+    BallCoordinateProcessor,
+    CoordIndex,
+)
+
+
+class TestCoordIndex:
+    """Tests for the memoized coordinate time index."""
+
+    def test_for_frame_memoizes_and_rebuilds(self):
+        """Test the index is reused until estimated_minute is reassigned."""
+        coords_df = pd.DataFrame({"estimated_minute": [3.0, np.nan, 1.0, 2.0]})
+
+        index = CoordIndex.for_frame(coords_df)
+        assert CoordIndex.for_frame(coords_df) is index
+        assert index.query_positions(np.array([1.1, 2.9, 9.0]), 0.5).tolist() == [2, 0, -1]
+
+        coords_df["estimated_minute"] = [0.0, 1.0, 2.0, 3.0]
+        rebuilt = CoordIndex.for_frame(coords_df)
+        assert rebuilt is not index
+        assert rebuilt.query(1.1, 0.5)["estimated_minute"] == 1.0
+
+    def test_indexed_frame_still_writes_parquet(self, tmp_path):
+        """Test indexing leaves attrs alone, so the frame still serializes."""
+        pytest.importorskip("pyarrow")
+        coords_df = pd.DataFrame({"estimated_minute": [1.0, 2.0], "x": [0.1, 0.2]})
+
+        CoordIndex.for_frame(coords_df)
+        coords_df.to_parquet(tmp_path / "coords.parquet")
+
+        assert coords_df.attrs == {}
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "coords.parquet"), coords_df)
+
+    def test_index_is_dropped_with_its_frame(self):
+        """Test the memo does not keep an indexed frame alive."""
+        coords_df = pd.DataFrame({"estimated_minute": [1.0, 2.0]})
+        CoordIndex.for_frame(coords_df)
+        key = id(coords_df)
+        assert key in _COORD_INDEXES
+
+        del coords_df
+        gc.collect()
+
+        assert key not in _COORD_INDEXES
+
+
+class TestPossessionInference:
+    """Tests for possession inference from events."""
+
+    def test_same_minute_events_resolve_by_sort_order(self):
+        """Test ties at one minute go to the later event, whatever the minute dtype."""
+        # Both teams have a possession event at minute 10; team 9's comes later
+        events = pd.DataFrame(
+            {
+                "minute": [10, 10, 10, 20],
+                "sort_order": [3, 1, 2, 4],
+                "team_id": [9, 8, 8, 8],
+                "type_name": ["Pass", "Pass", "Shot", "Pass"],
+            }
+        )
+        processor = BallCoordinateProcessor()
+
+        teams = []
+        for dtype in ("Int16", "float64"):
+            coords_df = pd.DataFrame({"estimated_minute": [5.0, 10.0, 10.1, 15.0, 20.0]})
+            events_df = events.astype({"minute": dtype})
+            result = processor.infer_possession(coords_df, events_df)
+            teams.append(result["possession_team"].tolist())
+
+        assert teams[0] == teams[1]
+        assert teams[0] == [pd.NA, 9, 9, 9, 8]
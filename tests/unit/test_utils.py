@@ -4,14 +4,28 @@ import json
 import logging
 import time
 
+import pandas as pd
+import pytest
+
 from football_analytics.utils import (
     RateLimiter,
+    TokenBucketRateLimiter,
     backup_directory,
+    downcast_columns,
     file_exists,
+    find_json,
+    first_row,
     load_json,
     save_json,
+    save_json_zst,
+    select_rows,
     setup_logging,
+    value_counts_dict,
 )
+from football_analytics.utils import file_io, frame_cache
+from football_analytics.utils.fixture_pool import map_fixtures
+from football_analytics.utils.frame_dtypes import arrow_string_columns
+from football_analytics.utils.frame_cache import cached_frame
 
 
 class TestFileIO:
@@ -41,6 +55,31 @@ class TestFileIO:
         assert filepath.exists()
         assert filepath.parent.exists()
 
+    def test_save_json_zst_round_trip_and_find_json(self, tmp_path):
+        """Test zstd-compressed JSON is found in place of a missing .json and loads back."""
+        pytest.importorskip("zstandard")
+        data = {"data": {"events": [{"id": 1}]}}
+
+        save_json_zst(data, tmp_path / "events.json.zst")
+        save_json_zst(b'{"data":{}}', tmp_path / "scores.json.zst")
+
+        assert find_json(tmp_path / "events.json") == tmp_path / "events.json.zst"
+        assert load_json(find_json(tmp_path / "events.json")) == data
+        assert load_json(tmp_path / "scores.json.zst") == {"data": {}}
+        assert find_json(tmp_path / "missing.json") == tmp_path / "missing.json"
+
+    def test_load_json_memory_maps_large_files(self, tmp_path, monkeypatch):
+        """Test that files over the mmap threshold load the same data."""
+        monkeypatch.setattr(file_io, "MMAP_THRESHOLD_BYTES", 0)
+        data = {"data": [{"id": 1, "name": "Salah"}]}
+        filepath = save_json(data, tmp_path / "events.json")
+
+        assert load_json(filepath) == data
+
+        filepath.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(filepath)
+
     def test_file_exists(self, tmp_path):
         """Test file existence check."""
         existing_file = tmp_path / "exists.json"
@@ -56,6 +95,8 @@ class TestFileIO:
         source_dir.mkdir()
         (source_dir / "file1.json").write_text('{"a": 1}')
         (source_dir / "file2.json").write_text('{"b": 2}')
+        (source_dir / "file1.0123abcd.0123456789abcdef.frame.pkl").write_bytes(b"sidecar")
+        (source_dir / "model.pkl").write_bytes(b"user pickle")
 
         # Backup
         backup_dir = tmp_path / "backup"
@@ -64,6 +105,7 @@ class TestFileIO:
         assert result.exists()
         assert (result / "file1.json").exists()
         assert (result / "file2.json").exists()
+        assert [path.name for path in result.glob("*.pkl")] == ["model.pkl"]
 
         # Verify content
         assert json.loads((result / "file1.json").read_text()) == {"a": 1}
@@ -131,6 +173,197 @@ class TestRateLimiter:
         assert stats["last_request_time"] is not None
 
 
+class TestTokenBucketRateLimiter:
+    """Tests for token bucket rate limiter."""
+
+    def test_burst_up_to_max_rate_without_wait(self):
+        """Test that a full bucket lets max_rate requests through at once."""
+        limiter = TokenBucketRateLimiter(max_rate=3, time_period=3.0)
+
+        assert [limiter.wait() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.request_count == 3
+
+    def test_waits_for_refill_when_empty(self):
+        """Test that requests beyond the quota wait for a token."""
+        limiter = TokenBucketRateLimiter(max_rate=2, time_period=0.4)
+        limiter.wait()
+        limiter.wait()
+
+        start = time.time()
+        wait_time = limiter.wait()
+        elapsed = time.time() - start
+
+        assert wait_time >= 0.15  # One token every 0.2s, allow timing variance
+        assert elapsed >= 0.15
+
+
+class TestFrameIndex:
+    """Tests for memoized row selection."""
+
+    def test_select_rows_matches_boolean_filter(self):
+        """Test that select_rows returns the same rows as a boolean mask."""
+        df = pd.DataFrame({"team_id": [8, 9, 8, None, 9], "minute": [1, 2, 3, 4, 5]})
+
+        for team_id in (8, 9):
+            pd.testing.assert_frame_equal(
+                select_rows(df, "team_id", team_id), df[df["team_id"] == team_id]
+            )
+
+        missing = select_rows(df, "team_id", 10)
+        assert len(missing) == 0
+        assert list(missing.columns) == ["team_id", "minute"]
+
+    def test_select_rows_sees_reassigned_column(self):
+        """Test that reassigning the column invalidates the cached grouping."""
+        df = pd.DataFrame({"team_id": [8, 9, 8]})
+        assert len(select_rows(df, "team_id", 8)) == 2
+
+        df["team_id"] = [9, 9, 8]
+
+        assert list(select_rows(df, "team_id", 8).index) == [2]
+
+    def test_first_row_returns_first_match_as_dict(self):
+        """Test that first_row returns the first matching row's values."""
+        df = pd.DataFrame({"player_id": [5, 7, 5], "position": ["CB", "ST", "GK"]})
+
+        assert first_row(df, "player_id", 5) == {"player_id": 5, "position": "CB"}
+        assert first_row(df, "player_id", 9) is None
+
+    def test_value_counts_dict_matches_value_counts(self):
+        """Test categorical counts match value_counts without unused categories."""
+        values = ["pass", "shot", "pass", None, "tackle", "pass", "shot"]
+        categories = pd.CategoricalDtype(["foul", "pass", "shot", "tackle"])
+        categorical = pd.Series(values, dtype=categories)
+
+        expected = {"pass": 3, "shot": 2, "tackle": 1}
+        assert value_counts_dict(categorical) == expected
+        assert list(value_counts_dict(categorical)) == list(expected)
+        assert value_counts_dict(pd.Series(values, dtype=object)) == expected
+
+
+class TestFrameDtypes:
+    """Tests for numeric column downcasting."""
+
+    def test_downcast_columns_narrows_castable_columns(self):
+        """Test that integral columns are narrowed and missing values kept."""
+        df = pd.DataFrame({"minute": [1.0, None, 90.0], "player_id": [10, 20, 30]})
+
+        result = downcast_columns(df, {"minute": "Int16", "player_id": "UInt32", "absent": "Int8"})
+
+        assert str(result["minute"].dtype) == "Int16"
+        assert str(result["player_id"].dtype) == "UInt32"
+        assert result["minute"].isna().tolist() == [False, True, False]
+        assert str(df["minute"].dtype) == "float64"
+
+    def test_downcast_columns_leaves_unfit_columns(self):
+        """Test that fractional, out-of-range and text columns are untouched."""
+        df = pd.DataFrame({"minute": [1.5, 2.0], "sort_order": [1, 300], "info": ["a", "b"]})
+
+        result = downcast_columns(df, {"minute": "Int16", "sort_order": "Int8", "info": "Int8"})
+
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_arrow_string_columns(self):
+        """Test that text columns become Arrow-backed and mixed columns are untouched."""
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"result": ["1-0", None], "info": pd.Series([1, "x"], dtype=object)})
+
+        result = arrow_string_columns(df, ["result", "info", "absent"])
+
+        assert isinstance(result["result"].dtype, pd.ArrowDtype)
+        assert result["result"].isna().tolist() == [False, True]
+        assert result["info"].dtype == object
+
+
+class TestFrameCache:
+    """Tests for the on-disk parse cache."""
+
+    class CountingParser:
+        """Minimal parser exposing the attributes cached_frame relies on."""
+
+        def __init__(self, data_dir, cache_parsed=True):
+            self.data_dir = data_dir
+            self.cache_parsed = cache_parsed
+            self.logger = logging.getLogger("test_frame_cache")
+            self.calls = 0
+
+        @cached_frame("events")
+        def parse_events(self, fixture_id, season=None):
+            self.calls += 1
+            return pd.DataFrame(load_json(self.data_dir / str(fixture_id) / "events.json"))
+
+    def test_reuses_sidecar_until_source_changes(self, tmp_path):
+        """Test that unchanged files hit the cache and edited files are re-parsed."""
+        save_json([{"minute": 1}, {"minute": 2}], tmp_path / "123" / "events.json")
+        parser = self.CountingParser(tmp_path)
+
+        first = parser.parse_events(123)
+        second = parser.parse_events(123)
+
+        assert parser.calls == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert len(list((tmp_path / "123").glob("events.*.frame.pkl"))) == 1
+
+        save_json([{"minute": 3}], tmp_path / "123" / "events.json")
+
+        assert list(parser.parse_events(123)["minute"]) == [3]
+        assert parser.calls == 2
+        assert len(list((tmp_path / "123").glob("events.*.frame.pkl"))) == 1
+
+    def test_sidecars_for_other_arguments_are_kept(self, tmp_path):
+        """Test that calls with different arguments don't evict each other's sidecar."""
+        save_json([{"minute": 1}], tmp_path / "123" / "events.json")
+        parser = self.CountingParser(tmp_path)
+
+        parser.parse_events(123)
+        parser.parse_events(123, season="2024-25")
+        parser.parse_events(123)
+        parser.parse_events(123, season="2024-25")
+
+        assert parser.calls == 2
+        assert len(list((tmp_path / "123").glob("events.*.frame.pkl"))) == 2
+
+    def test_code_change_invalidates_sidecar(self, tmp_path, monkeypatch):
+        """Test that a changed parser fingerprint re-parses instead of loading the sidecar."""
+        save_json([{"minute": 1}], tmp_path / "123" / "events.json")
+        parser = self.CountingParser(tmp_path)
+        parser.parse_events(123)
+
+        monkeypatch.setattr(frame_cache, "_code_fingerprint", lambda module_name: "edited")
+        parser.parse_events(123)
+
+        assert parser.calls == 2
+        assert len(list((tmp_path / "123").glob("events.*.frame.pkl"))) == 1
+
+    def test_disabled_cache_writes_nothing(self, tmp_path):
+        """Test that cache_parsed=False always parses and leaves no sidecar."""
+        save_json([{"minute": 1}], tmp_path / "123" / "events.json")
+        parser = self.CountingParser(tmp_path, cache_parsed=False)
+
+        parser.parse_events(123)
+        parser.parse_events(123)
+
+        assert parser.calls == 2
+        assert not list((tmp_path / "123").glob("*.pkl"))
+
+
+class TestFixturePool:
+    """Tests for multi-fixture parsing."""
+
+    def test_map_fixtures_single_worker_runs_inline(self, tmp_path):
+        """Test that a single worker parses in-process, in fixture order."""
+        calls = []
+
+        def parse(fixture_id, data_dir):
+            calls.append((fixture_id, data_dir))
+            return pd.DataFrame({"fixture_id": [fixture_id]})
+
+        frames = map_fixtures(parse, [3, 1, 2], str(tmp_path), max_workers=1)
+
+        assert [df["fixture_id"].iloc[0] for df in frames] == [3, 1, 2]
+        assert calls == [(3, str(tmp_path)), (1, str(tmp_path)), (2, str(tmp_path))]
+
+
 class TestLogging:
     """Tests for logging utilities."""
 